@@ -0,0 +1,64 @@
+"""
+Process-wide shared instances.
+
+Detectors hold no per-caller state, and building them can be expensive
+(Presidio loads spaCy models, Flair loads its taggers), so engines and
+ensembles in the same process share one detector per configuration.
+"""
+
+from typing import Any, Callable, Dict
+import threading
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_INSTANCE_CACHE: Dict[Any, Any] = {}
+_INSTANCE_CACHE_LOCK = threading.Lock()
+
+
+def get_shared(key: Any, factory: Callable[[], Any]) -> Any:
+    """
+    Return the cached instance for key, creating it on first use.
+
+    Args:
+        key: Cache key
+        factory: Builds the instance when it is not cached yet
+
+    Returns:
+        Shared instance
+    """
+    instance = _INSTANCE_CACHE.get(key)
+    if instance is None:
+        with _INSTANCE_CACHE_LOCK:
+            instance = _INSTANCE_CACHE.get(key)
+            if instance is None:
+                instance = _INSTANCE_CACHE[key] = factory()
+    return instance
+
+
+def build_detector(use_flair: bool):
+    """Create the PII detector, falling back to the basic one if Flair fails."""
+    if use_flair:
+        try:
+            from .flair_detector import FlairPIIDetector
+            detector = FlairPIIDetector()
+            logger.info("Using Flair detector (ultra-accurate)")
+            return detector
+        except Exception as e:
+            logger.warning(
+                "Flair detector initialization failed, falling back to basic detector",
+                extra={"extra_fields": {"error": str(e)}}
+            )
+            from .pii_detector import PIIDetector
+            return PIIDetector()
+
+    from .pii_detector import PIIDetector
+    detector = PIIDetector()
+    logger.info("Using basic PII detector")
+    return detector
+
+
+def shared_detector(use_flair: bool):
+    """The process-wide detector for use_flair, as used by AnonymaEngine."""
+    return get_shared(("detector", use_flair), lambda: build_detector(use_flair))
@@ -10,7 +10,9 @@ not just standard PII. Examples:
 - Any regex-matchable pattern
 """
 
+import logging
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
@@ -20,6 +22,27 @@ from ..exceptions import ValidationError
 
 logger = get_logger(__name__)
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Prefiltering only pays off once several patterns would each scan the text
+HYPERSCAN_MIN_PATTERNS = 2
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int) -> "re.Pattern":
+    """
+    Compile a custom pattern once per process.
+
+    re keeps its own cache, but it is shared with every other module and
+    evicts under load; detectors re-registering the same patterns keep
+    theirs here.
+    """
+    return re.compile(pattern, flags)
+
 
 @dataclass
 class CustomPattern:
@@ -51,7 +74,7 @@ class CustomPattern:
             raise ValidationError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
 
         try:
-            self._compiled = re.compile(self.pattern, self.flags)
+            self._compiled = _compile(self.pattern, self.flags)
             logger.debug(f"Custom pattern compiled: {self.name}")
         except re.error as e:
             raise ValidationError(f"Invalid regex pattern '{self.pattern}': {e}")
@@ -80,6 +103,100 @@ class CustomPattern:
             return False
 
 
+def _hyperscan_flags(flags: int) -> Optional[int]:
+    """
+    Translate re flags into hyperscan prefilter flags.
+
+    Args:
+        flags: re flags of a custom pattern
+
+    Returns:
+        hyperscan flags, or None when a flag has no hyperscan equivalent
+    """
+    hs_flags = (
+        hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    for re_flag, hs_flag in (
+        (re.IGNORECASE, hyperscan.HS_FLAG_CASELESS),
+        (re.DOTALL, hyperscan.HS_FLAG_DOTALL),
+        (re.MULTILINE, hyperscan.HS_FLAG_MULTILINE),
+    ):
+        if flags & re_flag:
+            hs_flags |= hs_flag
+            flags &= ~re_flag
+
+    # re.UNICODE is the default for str patterns, which UCP mirrors
+    flags &= ~re.UNICODE
+    return None if flags else hs_flags
+
+
+class _HyperscanPrefilter:
+    """
+    Single-pass check of which custom patterns can match a text.
+
+    Patterns are compiled in hyperscan's prefilter mode, which may report
+    matches re would reject but never misses one, so skipping the patterns
+    it does not report cannot lose detections. Detections themselves still
+    come from re, keeping match boundaries identical with or without
+    hyperscan. Patterns hyperscan cannot compile are always run.
+    """
+
+    def __init__(self, patterns: List[CustomPattern]):
+        self.always_run = set()
+        expressions, ids, flags = [], [], []
+
+        for idx, pattern in enumerate(patterns):
+            hs_flags = _hyperscan_flags(pattern.flags)
+            expression = pattern.pattern.encode("utf-8")
+            if hs_flags is not None:
+                try:
+                    # Compile alone first: one unsupported pattern would
+                    # otherwise fail the whole database
+                    hyperscan.Database().compile(
+                        expressions=[expression], ids=[idx], elements=1, flags=[hs_flags]
+                    )
+                except hyperscan.error:
+                    hs_flags = None
+
+            if hs_flags is None:
+                self.always_run.add(pattern.name)
+            else:
+                expressions.append(expression)
+                ids.append(idx)
+                flags.append(hs_flags)
+
+        self._names = [pattern.name for pattern in patterns]
+        self._db = None
+        if expressions:
+            self._db = hyperscan.Database()
+            self._db.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=flags)
+
+    def candidates(self, text: str) -> Optional[set]:
+        """
+        Names of the patterns worth running on text.
+
+        Returns:
+            Pattern names, or None when the text cannot be scanned
+            (e.g. lone surrogates are not valid UTF-8) and every pattern
+            must run
+        """
+        try:
+            data = text.encode("utf-8")
+        except UnicodeEncodeError:
+            return None
+
+        names = set(self.always_run)
+        if self._db is not None:
+            def on_match(pattern_id, start, end, flags, context):
+                names.add(self._names[pattern_id])
+
+            self._db.scan(data, match_event_handler=on_match)
+        return names
+
+
 class CustomPatternDetector(BaseDetector):
     """
     Detector for user-defined custom patterns.
@@ -119,6 +236,8 @@ class CustomPatternDetector(BaseDetector):
         """
         super().__init__()
         self._patterns: Dict[str, CustomPattern] = {}
+        self._prefilter: Optional[_HyperscanPrefilter] = None
+        self._compiled = False  # Reset by pattern changes, see compile()
 
         if patterns:
             for pattern in patterns:
@@ -174,6 +293,8 @@ class CustomPatternDetector(BaseDetector):
             logger.warning(f"Overwriting existing pattern: {pattern.name}")
 
         self._patterns[pattern.name] = pattern
+        self._prefilter = None
+        self._compiled = False
         logger.info(
             f"Added custom pattern: {pattern.name}",
             extra={"extra_fields": {"pattern": pattern.pattern, "confidence": pattern.confidence}},
@@ -191,6 +312,8 @@ class CustomPatternDetector(BaseDetector):
         """
         if name in self._patterns:
             del self._patterns[name]
+            self._prefilter = None
+            self._compiled = False
             logger.info(f"Removed custom pattern: {name}")
             return True
 
@@ -238,41 +361,48 @@ class CustomPatternDetector(BaseDetector):
         )
 
         detections = []
+        debug = logger.isEnabledFor(logging.DEBUG)
+        candidates = self._candidate_patterns(text)
 
         for pattern_name, custom_pattern in self._patterns.items():
-            matches = custom_pattern.match(text)
+            if candidates is not None and pattern_name not in candidates:
+                continue
+
+            confidence = custom_pattern.confidence
+            validate = custom_pattern.validate
 
-            for match in matches:
+            for match in custom_pattern._compiled.finditer(text):
                 match_text = match.group()
 
                 # Validate match if validator provided
-                if not custom_pattern.is_valid_match(match_text):
-                    logger.debug(
-                        f"Match failed validation: {match_text}",
-                        extra={"extra_fields": {"pattern": pattern_name}},
-                    )
+                if validate is not None and not custom_pattern.is_valid_match(match_text):
+                    if debug:
+                        logger.debug(
+                            f"Match failed validation: {match_text}",
+                            extra={"extra_fields": {"pattern": pattern_name}},
+                        )
                     continue
 
-                detection = {
+                start, end = match.span()
+                detections.append({
                     "entity_type": pattern_name,
-                    "start": match.start(),
-                    "end": match.end(),
-                    "confidence": custom_pattern.confidence,
+                    "start": start,
+                    "end": end,
+                    "confidence": confidence,
                     "text": match_text,
-                }
+                })
 
-                detections.append(detection)
-
-                logger.debug(
-                    f"Detected {pattern_name}: '{match_text}'",
-                    extra={
-                        "extra_fields": {
-                            "pattern": pattern_name,
-                            "start": match.start(),
-                            "end": match.end(),
-                        }
-                    },
-                )
+                if debug:
+                    logger.debug(
+                        f"Detected {pattern_name}: '{match_text}'",
+                        extra={
+                            "extra_fields": {
+                                "pattern": pattern_name,
+                                "start": start,
+                                "end": end,
+                            }
+                        },
+                    )
 
         logger.info(
             f"Custom pattern detection completed",
@@ -281,6 +411,49 @@ class CustomPatternDetector(BaseDetector):
 
         return detections
 
+    def _candidate_patterns(self, text: str) -> Optional[set]:
+        """
+        Names of the patterns that can match text, found in one hyperscan pass.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Pattern names to run, or None to run every pattern (hyperscan
+            not installed, too few patterns, or the text cannot be scanned)
+        """
+        if not self._compiled:
+            self.compile()
+        if self._prefilter is None:
+            return None
+
+        return self._prefilter.candidates(text)
+
+    def compile(self) -> bool:
+        """
+        Build the multi-pattern hyperscan database for the current patterns.
+
+        Called by detect() after patterns change; call it after the last
+        add_pattern() to pay the compilation cost up front instead of on
+        the first detection.
+
+        Returns:
+            True if detections will use the one-pass prefilter, False if
+            every pattern is scanned on its own
+        """
+        self._compiled = True
+        self._prefilter = None
+        if not HYPERSCAN_AVAILABLE or len(self._patterns) < HYPERSCAN_MIN_PATTERNS:
+            return False
+
+        try:
+            self._prefilter = _HyperscanPrefilter(list(self._patterns.values()))
+        except hyperscan.error as e:
+            logger.warning(f"Hyperscan prefilter unavailable: {e}")
+            return False
+
+        return True
+
     @property
     def name(self) -> str:
         return "CustomPatternDetector"
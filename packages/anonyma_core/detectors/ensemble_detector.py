@@ -11,18 +11,29 @@ With intelligent confidence voting and entity resolution.
 """
 
 from typing import List, Dict, Any, Optional, Tuple
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
+from operator import attrgetter
 import re
+import threading
 
+from ._shared import shared_detector
 from .base import BaseDetector
-from .pii_detector import PIIDetector
 from .flair_detector import FlairDetector
 from .custom_detector import CustomPatternDetector
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Texts whose detector votes are kept when vote caching is enabled
+VOTE_CACHE_SIZE = 32
+
+_VOTE_SPAN = attrgetter("start", "end")
+_VOTE_START = attrgetter("start")
+_VOTE_END = attrgetter("end")
+
 
 @dataclass
 class DetectionVote:
@@ -73,6 +84,8 @@ class EnsembleDetector(BaseDetector):
         voting_strategy: str = "weighted",
         min_confidence: float = 0.5,
         min_votes: int = 1,
+        cache_votes: bool = False,
+        parallel: bool = False,
     ):
         """
         Initialize ensemble detector.
@@ -85,6 +98,12 @@ class EnsembleDetector(BaseDetector):
             voting_strategy: Voting strategy (unanimous/majority/any/weighted)
             min_confidence: Minimum confidence threshold
             min_votes: Minimum number of detector votes required
+            cache_votes: Keep the raw votes of recent texts, so re-running a
+                text (e.g. under another voting strategy or weights) skips
+                the underlying detectors
+            parallel: Run the detectors concurrently on a thread pool kept by
+                this detector; votes keep the detector order either way. Only
+                pays off for long texts with several model-based detectors
         """
         super().__init__()
         self.name = "EnsembleDetector"
@@ -95,7 +114,8 @@ class EnsembleDetector(BaseDetector):
 
         if use_presidio:
             try:
-                self.detectors.append(PIIDetector())
+                # The engine's basic detector: spaCy models load once per process
+                self.detectors.append(shared_detector(use_flair=False))
                 self.detector_weights["PIIDetector"] = 1.0
                 logger.info("Presidio detector initialized")
             except Exception as e:
@@ -120,6 +140,13 @@ class EnsembleDetector(BaseDetector):
         self.voting_strategy = voting_strategy
         self.min_confidence = min_confidence
         self.min_votes = min_votes
+        self.parallel = parallel
+        self._executor: Optional[ThreadPoolExecutor] = None  # Created on first parallel run
+        self._executor_lock = threading.Lock()
+        self._vote_cache: Optional["OrderedDict[str, List[DetectionVote]]"] = (
+            OrderedDict() if cache_votes else None
+        )
+        self._vote_cache_lock = threading.Lock()
 
         logger.info(
             f"Ensemble detector initialized",
@@ -144,28 +171,7 @@ class EnsembleDetector(BaseDetector):
         """
         logger.debug(f"Running ensemble detection on text ({len(text)} chars)")
 
-        # Collect votes from all detectors
-        all_votes: List[DetectionVote] = []
-
-        for detector in self.detectors:
-            try:
-                detections = detector.detect(text)
-
-                for detection in detections:
-                    vote = DetectionVote(
-                        detector_name=detector.name,
-                        text=detection["text"],
-                        entity_type=detection["entity_type"],
-                        start=detection["start"],
-                        end=detection["end"],
-                        confidence=detection.get("confidence", 0.9)
-                    )
-                    all_votes.append(vote)
-
-            except Exception as e:
-                logger.error(f"Detector {detector.name} failed: {e}", exc_info=True)
-
-        logger.debug(f"Collected {len(all_votes)} votes from {len(self.detectors)} detectors")
+        all_votes = self._collect_votes(text)
 
         # Resolve overlapping detections and vote
         ensemble_results = self._resolve_and_vote(all_votes)
@@ -195,6 +201,100 @@ class EnsembleDetector(BaseDetector):
 
         return final_detections
 
+    def _collect_votes(self, text: str) -> List[DetectionVote]:
+        """
+        Run every detector on text and turn their detections into votes.
+
+        Votes do not depend on the voting strategy, weights or thresholds,
+        so with vote caching they are reused for repeated texts.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Votes from all detectors (shared with the cache; do not modify)
+        """
+        if self._vote_cache is not None:
+            with self._vote_cache_lock:
+                votes = self._vote_cache.get(text)
+                if votes is not None:
+                    self._vote_cache.move_to_end(text)
+                    return votes
+
+        votes: List[DetectionVote] = []
+        complete = True
+
+        # Detectors are independent; Presidio's spaCy and Flair's torch
+        # release the GIL, so running them on threads overlaps their work
+        if self.parallel and len(self.detectors) > 1:
+            executor = self._get_executor()
+            outputs = list(executor.map(self._run_detector, self.detectors, repeat(text)))
+        else:
+            outputs = [self._run_detector(detector, text) for detector in self.detectors]
+
+        for detector, detections in zip(self.detectors, outputs):
+            if detections is None:
+                complete = False
+                continue
+
+            try:
+                for detection in detections:
+                    vote = DetectionVote(
+                        detector_name=detector.name,
+                        text=detection["text"],
+                        entity_type=detection["entity_type"],
+                        start=detection["start"],
+                        end=detection["end"],
+                        confidence=detection.get("confidence", 0.9)
+                    )
+                    votes.append(vote)
+
+            except Exception as e:
+                logger.error(f"Detector {detector.name} failed: {e}", exc_info=True)
+                complete = False
+
+        logger.debug(f"Collected {len(votes)} votes from {len(self.detectors)} detectors")
+
+        # Votes missing a failed detector are not worth remembering
+        if self._vote_cache is not None and complete:
+            with self._vote_cache_lock:
+                self._vote_cache[text] = votes
+                if len(self._vote_cache) > VOTE_CACHE_SIZE:
+                    self._vote_cache.popitem(last=False)
+
+        return votes
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """The thread pool for parallel detection, created on first use"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=len(self.detectors), thread_name_prefix="anonyma-ensemble"
+                    )
+        return self._executor
+
+    def close(self):
+        """Shut down the parallel detection thread pool, if one was started"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run_detector(self, detector: BaseDetector, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Run one detector, logging failures; None if it raised"""
+        try:
+            return detector.detect(text)
+        except Exception as e:
+            logger.error(f"Detector {detector.name} failed: {e}", exc_info=True)
+            return None
+
+    def clear_vote_cache(self):
+        """Drop cached votes, e.g. after changing a detector's patterns"""
+        if self._vote_cache is not None:
+            with self._vote_cache_lock:
+                self._vote_cache.clear()
+
     def _resolve_and_vote(self, votes: List[DetectionVote]) -> List[EnsembleResult]:
         """
         Resolve overlapping detections and aggregate votes.
@@ -234,29 +334,29 @@ class EnsembleDetector(BaseDetector):
             return []
 
         # Sort by start position
-        sorted_votes = sorted(votes, key=lambda v: (v.start, v.end))
+        sorted_votes = sorted(votes, key=_VOTE_SPAN)
 
         groups = []
         current_group = [sorted_votes[0]]
+        # Extent of the current group, kept up to date as votes join it
+        group_start = sorted_votes[0].start
+        group_end = sorted_votes[0].end
 
         for vote in sorted_votes[1:]:
             # Check if overlaps with current group
-            group_start = min(v.start for v in current_group)
-            group_end = max(v.end for v in current_group)
-
-            if self._spans_overlap(vote.start, vote.end, group_start, group_end):
+            if not (vote.end <= group_start or group_end <= vote.start):
                 current_group.append(vote)
+                if vote.end > group_end:
+                    group_end = vote.end
             else:
                 groups.append(current_group)
                 current_group = [vote]
+                group_start = vote.start
+                group_end = vote.end
 
         groups.append(current_group)
         return groups
 
-    def _spans_overlap(self, start1: int, end1: int, start2: int, end2: int) -> bool:
-        """Check if two spans overlap"""
-        return not (end1 <= start2 or end2 <= start1)
-
     def _aggregate_votes(self, votes: List[DetectionVote]) -> Optional[EnsembleResult]:
         """
         Aggregate votes for overlapping detections.
@@ -271,13 +371,20 @@ class EnsembleDetector(BaseDetector):
             return None
 
         # Count votes by entity type
-        entity_votes = defaultdict(list)
-        for vote in votes:
-            entity_votes[vote.entity_type].append(vote)
+        if len(votes) == 1:
+            consensus_votes = votes
+        else:
+            entity_votes: Dict[str, List[DetectionVote]] = {}
+            for vote in votes:
+                group = entity_votes.get(vote.entity_type)
+                if group is None:
+                    entity_votes[vote.entity_type] = [vote]
+                else:
+                    group.append(vote)
 
-        # Find consensus entity type (most votes)
-        consensus_type = max(entity_votes.keys(), key=lambda k: len(entity_votes[k]))
-        consensus_votes = entity_votes[consensus_type]
+            # Find consensus entity type (most votes, first seen on ties)
+            consensus_votes = max(entity_votes.values(), key=len)
+        consensus_type = consensus_votes[0].entity_type
 
         # Check minimum votes
         if len(consensus_votes) < self.min_votes:
@@ -295,8 +402,8 @@ class EnsembleDetector(BaseDetector):
             return None
 
         # Determine text span (use the longest span from votes)
-        start = min(v.start for v in consensus_votes)
-        end = max(v.end for v in consensus_votes)
+        start = min(map(_VOTE_START, consensus_votes))
+        end = max(map(_VOTE_END, consensus_votes))
         text = consensus_votes[0].text  # Use first vote's text as representative
 
         return EnsembleResult(
@@ -84,63 +84,83 @@ class FlairPIIDetector:
     
     def detect(self, text: str, language: str = 'it') -> List[Dict[str, Any]]:
         """Detection PII con Flair + pattern specifici"""
-        
-        all_detections = []
-        
+        return self.detect_batch([text], language)[0]
+
+    def detect_batch(
+        self, texts: List[str], language: str = 'it', mini_batch_size: int = 32
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Detection PII su più testi, con una predict() per modello.
+
+        Each model tags all the sentences in padded mini-batches instead of
+        one forward pass per text.
+
+        Args:
+            texts: Texts to analyze
+            language: Language code
+            mini_batch_size: Sentences per forward pass
+
+        Returns:
+            Detections per input text, in input order
+        """
+        results = []
+
         # 1. Detection con Flair NER
-        flair_detections = self._detect_with_flair(text)
-        all_detections.extend(flair_detections)
-        
-        # 2. Detection con pattern specifici
-        pattern_detections = self._detect_with_patterns(text)
-        all_detections.extend(pattern_detections)
-        
-        # 3. Post-processing e filtering
-        filtered_detections = self._post_process(all_detections, text)
-        
-        self.logger.info(f"🔍 Found {len(filtered_detections)} high-confidence detections")
-        
-        return filtered_detections
-    
-    def _detect_with_flair(self, text: str) -> List[Dict[str, Any]]:
+        for text, flair_detections in zip(texts, self._detect_with_flair(texts, mini_batch_size)):
+            all_detections = flair_detections
+
+            # 2. Detection con pattern specifici
+            all_detections.extend(self._detect_with_patterns(text))
+
+            # 3. Post-processing e filtering
+            results.append(self._post_process(all_detections, text))
+
+        self.logger.info(f"🔍 Found {sum(map(len, results))} high-confidence detections")
+
+        return results
+
+    def _detect_with_flair(self, texts: List[str], mini_batch_size: int = 32) -> List[List[Dict[str, Any]]]:
         """Detection con modelli Flair"""
-        all_detections = []
-        
+        all_detections = [[] for _ in texts]
+
         # Crea sentence Flair
-        sentence = Sentence(text)
-        
+        sentences = [Sentence(text) for text in texts]
+        if not sentences:
+            return all_detections
+
         for model_name, model in self.models.items():
             try:
                 # Predict entities
-                model.predict(sentence)
-                
-                for entity in sentence.get_spans('ner'):
-                    label = entity.get_label("ner").value
-                    confidence = entity.get_label("ner").score
-                    
-                    # Mappa etichetta ai nostri tipi
-                    entity_type = self.label_mapping.get(label, label)
-                    
-                    # Filtra entità di bassa qualità
-                    if self._is_valid_entity(entity.text, entity_type, confidence):
-                        all_detections.append({
-                            'entity_type': entity_type,
-                            'start': entity.start_position,
-                            'end': entity.end_position,
-                            'confidence': confidence,
-                            'text': entity.text,
-                            'source': f'flair_{model_name}',
-                            'original_label': label
-                        })
-                
-                # Clear predictions per evitare interferenze
-                sentence.clear_embeddings()
-                
+                model.predict(sentences, mini_batch_size=mini_batch_size)
+
+                for sentence, detections in zip(sentences, all_detections):
+                    for entity in sentence.get_spans('ner'):
+                        label = entity.get_label("ner").value
+                        confidence = entity.get_label("ner").score
+
+                        # Mappa etichetta ai nostri tipi
+                        entity_type = self.label_mapping.get(label, label)
+
+                        # Filtra entità di bassa qualità
+                        if self._is_valid_entity(entity.text, entity_type, confidence):
+                            detections.append({
+                                'entity_type': entity_type,
+                                'start': entity.start_position,
+                                'end': entity.end_position,
+                                'confidence': confidence,
+                                'text': entity.text,
+                                'source': f'flair_{model_name}',
+                                'original_label': label
+                            })
+
+                    # Clear predictions per evitare interferenze
+                    sentence.clear_embeddings()
+
             except Exception as e:
                 self.logger.error(f"❌ Flair model {model_name} failed: {e}")
-        
+
         return all_detections
-    
+
     def _detect_with_patterns(self, text: str) -> List[Dict[str, Any]]:
         """Detection con pattern specifici"""
         detections = []
@@ -7,7 +7,7 @@ ensuring consistency across different document formats.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -171,6 +171,31 @@ class BaseDocument(ABC):
         """
         pass
 
+    def rebuild_to(
+        self,
+        out: BinaryIO,
+        anonymized_text: str,
+        detections: List[Dict[str, Any]],
+        mode: str = "redact",
+    ):
+        """
+        Rebuild document with anonymized content straight into a file object.
+
+        The default writes the bytes returned by rebuild(); handlers whose
+        libraries can serialize to a stream override this to skip the
+        intermediate in-memory copy.
+
+        Args:
+            out: Writable binary file object
+            anonymized_text: Anonymized version of text
+            detections: List of PII detections used for anonymization
+            mode: Anonymization mode used
+
+        Raises:
+            DocumentProcessingError: If rebuilding fails
+        """
+        out.write(self.rebuild(anonymized_text, detections, mode=mode))
+
     @abstractmethod
     def _detect_format(self) -> DocumentFormat:
         """
@@ -247,6 +272,20 @@ class BaseDocument(ABC):
         """
         return self.format
 
+    def close(self):
+        """
+        Release resources held by the document handler.
+
+        Subclasses holding open files or parsers should override this.
+        """
+        pass
+
+    def __enter__(self) -> "BaseDocument":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}("
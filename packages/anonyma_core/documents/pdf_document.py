@@ -6,9 +6,17 @@ Handles both digital PDFs (with selectable text) and scanned PDFs
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import bisect
 from datetime import datetime
 import io
+import multiprocessing
+import os
+import subprocess
+import tempfile
+import threading
 
 from .base import BaseDocument, DocumentFormat, DocumentMetadata
 from ..logging_config import get_logger
@@ -16,6 +24,419 @@ from ..exceptions import DocumentProcessingError
 
 logger = get_logger(__name__)
 
+# Optional accelerators and backends, imported once per process
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    fuzz = process = None
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    try:
+        import fitz as pymupdf  # Legacy module name
+        PYMUPDF_AVAILABLE = True
+    except ImportError:
+        pymupdf = None
+        PYMUPDF_AVAILABLE = False
+
+try:
+    import pikepdf
+    PIKEPDF_AVAILABLE = True
+except ImportError:
+    pikepdf = None
+    PIKEPDF_AVAILABLE = False
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+
+# Tesseract page separator emitted after each page of text output
+OCR_PAGE_SEPARATOR = "\x0c"
+
+# Above this many pages, OCR runs as a single Tesseract invocation over a
+# list file so the process startup and language data load happen only once
+OCR_BATCH_MIN_PAGES = 4
+
+# Number of pages rasterized and held in memory at once during OCR
+OCR_CHUNK_PAGES = 10
+
+# Minimum page count before digital text extraction uses a process pool
+PARALLEL_EXTRACT_MIN_PAGES = 8
+
+# Minimum rapidfuzz partial_ratio score for single-word fallback matches
+FUZZY_MATCH_CUTOFF = 90
+
+# Tesseract languages used for OCR (Italian and English)
+OCR_LANG = "ita+eng"
+
+# Rasterization resolution for OCR (Tesseract is tuned for ~300 DPI)
+OCR_DPI = 300
+
+
+def _iter_pages_text(pages: Iterable[Any]) -> Iterator[Optional[str]]:
+    """
+    Extract text from pdfplumber pages one at a time, releasing each page's caches.
+
+    Args:
+        pages: pdfplumber pages
+
+    Yields:
+        Text of each page (None for pages that failed)
+    """
+    for page in pages:
+        try:
+            page_text = page.extract_text()
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page.page_number}: {e}")
+            page_text = None
+        finally:
+            # Drop cached chars/objects/layout so only one page is resident
+            page.close()
+
+        if page_text:
+            logger.debug(
+                f"Extracted text from page {page.page_number}",
+                extra={
+                    "extra_fields": {"page": page.page_number, "text_length": len(page_text)}
+                },
+            )
+
+        yield page_text
+
+
+def _can_start_process_pool() -> bool:
+    """
+    Whether this caller may start its own process pool.
+
+    Only the main thread of a process that is not itself a pool worker does:
+    forking from a threaded caller (e.g. the batch pipeline's extractor
+    thread) can deadlock, and pools inside process_batch workers would
+    oversubscribe the CPUs.
+    """
+    return (
+        threading.current_thread() is threading.main_thread()
+        and multiprocessing.parent_process() is None
+    )
+
+
+def _extract_page_range_text(file_path: str, first_page: int, last_page: int) -> List[Optional[str]]:
+    """
+    Process pool worker: extract text from pages [first_page, last_page).
+
+    pdfplumber objects are not picklable, so each worker opens its own handle.
+    """
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return list(_iter_pages_text(pdf.pages[first_page:last_page]))
+
+
+def _detection_phrases(detections: List[Dict[str, Any]]) -> List[Tuple[str, List[str]]]:
+    """
+    Normalize detections into (text, words) pairs for coordinate lookup.
+
+    Args:
+        detections: List of detections with a 'text' field
+
+    Returns:
+        List of (stripped text, split words) pairs, skipping empty detections
+    """
+    phrases = []
+    for detection in detections:
+        text = detection.get('text', '').strip()
+        if text:
+            phrases.append((text, text.split()))
+    return phrases
+
+
+def _find_phrase_starts(
+    words: List[str], phrases: List[Tuple[str, List[str]]]
+) -> Dict[int, int]:
+    """
+    Find the first word index where each phrase occurs as a word sequence.
+
+    Uses a single Aho-Corasick sweep over the page when pyahocorasick is
+    installed, otherwise an index of word positions by text.
+
+    Args:
+        words: Stripped page words in reading order
+        phrases: Detection phrases as (text, words) pairs
+
+    Returns:
+        Mapping of phrase index to the index of its first matching word
+    """
+    starts: Dict[int, int] = {}
+
+    if not AHOCORASICK_AVAILABLE:
+        # Index word positions by text so each phrase only visits the
+        # places where its first word actually occurs
+        word_index: Dict[str, List[int]] = defaultdict(list)
+        for i, word_text in enumerate(words):
+            word_index[word_text].append(i)
+
+        for phrase_idx, (_, phrase_words) in enumerate(phrases):
+            phrase_len = len(phrase_words)
+            for i in word_index.get(phrase_words[0], ()):
+                if words[i:i + phrase_len] == phrase_words:
+                    starts[phrase_idx] = i
+                    break
+
+        return starts
+
+    # Words are joined with a NUL separator on both sides so automaton
+    # matches always fall on word boundaries
+    phrases_by_key: Dict[str, List[int]] = defaultdict(list)
+    for phrase_idx, (_, phrase_words) in enumerate(phrases):
+        phrases_by_key["\x00" + "\x00".join(phrase_words) + "\x00"].append(phrase_idx)
+
+    if not phrases_by_key:
+        return starts
+
+    automaton = ahocorasick.Automaton()
+    for key, phrase_idxs in phrases_by_key.items():
+        automaton.add_word(key, (phrase_idxs, len(key)))
+    automaton.make_automaton()
+
+    # Character offset of the separator preceding each word
+    word_offsets = []
+    offset = 0
+    for word_text in words:
+        word_offsets.append(offset)
+        offset += len(word_text) + 1
+    haystack = "\x00" + "\x00".join(words) + "\x00"
+
+    for end, (phrase_idxs, key_len) in automaton.iter(haystack):
+        if phrase_idxs[0] not in starts:
+            start = bisect.bisect_left(word_offsets, end - key_len + 1)
+            for phrase_idx in phrase_idxs:
+                starts[phrase_idx] = start
+
+    return starts
+
+
+def _find_word_containing(text: str, words: List[str]) -> Optional[int]:
+    """
+    Find the single word that contains the given text.
+
+    With rapidfuzz installed the match is fuzzy (partial ratio of at least
+    FUZZY_MATCH_CUTOFF), which tolerates OCR noise such as swapped
+    characters or trailing punctuation. Otherwise this is a plain substring
+    search.
+
+    Args:
+        text: Detection text to find
+        words: Stripped page words
+
+    Returns:
+        Index of the best matching word, or None
+    """
+    if not RAPIDFUZZ_AVAILABLE:
+        for i, word_text in enumerate(words):
+            if text in word_text:
+                return i
+        return None
+
+    # Only words at least as long as the text can contain it; partial_ratio
+    # would score a shorter word that is part of the text (e.g. "Ross" for
+    # "Rossi") at 100
+    candidates = {i: word_text for i, word_text in enumerate(words) if len(word_text) >= len(text)}
+
+    match = process.extractOne(
+        text, candidates, scorer=fuzz.partial_ratio, score_cutoff=FUZZY_MATCH_CUTOFF
+    )
+    return match[2] if match else None
+
+
+def _render_box_overlays(
+    pages: List[Tuple[float, float, List[Dict[str, Any]]]]
+) -> bytes:
+    """
+    Render one overlay PDF with black boxes, one page per redacted page.
+
+    A single canvas is used for all pages so the overlay is built and
+    parsed once per document rather than once per page.
+
+    Args:
+        pages: (width, height, page_detections) per overlay page, where each
+            detection has 'bbox' as (x, y, width, height)
+
+    Returns:
+        Overlay PDF bytes
+    """
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.colors import black
+
+    overlay_buffer = io.BytesIO()
+    c = canvas.Canvas(overlay_buffer)
+
+    for width, height, page_detections in pages:
+        c.setPageSize((width, height))
+
+        # Draw black rectangles over detected PII (showPage resets state)
+        c.setFillColor(black)
+        for detection in page_detections:
+            x, y, box_width, box_height = detection['bbox']
+            c.rect(x, y, box_width, box_height, fill=1, stroke=0)
+
+        c.showPage()
+
+    c.save()
+    return overlay_buffer.getvalue()
+
+
+def _run_tesseract(source: str, input_bytes: Optional[bytes] = None) -> str:
+    """
+    Run the Tesseract CLI and return its text output from stdout.
+
+    Output is piped back instead of going through pytesseract's temporary
+    output files.
+
+    Args:
+        source: Input image path, list file path, or "stdin"
+        input_bytes: Encoded image to pipe on stdin when source is "stdin"
+
+    Returns:
+        Recognized text
+
+    Raises:
+        DocumentProcessingError: If Tesseract exits with an error
+    """
+    import pytesseract
+
+    process = subprocess.Popen(
+        [pytesseract.pytesseract.tesseract_cmd, source, "stdout", "-l", OCR_LANG],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env={"OMP_THREAD_LIMIT": "1", **os.environ},
+    )
+    output, errors = process.communicate(input_bytes)
+
+    if process.returncode != 0:
+        raise DocumentProcessingError(
+            f"Tesseract failed: {errors.decode('utf-8', errors='replace').strip()}",
+            {"returncode": process.returncode},
+        )
+
+    return output.decode("utf-8")
+
+
+def _ocr_image(image: Any) -> str:
+    """
+    Run OCR on a single PIL image, piping it to Tesseract as PNG.
+
+    Args:
+        image: PIL image of a page
+
+    Returns:
+        Recognized text
+    """
+    buffer = io.BytesIO()
+    # Fast PNG encoding: Tesseract decodes it immediately, size is irrelevant
+    image.save(buffer, format="PNG", compress_level=1)
+    return _run_tesseract("stdin", buffer.getvalue())
+
+
+def _ocr_images_tesserocr(api: Any, images: List[Any], first_page_num: int) -> List[str]:
+    """
+    Run OCR on page images with an in-process tesserocr API.
+
+    Args:
+        api: Initialized tesserocr.PyTessBaseAPI
+        images: Page images (PIL) in page order
+        first_page_num: Page number (1-indexed) of the first image
+
+    Returns:
+        OCR text for each page
+    """
+    pages_text = []
+
+    for page_num, image in enumerate(images, start=first_page_num):
+        logger.debug(f"Running OCR on page {page_num}")
+
+        api.SetImage(image)
+        pages_text.append(api.GetUTF8Text())
+        # Free the page image but keep the model loaded
+        api.Clear()
+
+    return pages_text
+
+
+def _render_page_for_ocr(pdf: Any, page_idx: int, preprocess: bool) -> Any:
+    """
+    Rasterize a page in-process with PDFium for OCR.
+
+    Args:
+        pdf: Open pypdfium2 document
+        page_idx: Page index (0-indexed)
+        preprocess: Whether to binarize the rendered image
+
+    Returns:
+        Grayscale (or binarized) PIL image of the page
+    """
+    page = pdf[page_idx]
+    try:
+        image = page.render(scale=OCR_DPI / 72, grayscale=True).to_pil()
+    finally:
+        page.close()
+
+    return _preprocess_for_ocr(image) if preprocess else image
+
+
+def _preprocess_for_ocr(image: Any) -> Any:
+    """
+    Binarize a page image with adaptive thresholding before OCR.
+
+    Already-binary input lets Tesseract skip its own binarization pass,
+    which is faster and more robust on uneven scans.
+
+    Args:
+        image: PIL image of a page
+
+    Returns:
+        Binarized PIL image
+    """
+    import cv2
+    import numpy as np
+    from PIL import Image
+
+    pixels = np.array(image.convert("L"))
+    binary = cv2.adaptiveThreshold(
+        pixels, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+    )
+    return Image.fromarray(binary)
+
+
+def _split_ocr_pages(output: str, page_count: int) -> List[str]:
+    """
+    Split concatenated Tesseract output back into per-page strings.
+
+    Args:
+        output: Text output of a multi-image Tesseract run
+        page_count: Number of pages that were processed
+
+    Returns:
+        List with one text entry per page
+    """
+    pages = output.split(OCR_PAGE_SEPARATOR)[:page_count]
+    pages.extend([""] * (page_count - len(pages)))
+    return pages
+
 
 class PDFDocument(BaseDocument):
     """
@@ -29,6 +450,12 @@ class PDFDocument(BaseDocument):
     - Layout preservation (basic)
 
     Note: Requires pdfplumber, PyPDF2, and optionally pytesseract for OCR.
+
+    The underlying file stays open until close() is called; use the handler
+    as a context manager for deterministic cleanup:
+
+        >>> with PDFDocument(Path("document.pdf")) as doc:
+        ...     text = doc.extract_text()
     """
 
     def __init__(self, file_path: Path, enable_ocr: bool = True):
@@ -43,8 +470,14 @@ class PDFDocument(BaseDocument):
             DocumentProcessingError: If PDF can't be loaded
         """
         self.enable_ocr = enable_ocr
+        self._pdf = None
         self._pdf_reader = None
         self._pages_text = None
+        # page_num -> (words, stripped word texts, page height)
+        self._words_cache: Dict[int, Tuple[List[Dict[str, Any]], List[str], float]] = {}
+        # Offsets in the extracted text where each non-empty page starts
+        self._page_text_starts: List[int] = []
+        self._page_text_numbers: List[int] = []
 
         super().__init__(file_path)
 
@@ -93,7 +526,7 @@ class PDFDocument(BaseDocument):
         title = None
 
         try:
-            if hasattr(self, "_pdf") and self._pdf:
+            if self._pdf:
                 page_count = len(self._pdf.pages)
 
                 # Get PDF metadata
@@ -129,9 +562,16 @@ class PDFDocument(BaseDocument):
     def _parse_pdf_date(self, date_str: str) -> Optional[datetime]:
         """Parse PDF date string (format: D:YYYYMMDDHHmmSS)"""
         try:
-            if date_str.startswith("D:"):
-                date_str = date_str[2:16]  # Remove D: and take YYYYMMDDHHMMSS
-                return datetime.strptime(date_str, "%Y%m%d%H%M%S")
+            # Fixed layout, so slice fields directly instead of using strptime
+            if len(date_str) >= 16 and date_str.startswith("D:"):
+                return datetime(
+                    int(date_str[2:6]),
+                    int(date_str[6:8]),
+                    int(date_str[8:10]),
+                    int(date_str[10:12]),
+                    int(date_str[12:14]),
+                    int(date_str[14:16]),
+                )
         except Exception as e:
             logger.debug(f"Failed to parse PDF date: {e}")
         return None
@@ -144,7 +584,7 @@ class PDFDocument(BaseDocument):
             True if PDF appears to be scanned
         """
         try:
-            if not hasattr(self, "_pdf") or not self._pdf:
+            if not self._pdf:
                 return False
 
             # Check first page for text
@@ -190,27 +630,37 @@ class PDFDocument(BaseDocument):
                 {"file_path": str(self.file_path)},
             )
 
+    def iter_text(self) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate over the digital text layer page by page.
+
+        Unlike extract_text(), the full document text is never materialized,
+        which suits consumers that process text in chunks anyway. OCR is not
+        applied, so scanned pages yield empty strings.
+
+        Yields:
+            (page number (1-indexed), page text) tuples
+        """
+        for page_num, page_text in enumerate(_iter_pages_text(self._pdf.pages), start=1):
+            yield page_num, page_text or ""
+
     def _extract_text_direct(self) -> str:
         """Extract text directly from digital PDF"""
         logger.debug("Extracting text directly from PDF")
 
-        text_parts = []
+        page_count = len(self._pdf.pages)
 
-        for page_num, page in enumerate(self._pdf.pages, start=1):
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-                    logger.debug(
-                        f"Extracted text from page {page_num}",
-                        extra={
-                            "extra_fields": {"page": page_num, "text_length": len(page_text)}
-                        },
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to extract text from page {page_num}: {e}")
+        if (
+            page_count >= PARALLEL_EXTRACT_MIN_PAGES
+            and (os.cpu_count() or 1) > 1
+            and _can_start_process_pool()
+        ):
+            pages_text = self._extract_pages_parallel(page_count)
+        else:
+            # Stream pages straight into the joined text
+            pages_text = _iter_pages_text(self._pdf.pages)
 
-        full_text = "\n\n".join(text_parts)
+        full_text = self._join_pages_text(pages_text)
 
         logger.info(
             f"Text extraction completed",
@@ -224,54 +674,154 @@ class PDFDocument(BaseDocument):
 
         return full_text
 
+    def _join_pages_text(self, pages_text: Iterable[Optional[str]]) -> str:
+        """
+        Join page texts with blank lines, recording where each page starts.
+
+        The recorded offsets let visual redaction map a detection's 'start'
+        back to the page it was found on.
+
+        Args:
+            pages_text: Text of each page in page order (None/empty skipped)
+
+        Returns:
+            Full document text
+        """
+        buffer = io.StringIO()
+        self._page_text_starts = []
+        self._page_text_numbers = []
+        offset = 0
+
+        for page_idx, page_text in enumerate(pages_text):
+            if not page_text:
+                continue
+            if offset:
+                buffer.write("\n\n")
+                offset += 2
+            self._page_text_starts.append(offset)
+            self._page_text_numbers.append(page_idx)
+            buffer.write(page_text)
+            offset += len(page_text)
+
+        full_text = buffer.getvalue()
+        buffer.close()
+        return full_text
+
+    def _extract_pages_parallel(self, page_count: int) -> List[Optional[str]]:
+        """
+        Extract page text in contiguous page ranges across a process pool.
+
+        Args:
+            page_count: Number of pages in the document
+
+        Returns:
+            Text of each page in page order (None for failed pages)
+        """
+        workers = min(os.cpu_count() or 1, page_count)
+        chunk_size = -(-page_count // workers)
+        first_pages = list(range(0, page_count, chunk_size))
+        last_pages = [min(first + chunk_size, page_count) for first in first_pages]
+
+        logger.debug(
+            "Extracting text in parallel",
+            extra={"extra_fields": {"pages": page_count, "workers": len(first_pages)}},
+        )
+
+        try:
+            with ProcessPoolExecutor(max_workers=len(first_pages)) as executor:
+                results = executor.map(
+                    _extract_page_range_text,
+                    [str(self.file_path)] * len(first_pages),
+                    first_pages,
+                    last_pages,
+                )
+                return [text for range_text in results for text in range_text]
+        except Exception as e:
+            logger.warning(f"Parallel text extraction failed, falling back to sequential: {e}")
+            return list(_iter_pages_text(self._pdf.pages))
+
     def _extract_text_with_ocr(self) -> str:
         """
         Extract text using OCR for scanned PDFs.
 
-        Requires: pytesseract and pdf2image
+        Requires: pypdfium2 and pytesseract. When tesserocr is installed it is
+        used instead of pytesseract, keeping the Tesseract model loaded
+        in-process for all pages.
 
         Returns:
             Extracted text from OCR
         """
         try:
-            import pytesseract
-            from pdf2image import convert_from_path
+            import pypdfium2 as pdfium
+
+            if not TESSEROCR_AVAILABLE:
+                import pytesseract  # noqa: F401
         except ImportError as e:
             raise DocumentProcessingError(
                 f"OCR dependencies not installed: {e}. "
-                "Install with: pip install pytesseract pdf2image",
+                "Install with: pip install pytesseract pypdfium2",
                 {"missing_package": str(e)},
             )
 
-        logger.info("Performing OCR on PDF")
-
         try:
-            # Convert PDF pages to images
-            images = convert_from_path(self.file_path)
-
-            text_parts = []
+            import cv2  # noqa: F401
 
-            for page_num, image in enumerate(images, start=1):
-                logger.debug(f"Running OCR on page {page_num}")
+            preprocess = True
+        except ImportError:
+            logger.warning("opencv-python not installed, skipping OCR preprocessing")
+            preprocess = False
 
-                # Run OCR (support Italian and English)
-                page_text = pytesseract.image_to_string(image, lang="ita+eng")
+        logger.info("Performing OCR on PDF")
 
-                if page_text:
-                    text_parts.append(page_text)
+        try:
+            pdf = pdfium.PdfDocument(str(self.file_path))
+            pages_text: List[str] = []
+            api = tesserocr.PyTessBaseAPI(lang=OCR_LANG) if TESSEROCR_AVAILABLE else None
 
+            try:
+                page_count = len(pdf)
+
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    # Rasterize a window of pages at a time so peak memory is
+                    # bounded by the chunk, not the document
+                    for first_page in range(0, page_count, OCR_CHUNK_PAGES):
+                        last_page = min(first_page + OCR_CHUNK_PAGES, page_count)
+
+                        images = [
+                            _render_page_for_ocr(pdf, page_idx, preprocess)
+                            for page_idx in range(first_page, last_page)
+                        ]
+
+                        if api is not None:
+                            pages_text.extend(
+                                _ocr_images_tesserocr(api, images, first_page + 1)
+                            )
+                        elif len(images) > OCR_BATCH_MIN_PAGES:
+                            pages_text.extend(self._ocr_images_batched(images, tmp_dir))
+                        else:
+                            for page_num, image in enumerate(images, start=first_page + 1):
+                                logger.debug(f"Running OCR on page {page_num}")
+
+                                # Run OCR (support Italian and English)
+                                pages_text.append(_ocr_image(image))
+            finally:
+                if api is not None:
+                    api.End()
+                pdf.close()
+
+            for page_num, page_text in enumerate(pages_text, start=1):
                 logger.debug(
                     f"OCR completed for page {page_num}",
                     extra={"extra_fields": {"page": page_num, "text_length": len(page_text)}},
                 )
 
-            full_text = "\n\n".join(text_parts)
+            full_text = self._join_pages_text(pages_text)
 
             logger.info(
                 f"OCR extraction completed",
                 extra={
                     "extra_fields": {
-                        "total_pages": len(images),
+                        "total_pages": len(pages_text),
                         "total_length": len(full_text),
                     }
                 },
@@ -285,6 +835,42 @@ class PDFDocument(BaseDocument):
                 f"OCR extraction failed: {str(e)}", {"file_path": str(self.file_path)}
             )
 
+    def _ocr_images_batched(self, images: List[Any], tmp_dir: str) -> List[str]:
+        """
+        Run OCR on several page images with a single Tesseract invocation.
+
+        Images are written to a temporary directory and passed to Tesseract
+        through a list file, then the output is split back into pages.
+
+        Args:
+            images: Page images (PIL) in page order
+            tmp_dir: Directory for the page images and list file
+
+        Returns:
+            OCR text for each page
+        """
+        logger.debug(
+            "Running batched OCR",
+            extra={"extra_fields": {"pages": len(images)}},
+        )
+
+        image_paths = []
+        for page_num, image in enumerate(images, start=1):
+            image_path = Path(tmp_dir) / f"page_{page_num:05d}.png"
+            image.save(image_path)
+            image_paths.append(image_path)
+
+        list_file = Path(tmp_dir) / "list.txt"
+        list_file.write_text("\n".join(str(path) for path in image_paths) + "\n")
+
+        try:
+            output = _run_tesseract(str(list_file))
+        finally:
+            for image_path in image_paths:
+                image_path.unlink(missing_ok=True)
+
+        return _split_ocr_pages(output, len(images))
+
     def rebuild(self, anonymized_text: str, detections: List[Dict[str, Any]], mode: str = "redact") -> bytes:
         """
         Rebuild PDF with anonymized content.
@@ -368,62 +954,49 @@ class PDFDocument(BaseDocument):
         """
         Rebuild PDF with visual redaction (black boxes over PII in original document).
 
+        Uses PyMuPDF when available, which applies real redactions: the
+        boxes are drawn and the covered text is removed from the page
+        content. Otherwise black boxes are overlaid with pikepdf (changed
+        pages only) or, as a last resort, a PyPDF2 read/write round-trip;
+        overlays only hide the text visually.
+
         Args:
             detections: List of detections with text positions
 
         Returns:
             PDF file bytes with black boxes drawn over PII
         """
-        try:
-            from PyPDF2 import PdfReader, PdfWriter
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.colors import black
-        except ImportError:
-            raise DocumentProcessingError(
-                "PyPDF2 not installed. Install with: pip install PyPDF2",
-                {"required_package": "PyPDF2"},
-            )
+        if not PYMUPDF_AVAILABLE:
+            # The pikepdf and PyPDF2 overlays are drawn with reportlab
+            try:
+                import reportlab  # noqa: F401
+            except ImportError:
+                raise DocumentProcessingError(
+                    "reportlab not installed. Install with: pip install reportlab",
+                    {"required_package": "reportlab"},
+                )
+
+        if not PYMUPDF_AVAILABLE and not PIKEPDF_AVAILABLE:
+            try:
+                import PyPDF2  # noqa: F401
+            except ImportError:
+                raise DocumentProcessingError(
+                    "PyPDF2 not installed. Install with: pip install PyPDF2",
+                    {"required_package": "PyPDF2"},
+                )
 
         logger.info("Applying visual redaction to original PDF")
 
         try:
-            # Read original PDF
-            reader = PdfReader(str(self.file_path))
-            writer = PdfWriter()
-
-            # Process each page
-            for page_num, page in enumerate(reader.pages):
-                # Find detections for this page (pass page number explicitly)
-                page_detections = self._find_text_coordinates_by_num(page_num, detections)
-
-                if page_detections:
-                    # Create overlay with black boxes
-                    overlay_buffer = io.BytesIO()
-                    c = canvas.Canvas(overlay_buffer, pagesize=(
-                        float(page.mediabox.width),
-                        float(page.mediabox.height)
-                    ))
-
-                    # Draw black rectangles over detected PII
-                    c.setFillColor(black)
-                    for detection in page_detections:
-                        x, y, width, height = detection['bbox']
-                        c.rect(x, y, width, height, fill=1, stroke=0)
-
-                    c.save()
-                    overlay_buffer.seek(0)
-
-                    # Merge overlay with original page
-                    overlay_pdf = PdfReader(overlay_buffer)
-                    page.merge_page(overlay_pdf.pages[0])
-
-                writer.add_page(page)
-
-            # Write to buffer
-            output_buffer = io.BytesIO()
-            writer.write(output_buffer)
-            pdf_bytes = output_buffer.getvalue()
-            output_buffer.close()
+            # Normalize detection text once and bucket it by page
+            phrases_by_page = self._phrases_by_page(detections)
+
+            if PYMUPDF_AVAILABLE:
+                pdf_bytes = self._redact_with_pymupdf(phrases_by_page)
+            elif PIKEPDF_AVAILABLE:
+                pdf_bytes = self._redact_with_pikepdf(phrases_by_page)
+            else:
+                pdf_bytes = self._redact_with_pypdf2(phrases_by_page)
 
             logger.info(
                 "Visual redaction completed",
@@ -439,13 +1012,176 @@ class PDFDocument(BaseDocument):
                 {"file_path": str(self.file_path)}
             )
 
-    def _find_text_coordinates_by_num(self, page_num: int, detections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _phrases_by_page(
+        self, detections: List[Dict[str, Any]]
+    ) -> Dict[int, List[Tuple[str, List[str]]]]:
+        """
+        Group detection phrases by the page (0-indexed) they belong to.
+
+        A detection's page comes from its 'page' field, or from its 'start'
+        offset when text was extracted by this handler. Detections with no
+        known page are searched on every page.
+
+        Args:
+            detections: List of detections
+
+        Returns:
+            Mapping of page index to the phrases to look for on that page
+        """
+        phrases_by_page: Dict[int, List[Tuple[str, List[str]]]] = defaultdict(list)
+        unplaced = []
+
+        for detection in detections:
+            phrases = _detection_phrases([detection])
+            if not phrases:
+                continue
+
+            page_num = detection.get('page')
+            if page_num is None and 'start' in detection and self._page_text_starts:
+                idx = bisect.bisect_right(self._page_text_starts, detection['start']) - 1
+                page_num = self._page_text_numbers[max(idx, 0)]
+
+            if page_num is None:
+                unplaced.extend(phrases)
+            else:
+                phrases_by_page[page_num].extend(phrases)
+
+        if unplaced:
+            for page_num in range(self.get_page_count()):
+                phrases_by_page[page_num].extend(unplaced)
+
+        return phrases_by_page
+
+    def _redact_with_pymupdf(
+        self, phrases_by_page: Dict[int, List[Tuple[str, List[str]]]]
+    ) -> bytes:
+        """Apply redaction annotations to pages with detections using PyMuPDF"""
+        doc = pymupdf.open(str(self.file_path))
+
+        try:
+            for page_num in sorted(phrases_by_page):
+                if page_num >= doc.page_count:
+                    continue
+
+                page_detections = self._find_text_coordinates_by_num(
+                    page_num, phrases_by_page[page_num]
+                )
+                if not page_detections:
+                    continue
+
+                page = doc[page_num]
+                # bbox uses a bottom-left origin, PyMuPDF a top-left one
+                page_height = float(self._pdf.pages[page_num].height)
+
+                for detection in page_detections:
+                    x, y, width, height = detection['bbox']
+                    page.add_redact_annot(
+                        pymupdf.Rect(x, page_height - (y + height), x + width, page_height - y),
+                        fill=(0, 0, 0),
+                    )
+
+                # Remove the covered text and draw the boxes
+                page.apply_redactions()
+
+            return doc.tobytes(garbage=4, deflate=True)
+        finally:
+            doc.close()
+
+    def _redact_with_pikepdf(
+        self, phrases_by_page: Dict[int, List[Tuple[str, List[str]]]]
+    ) -> bytes:
+        """Overlay black boxes on pages with detections using pikepdf"""
+        with pikepdf.open(self.file_path) as pdf:
+            redacted_pages = []
+            overlay_pages = []
+
+            # Pages without detections are never touched
+            for page_num in sorted(phrases_by_page):
+                if page_num >= len(pdf.pages):
+                    continue
+
+                page_detections = self._find_text_coordinates_by_num(
+                    page_num, phrases_by_page[page_num]
+                )
+                if not page_detections:
+                    continue
+
+                page = pdf.pages[page_num]
+                x0, y0, x1, y1 = (float(v) for v in page.mediabox)
+                redacted_pages.append(page)
+                overlay_pages.append((x1 - x0, y1 - y0, page_detections))
+
+            output_buffer = io.BytesIO()
+
+            if not redacted_pages:
+                pdf.save(output_buffer, linearize=False)
+                return output_buffer.getvalue()
+
+            # The overlay must stay open until the target is saved, since
+            # qpdf copies foreign stream data lazily
+            with pikepdf.open(io.BytesIO(_render_box_overlays(overlay_pages))) as overlay_pdf:
+                for page, overlay_page in zip(redacted_pages, overlay_pdf.pages):
+                    page.add_overlay(overlay_page)
+
+                pdf.save(output_buffer, linearize=False)
+
+            return output_buffer.getvalue()
+
+    def _redact_with_pypdf2(
+        self, phrases_by_page: Dict[int, List[Tuple[str, List[str]]]]
+    ) -> bytes:
+        """Overlay black boxes on pages with detections using PyPDF2"""
+        from PyPDF2 import PdfReader, PdfWriter
+
+        # Read original PDF
+        reader = PdfReader(str(self.file_path))
+        writer = PdfWriter()
+
+        # Find detections for each page with candidates
+        redacted_pages = []
+        overlay_pages = []
+        for page_num in sorted(phrases_by_page):
+            if page_num >= len(reader.pages):
+                continue
+
+            page_detections = self._find_text_coordinates_by_num(
+                page_num, phrases_by_page[page_num]
+            )
+            if page_detections:
+                page = reader.pages[page_num]
+                redacted_pages.append(page)
+                overlay_pages.append((
+                    float(page.mediabox.width),
+                    float(page.mediabox.height),
+                    page_detections,
+                ))
+
+        # Merge all overlays from a single overlay document
+        if redacted_pages:
+            overlay_pdf = PdfReader(io.BytesIO(_render_box_overlays(overlay_pages)))
+            for page, overlay_page in zip(redacted_pages, overlay_pdf.pages):
+                page.merge_page(overlay_page)
+
+        for page in reader.pages:
+            writer.add_page(page)
+
+        # Write to buffer
+        output_buffer = io.BytesIO()
+        writer.write(output_buffer)
+        pdf_bytes = output_buffer.getvalue()
+        output_buffer.close()
+
+        return pdf_bytes
+
+    def _find_text_coordinates_by_num(
+        self, page_num: int, phrases: List[Tuple[str, List[str]]]
+    ) -> List[Dict[str, Any]]:
         """
         Find bounding boxes for detected PII text in PDF page using pdfplumber.
 
         Args:
             page_num: Page number (0-indexed)
-            detections: List of text detections
+            phrases: Detection phrases as (text, words) pairs, see _detection_phrases
 
         Returns:
             List of detections with bounding box coordinates
@@ -453,7 +1189,7 @@ class PDFDocument(BaseDocument):
         page_detections = []
 
         try:
-            if not hasattr(self, '_pdf') or not self._pdf:
+            if not self._pdf:
                 logger.warning("pdfplumber not available for coordinate extraction")
                 return page_detections
 
@@ -464,45 +1200,32 @@ class PDFDocument(BaseDocument):
                 logger.warning(f"Page {page_num} not found in pdfplumber")
                 return page_detections
 
-            # Extract words with coordinates
-            words = plumber_page.extract_words()
+            # Extract words with coordinates (cached across rebuild calls)
+            if page_num not in self._words_cache:
+                words = plumber_page.extract_words()
+                self._words_cache[page_num] = (
+                    words,
+                    [w['text'].strip() for w in words],
+                    float(plumber_page.height),
+                )
+            words, stripped, page_height = self._words_cache[page_num]
 
-            # Get page dimensions
-            page_height = float(plumber_page.height)
+            # Locate the first exact (multi-word) match of every phrase at once
+            phrase_starts = _find_phrase_starts(stripped, phrases)
 
             # For each detection, find matching words
-            for detection in detections:
-                text_to_find = detection.get('text', '').strip()
-                if not text_to_find:
-                    continue
-
-                # Try to find exact match first
+            for phrase_idx, (text_to_find, detection_words) in enumerate(phrases):
                 matched_words = []
-                detection_words = text_to_find.split()
-
-                for i, word_obj in enumerate(words):
-                    word_text = word_obj['text'].strip()
 
-                    # Check if this word starts a match
-                    if detection_words and word_text == detection_words[0]:
-                        # Try to match the full phrase
-                        potential_match = [word_obj]
+                start = phrase_starts.get(phrase_idx)
+                if start is not None:
+                    matched_words = words[start:start + len(detection_words)]
 
-                        for j, detection_word in enumerate(detection_words[1:], start=1):
-                            if i + j < len(words) and words[i + j]['text'].strip() == detection_word:
-                                potential_match.append(words[i + j])
-                            else:
-                                break
-
-                        # If we matched all words
-                        if len(potential_match) == len(detection_words):
-                            matched_words = potential_match
-                            break
-
-                    # Also check for substring match in single word
-                    elif text_to_find in word_text:
-                        matched_words = [word_obj]
-                        break
+                # Fall back to substring/fuzzy match in a single word
+                if not matched_words:
+                    word_idx = _find_word_containing(text_to_find, stripped)
+                    if word_idx is not None:
+                        matched_words = [words[word_idx]]
 
                 # If we found matches, create bounding box
                 if matched_words:
@@ -544,16 +1267,14 @@ class PDFDocument(BaseDocument):
         Returns:
             Page count
         """
-        if hasattr(self, "_pdf") and self._pdf:
+        if self._pdf:
             return len(self._pdf.pages)
         return 0
 
     def close(self):
         """Close PDF file"""
-        if hasattr(self, "_pdf") and self._pdf:
+        if self._pdf:
             self._pdf.close()
+            self._pdf = None
+            self._words_cache.clear()
             logger.debug("PDF file closed")
-
-    def __del__(self):
-        """Cleanup on deletion"""
-        self.close()
@@ -10,9 +10,13 @@ Orchestrates the entire document anonymization workflow:
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Type
 from dataclasses import dataclass, field
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import queue
+import threading
+import time
 
 from .base import BaseDocument, DocumentFormat
 from .pdf_document import PDFDocument
@@ -27,6 +31,58 @@ from ..modes import AnonymizationMode
 
 logger = get_logger(__name__)
 
+# File extension to document format, shared by every _detect_format call
+_EXTENSION_FORMAT_MAP: Dict[str, DocumentFormat] = {
+    ".pdf": DocumentFormat.PDF,
+    ".png": DocumentFormat.IMAGE,
+    ".jpg": DocumentFormat.IMAGE,
+    ".jpeg": DocumentFormat.IMAGE,
+    ".tiff": DocumentFormat.IMAGE,
+    ".tif": DocumentFormat.IMAGE,
+    ".docx": DocumentFormat.WORD,
+    ".doc": DocumentFormat.WORD,
+    ".xlsx": DocumentFormat.EXCEL,
+    ".xls": DocumentFormat.EXCEL,
+    ".pptx": DocumentFormat.POWERPOINT,
+    ".ppt": DocumentFormat.POWERPOINT,
+    ".eml": DocumentFormat.EMAIL,
+    ".msg": DocumentFormat.EMAIL,
+    ".txt": DocumentFormat.TEXT,
+    ".html": DocumentFormat.HTML,
+    ".htm": DocumentFormat.HTML,
+}
+
+# Maximum documents buffered between batch pipeline stages
+BATCH_QUEUE_SIZE = 16
+
+# Seconds a batch stage waits on a queue before checking for a failed stage
+BATCH_QUEUE_TIMEOUT = 0.1
+
+# Pipeline owned by each process_batch worker process (see _init_batch_worker)
+_worker_pipeline: Optional["DocumentPipeline"] = None
+
+
+def _init_batch_worker(engine_config: Dict[str, Any]):
+    """
+    Process pool initializer: build one engine and pipeline per worker.
+
+    Detection models are loaded once per worker process instead of once per
+    document, and the parent's engine never needs to be pickled.
+    """
+    global _worker_pipeline
+    from ..engine import AnonymaEngine
+
+    _worker_pipeline = DocumentPipeline(AnonymaEngine(**engine_config))
+
+
+def _process_in_worker(
+    file_path: Path, mode: AnonymizationMode, language: str, save_output: bool
+) -> "ProcessingResult":
+    """Process pool task: run one document through the worker's pipeline"""
+    return _worker_pipeline.process(
+        file_path=file_path, mode=mode, language=language, save_output=save_output
+    )
+
 
 @dataclass
 class ProcessingResult:
@@ -61,21 +117,45 @@ class ProcessingResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
 
+    @property
+    def format_value(self) -> Optional[str]:
+        """Document format as its string value"""
+        return self.format.value if self.format else None
+
+    @property
+    def mode_value(self) -> Optional[str]:
+        """Anonymization mode as its string value"""
+        return self.mode.value if self.mode else None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary"""
         return {
             "success": self.success,
             "original_file": str(self.original_file),
             "output_file": str(self.output_file) if self.output_file else None,
-            "format": self.format.value if self.format else None,
+            "format": self.format_value,
             "detections_count": self.detections_count,
-            "mode": self.mode.value if self.mode else None,
+            "mode": self.mode_value,
             "processing_time": self.processing_time,
             "metadata": self.metadata,
             "error": self.error,
         }
 
 
+@dataclass
+class _DocumentJob:
+    """State of one document as it moves through the pipeline stages"""
+
+    file_path: Path
+    start_time: float
+    index: int = 0
+    doc_format: Optional[DocumentFormat] = None
+    handler: Optional[BaseDocument] = None
+    original_text: Optional[str] = None
+    result: Any = None
+    error: Optional[Exception] = None
+
+
 class DocumentPipeline:
     """
     Unified pipeline for processing documents of any format.
@@ -124,6 +204,13 @@ class DocumentPipeline:
             DocumentFormat.EMAIL: EmailDocument,
         }
 
+        # Extension -> (format, handler class), so dispatch is one lookup
+        self._dispatch: Dict[str, Tuple[DocumentFormat, Type[BaseDocument]]] = {
+            suffix: (doc_format, self.handlers[doc_format])
+            for suffix, doc_format in _EXTENSION_FORMAT_MAP.items()
+            if doc_format in self.handlers
+        }
+
         logger.info(
             "DocumentPipeline initialized",
             extra={"extra_fields": {"supported_formats": list(self.handlers.keys())}},
@@ -153,7 +240,7 @@ class DocumentPipeline:
         Raises:
             DocumentProcessingError: If processing fails
         """
-        start_time = datetime.now()
+        job = _DocumentJob(file_path=file_path, start_time=time.perf_counter())
 
         logger.info(
             f"Starting document processing",
@@ -167,86 +254,368 @@ class DocumentPipeline:
         )
 
         try:
-            # Step 1: Detect format
-            doc_format = self._detect_format(file_path)
-            logger.info(f"Detected format: {doc_format.value}")
-
-            # Step 2: Load document handler
-            handler = self._get_handler(file_path, doc_format)
-
-            # Step 3: Extract text
-            logger.info("Extracting text from document")
-            original_text = handler.extract_text()
-            logger.info(
-                f"Text extracted",
-                extra={"extra_fields": {"text_length": len(original_text)}},
-            )
+            self._extract_stage(job)
+            self._anonymize_stage(job, mode, language)
+            return self._rebuild_stage(job, mode, output_path, save_output)
 
-            # Step 4: Anonymize text
-            logger.info("Starting anonymization")
-            result = self.engine.anonymize(original_text, mode, language)
-            logger.info(
-                f"Anonymization completed",
-                extra={"extra_fields": {"detections_count": len(result.detections) if hasattr(result, 'detections') else 0}},
-            )
+        except Exception as e:
+            return self._failed_result(job, e)
+
+        finally:
+            if job.handler is not None:
+                job.handler.close()
+
+    def _extract_stage(self, job: "_DocumentJob"):
+        """Steps 1-3: detect format, load the handler and extract text"""
+        # Steps 1-2: Detect format and load document handler
+        suffix = job.file_path.suffix.lower()
+        dispatch = self._dispatch.get(suffix)
+
+        if dispatch is None:
+            job.doc_format = self._detect_format(job.file_path)
+            job.handler = self._get_handler(job.file_path, job.doc_format)
+        else:
+            job.doc_format, handler_class = dispatch
+            job.handler = handler_class(job.file_path)
+
+        logger.info(f"Detected format: {job.doc_format.value}")
+
+        # Step 3: Extract text
+        logger.info("Extracting text from document")
+        job.original_text = job.handler.extract_text()
+        logger.info(
+            f"Text extracted",
+            extra={"extra_fields": {"text_length": len(job.original_text)}},
+        )
 
+    def _anonymize_stage(self, job: "_DocumentJob", mode: AnonymizationMode, language: str):
+        """Step 4: anonymize the extracted text"""
+        if not job.original_text or job.original_text.isspace():
+            # Nothing to detect: skip the engine and leave job.result unset
+            logger.info("No text extracted, skipping anonymization")
+            return
+
+        logger.info("Starting anonymization")
+        job.result = self.engine.anonymize(job.original_text, mode, language)
+        logger.info(
+            f"Anonymization completed",
+            extra={"extra_fields": {"detections_count": len(job.result.detections) if hasattr(job.result, 'detections') else 0}},
+        )
+
+    def _rebuild_stage(
+        self,
+        job: "_DocumentJob",
+        mode: AnonymizationMode,
+        output_path: Optional[Path],
+        save_output: bool,
+    ) -> ProcessingResult:
+        """Steps 5-6: rebuild the document, save it and build the result"""
+        result = job.result
+        if save_output and output_path is None:
+            output_path = self._generate_output_path(job.file_path)
+
+        warning = None
+        if result is None:
+            # No text was extracted (e.g. scanned pages or text only in images).
+            # The original may still hold PII, so no output file is written
+            anonymized_text = job.original_text
+            detections = []
+            if save_output:
+                warning = "No text extracted; no anonymized output was written"
+                logger.warning(warning, extra={"extra_fields": {"file": str(job.file_path)}})
+                output_path = None
+                save_output = False
+        else:
             # Step 5: Rebuild document
             logger.info("Rebuilding document")
+            anonymized_text = result.anonymized_text
             detections = result.detections if hasattr(result, "detections") else []
-            output_bytes = handler.rebuild(result.anonymized_text, detections, mode=mode.value)
+            mode_value = mode.value
 
-            # Step 6: Save output
+            # Step 6: Save output, streaming the rebuilt document into the file
             if save_output:
-                if output_path is None:
-                    output_path = self._generate_output_path(file_path)
-
-                output_path.write_bytes(output_bytes)
+                try:
+                    with open(output_path, "wb") as out:
+                        job.handler.rebuild_to(out, anonymized_text, detections, mode=mode_value)
+                except Exception:
+                    # Don't leave a partially written document behind
+                    output_path.unlink(missing_ok=True)
+                    raise
                 logger.info(f"Output saved to: {output_path}")
+            else:
+                job.handler.rebuild(anonymized_text, detections, mode=mode_value)
+
+        # Calculate processing time
+        processing_time = time.perf_counter() - job.start_time
+
+        metadata = job.handler.get_metadata().to_dict()
+        if warning is not None:
+            metadata["warning"] = warning
+
+        # Create result
+        processing_result = ProcessingResult(
+            success=True,
+            original_file=job.file_path,
+            output_file=output_path if save_output else None,
+            format=job.doc_format,
+            anonymized_text=anonymized_text,
+            original_text=job.original_text,
+            detections=detections,
+            detections_count=len(detections),
+            mode=mode,
+            processing_time=processing_time,
+            metadata=metadata,
+        )
+
+        logger.info(
+            f"Document processing completed successfully",
+            extra={
+                "extra_fields": {
+                    "processing_time": processing_time,
+                    "detections": len(detections),
+                }
+            },
+        )
+
+        return processing_result
+
+    def _failed_result(self, job: "_DocumentJob", error: Exception) -> ProcessingResult:
+        """Build the result for a document whose processing raised"""
+        processing_time = time.perf_counter() - job.start_time
+
+        if isinstance(error, DocumentProcessingError):
+            # Expected failure (missing file, unsupported or corrupt document):
+            # the message says it all, skip formatting a traceback
+            logger.error(f"Document processing failed: {error}")
+        else:
+            logger.error(f"Document processing failed: {error}", exc_info=error)
+
+        return ProcessingResult(
+            success=False,
+            original_file=job.file_path,
+            format=job.doc_format,
+            processing_time=processing_time,
+            error=str(error),
+        )
+
+    def process_batch(
+        self,
+        file_paths: List[Path],
+        mode: AnonymizationMode,
+        language: str = "it",
+        save_output: bool = True,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        engine_config: Optional[Dict[str, Any]] = None,
+    ) -> List[ProcessingResult]:
+        """
+        Process several independent documents concurrently.
+
+        With use_processes=True (default), documents are spread over a
+        process pool. Each worker builds its own AnonymaEngine from
+        engine_config once, so CPU-bound OCR and detection scale with cores.
+        With use_processes=False, documents flow through threaded stages
+        sharing this pipeline's engine (see _process_batch_pipelined), which
+        suits I/O-bound formats and engines that can't be rebuilt.
+
+        Output files use the default 'anonymized_' naming next to each input.
+
+        Args:
+            file_paths: Paths to input documents
+            mode: Anonymization mode to use
+            language: Language code for detection
+            save_output: Whether to save output files
+            max_workers: Number of workers (default: CPU count)
+            use_processes: Use a process pool instead of a thread pool
+            engine_config: AnonymaEngine keyword arguments for worker
+                processes (default: use_flair of this pipeline's engine)
+
+        Returns:
+            ProcessingResult per input file, in input order
+        """
+        if not file_paths:
+            return []
+
+        workers = max_workers or os.cpu_count() or 1
+
+        logger.info(
+            "Starting batch processing",
+            extra={
+                "extra_fields": {
+                    "files": len(file_paths),
+                    "workers": workers,
+                    "use_processes": use_processes,
+                    "mode": mode.value,
+                }
+            },
+        )
 
-            # Calculate processing time
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-
-            # Create result
-            processing_result = ProcessingResult(
-                success=True,
-                original_file=file_path,
-                output_file=output_path if save_output else None,
-                format=doc_format,
-                anonymized_text=result.anonymized_text,
-                original_text=original_text,
-                detections=detections,
-                detections_count=len(detections),
-                mode=mode,
-                processing_time=processing_time,
-                metadata=handler.get_metadata().to_dict(),
+        if not use_processes:
+            return self._process_batch_pipelined(
+                file_paths, mode, language, save_output, workers
             )
 
-            logger.info(
-                f"Document processing completed successfully",
-                extra={
-                    "extra_fields": {
-                        "processing_time": processing_time,
-                        "detections": len(detections),
-                    }
-                },
+        if engine_config is None:
+            engine_config = {"use_flair": getattr(self.engine, "use_flair", True)}
+
+        count = len(file_paths)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(engine_config,),
+        ) as executor:
+            return list(
+                executor.map(
+                    _process_in_worker,
+                    file_paths,
+                    [mode] * count,
+                    [language] * count,
+                    [save_output] * count,
+                    chunksize=max(1, count // (4 * workers)),
+                )
             )
 
-            return processing_result
+    def _process_batch_pipelined(
+        self,
+        file_paths: List[Path],
+        mode: AnonymizationMode,
+        language: str,
+        save_output: bool,
+        workers: int,
+    ) -> List[ProcessingResult]:
+        """
+        Process documents as a three-stage producer/consumer pipeline.
+
+        An extractor thread pool feeds a single anonymizer thread through a
+        bounded queue, which in turn feeds a rebuild/write thread pool. While
+        one document is being anonymized the next ones are already being
+        extracted, so throughput approaches that of the slowest stage.
 
-        except Exception as e:
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+        Args:
+            file_paths: Paths to input documents
+            mode: Anonymization mode to use
+            language: Language code for detection
+            save_output: Whether to save output files
+            workers: Threads for the extract and rebuild stages
+
+        Returns:
+            ProcessingResult per input file, in input order
+        """
+        results: List[Optional[ProcessingResult]] = [None] * len(file_paths)
+        anonymize_queue: "queue.Queue[Optional[_DocumentJob]]" = queue.Queue(
+            maxsize=BATCH_QUEUE_SIZE
+        )
+        rebuild_queue: "queue.Queue[Optional[_DocumentJob]]" = queue.Queue(
+            maxsize=BATCH_QUEUE_SIZE
+        )
 
-            logger.error(f"Document processing failed: {e}", exc_info=True)
+        # Set when a stage thread dies, so no other stage waits on it forever
+        failed = threading.Event()
+        stage_errors: List[BaseException] = []
+
+        def put(target: queue.Queue, job: Optional[_DocumentJob]) -> bool:
+            """Queue job; False if the pipeline failed before it fit"""
+            while not failed.is_set():
+                try:
+                    target.put(job, timeout=BATCH_QUEUE_TIMEOUT)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(source: queue.Queue) -> Optional[_DocumentJob]:
+            """Next job, or None at the end of input or on pipeline failure"""
+            while True:
+                try:
+                    return source.get(timeout=BATCH_QUEUE_TIMEOUT)
+                except queue.Empty:
+                    if failed.is_set():
+                        return None
+
+        def stage(target):
+            """Run a consumer loop, flagging the pipeline as failed if it dies"""
+            def run():
+                try:
+                    target()
+                except BaseException as e:
+                    stage_errors.append(e)
+                    failed.set()
+            return run
+
+        def extract(index: int, file_path: Path):
+            job = _DocumentJob(file_path=file_path, start_time=time.perf_counter(), index=index)
+            try:
+                self._extract_stage(job)
+            except Exception as e:
+                job.error = e
+            if not put(anonymize_queue, job) and job.handler is not None:
+                job.handler.close()
+
+        def anonymize():
+            while (job := get(anonymize_queue)) is not None:
+                if job.error is None:
+                    try:
+                        self._anonymize_stage(job, mode, language)
+                    except Exception as e:
+                        job.error = e
+                logger.debug(
+                    "Batch stage occupancy",
+                    extra={
+                        "extra_fields": {
+                            "anonymize_queue": anonymize_queue.qsize(),
+                            "rebuild_queue": rebuild_queue.qsize(),
+                        }
+                    },
+                )
+                if not put(rebuild_queue, job) and job.handler is not None:
+                    job.handler.close()
+
+        def rebuild():
+            while (job := get(rebuild_queue)) is not None:
+                try:
+                    if job.error is not None:
+                        raise job.error
+                    results[job.index] = self._rebuild_stage(job, mode, None, save_output)
+                except Exception as e:
+                    results[job.index] = self._failed_result(job, e)
+                finally:
+                    if job.handler is not None:
+                        job.handler.close()
+
+        anonymizer = threading.Thread(target=stage(anonymize), name="anonyma-anonymize")
+        rebuilders = [
+            threading.Thread(target=stage(rebuild), name=f"anonyma-rebuild-{i}")
+            for i in range(workers)
+        ]
+        anonymizer.start()
+        for thread in rebuilders:
+            thread.start()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="anonyma-extract") as executor:
+            list(executor.map(extract, range(len(file_paths)), file_paths))
+
+        # Drain: stop the anonymizer, then every rebuild worker
+        put(anonymize_queue, None)
+        anonymizer.join()
+        for _ in rebuilders:
+            put(rebuild_queue, None)
+        for thread in rebuilders:
+            thread.join()
+
+        if stage_errors:
+            # Close the handlers of documents stranded in the queues
+            for source in (anonymize_queue, rebuild_queue):
+                while not source.empty():
+                    job = source.get_nowait()
+                    if job is not None and job.handler is not None:
+                        job.handler.close()
+            error = stage_errors[0]
+            raise DocumentProcessingError(
+                f"Batch processing stage failed: {error}",
+                {"error": str(error), "files": len(file_paths)},
+            ) from error
 
-            return ProcessingResult(
-                success=False,
-                original_file=file_path,
-                format=doc_format if "doc_format" in locals() else None,
-                processing_time=processing_time,
-                error=str(e),
-            )
+        return results
 
     def _detect_format(self, file_path: Path) -> DocumentFormat:
         """
@@ -261,27 +630,7 @@ class DocumentPipeline:
         # Check file extension
         suffix = file_path.suffix.lower()
 
-        format_map = {
-            ".pdf": DocumentFormat.PDF,
-            ".png": DocumentFormat.IMAGE,
-            ".jpg": DocumentFormat.IMAGE,
-            ".jpeg": DocumentFormat.IMAGE,
-            ".tiff": DocumentFormat.IMAGE,
-            ".tif": DocumentFormat.IMAGE,
-            ".docx": DocumentFormat.WORD,
-            ".doc": DocumentFormat.WORD,
-            ".xlsx": DocumentFormat.EXCEL,
-            ".xls": DocumentFormat.EXCEL,
-            ".pptx": DocumentFormat.POWERPOINT,
-            ".ppt": DocumentFormat.POWERPOINT,
-            ".eml": DocumentFormat.EMAIL,
-            ".msg": DocumentFormat.EMAIL,
-            ".txt": DocumentFormat.TEXT,
-            ".html": DocumentFormat.HTML,
-            ".htm": DocumentFormat.HTML,
-        }
-
-        detected_format = format_map.get(suffix, DocumentFormat.UNKNOWN)
+        detected_format = _EXTENSION_FORMAT_MAP.get(suffix, DocumentFormat.UNKNOWN)
 
         logger.debug(
             f"Format detection",
@@ -324,7 +673,8 @@ class DocumentPipeline:
         Returns:
             Output file path with 'anonymized_' prefix
         """
-        return input_path.parent / f"anonymized_{input_path.name}"
+        dirname, basename = os.path.split(input_path)
+        return Path(os.path.join(dirname, "anonymized_" + basename))
 
     def get_supported_formats(self) -> List[DocumentFormat]:
         """
@@ -9,9 +9,11 @@ Handles PowerPoint presentations with:
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, BinaryIO, Iterator, Tuple
 from datetime import datetime
+from array import array
 import io
+import re
 
 from .base import BaseDocument, DocumentFormat, DocumentMetadata
 from ..logging_config import get_logger
@@ -19,6 +21,29 @@ from ..exceptions import DocumentProcessingError
 
 logger = get_logger(__name__)
 
+# Import python-pptx once per process instead of once per document
+try:
+    from pptx import Presentation
+    PPTX_AVAILABLE = True
+except ImportError:
+    Presentation = None
+    PPTX_AVAILABLE = False
+
+# One "[Slide N]" or "[Slide N - Notes]" section of extracted text. The body
+# runs up to the next section header (or trailing whitespace at the end), so
+# blank lines inside a slide don't split it.
+_SECTION_RE = re.compile(
+    r"^\[Slide (\d+)( - Notes)?\]\n?(.*?)(?=\n\n\[Slide \d|\s*\Z)",
+    re.M | re.S,
+)
+
+
+def _section_header(slide_number: int, notes: bool) -> str:
+    """Header line that opens a section in the extracted text"""
+    if notes:
+        return f"[Slide {slide_number} - Notes]\n"
+    return f"[Slide {slide_number}]\n"
+
 
 class PowerPointDocument(BaseDocument):
     """
@@ -45,7 +70,11 @@ class PowerPointDocument(BaseDocument):
             DocumentProcessingError: If PowerPoint document can't be loaded
         """
         self._presentation = None
-        self._slides_map = []  # Track slide structure
+        self._slide_count = 0  # len(slides) walks the XML slide list; cached
+        # Every extracted section in order as parallel columns (headers
+        # only, no text), used by rebuild to find sections
+        self._section_numbers = array("i")
+        self._section_notes = bytearray()  # 1 for "[Slide N - Notes]"
 
         super().__init__(file_path)
 
@@ -54,33 +83,38 @@ class PowerPointDocument(BaseDocument):
 
     def _load_document(self):
         """Load PowerPoint document with python-pptx"""
-        try:
-            from pptx import Presentation
+        self._require_pptx()
 
+        try:
             self._presentation = Presentation(self.file_path)
+            self._slide_count = len(self._presentation.slides)
 
             logger.info(
                 f"PowerPoint document loaded successfully",
                 extra={
                     "extra_fields": {
-                        "slides": len(self._presentation.slides),
+                        "slides": self._slide_count,
                         "file_size": self.get_file_size(),
                     }
                 },
             )
 
-        except ImportError:
-            raise DocumentProcessingError(
-                "python-pptx not installed. Install with: pip install python-pptx",
-                {"required_package": "python-pptx"},
-            )
         except Exception as e:
-            logger.error(f"Failed to load PowerPoint document: {e}", exc_info=True)
+            # Not logged here: the caller (e.g. DocumentPipeline) logs it once
             raise DocumentProcessingError(
                 f"Failed to load PowerPoint document: {str(e)}",
                 {"file_path": str(self.file_path)}
             )
 
+    @staticmethod
+    def _require_pptx():
+        """Raise if python-pptx is not installed"""
+        if not PPTX_AVAILABLE:
+            raise DocumentProcessingError(
+                "python-pptx not installed. Install with: pip install python-pptx",
+                {"required_package": "python-pptx"},
+            )
+
     def _detect_format(self) -> DocumentFormat:
         """Detect format (always POWERPOINT for this handler)"""
         return DocumentFormat.POWERPOINT
@@ -107,7 +141,7 @@ class PowerPointDocument(BaseDocument):
             logger.warning(f"Failed to extract PowerPoint metadata: {e}")
 
         # Count slides
-        slide_count = len(self._presentation.slides) if self._presentation else 0
+        slide_count = self._slide_count
 
         return DocumentMetadata(
             file_name=self.file_path.name,
@@ -124,6 +158,110 @@ class PowerPointDocument(BaseDocument):
             }
         )
 
+    def iter_text_chunks(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over the presentation text one section at a time.
+
+        Each slide with text yields a "[Slide N]" section and each slide with
+        notes a "[Slide N - Notes]" section, exactly as they appear in
+        extract_text(), without ever joining the whole deck into one string.
+
+        Yields:
+            (section text, {"slide_number": N, "notes": bool}) tuples
+        """
+        slides = list(self._presentation.slides)
+        self._slide_count = len(slides)
+
+        sections = map(self._extract_single_slide, enumerate(slides, start=1))
+        yield from self._iter_sections(sections)
+
+    @staticmethod
+    def _iter_sections(
+        sections: Iterator[Tuple[int, Optional[str], Optional[str]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Turn per-slide (index, content, notes) results into text sections"""
+        for slide_idx, slide_text, notes_text in sections:
+            if slide_text:
+                yield slide_text, {"slide_number": slide_idx, "notes": False}
+            if notes_text:
+                yield notes_text, {"slide_number": slide_idx, "notes": True}
+
+    @staticmethod
+    def _extract_shapes_text_full(shapes) -> List[str]:
+        """
+        Extract text frames and tables from a slide's shapes, in shape order.
+
+        Args:
+            shapes: Slide shape collection
+
+        Returns:
+            Non-empty text per text frame or table
+        """
+        slide_texts = []
+        slide_texts_append = slide_texts.append
+
+        # Resolve each attribute once per shape
+        for shape in shapes:
+            # Text frames (titles, content, text boxes)
+            shape_text = getattr(shape, "text", None)
+            if shape_text and shape_text.strip():
+                slide_texts_append(shape_text)
+
+            # Tables: keep rows with at least one non-empty cell
+            if getattr(shape, "has_table", False):
+                table_text = "\n".join(
+                    " | ".join(row_texts)
+                    for row_texts in (
+                        [cell.text.strip() for cell in row.cells]
+                        for row in shape.table.rows
+                    )
+                    if any(row_texts)
+                )
+                if table_text:
+                    slide_texts_append(table_text)
+
+        return slide_texts
+
+    @staticmethod
+    def _extract_single_slide(
+        idx_and_slide: Tuple[int, Any]
+    ) -> Tuple[int, Optional[str], Optional[str]]:
+        """
+        Extract the content and notes sections of one slide.
+
+        Args:
+            idx_and_slide: (slide number (1-indexed), slide) tuple
+
+        Returns:
+            (slide number, "[Slide N]" section or None,
+            "[Slide N - Notes]" section or None)
+        """
+        slide_idx, slide = idx_and_slide
+
+        logger.debug(f"Extracting text from slide {slide_idx}")
+
+        if slide.element.xpath(".//a:tbl"):
+            slide_texts = PowerPointDocument._extract_shapes_text_full(slide.shapes)
+        else:
+            # Common case: no tables, so only text frames need reading
+            slide_texts = [
+                shape_text
+                for shape_text in (getattr(shape, "text", None) for shape in slide.shapes)
+                if shape_text and shape_text.strip()
+            ]
+
+        slide_section = None
+        if slide_texts:
+            slide_section = f"[Slide {slide_idx}]\n" + "\n".join(slide_texts)
+
+        notes_section = None
+        if slide.has_notes_slide:
+            notes_text = slide.notes_slide.notes_text_frame.text.strip()
+            if notes_text:
+                notes_section = f"[Slide {slide_idx} - Notes]\n{notes_text}"
+
+        return slide_idx, slide_section, notes_section
+
     def extract_text(self) -> str:
         """
         Extract all text from PowerPoint document.
@@ -142,45 +280,16 @@ class PowerPointDocument(BaseDocument):
         """
         try:
             text_parts = []
+            section_numbers = array("i")
+            section_notes = bytearray()
 
-            for slide_idx, slide in enumerate(self._presentation.slides, start=1):
-                slide_texts = []
-
-                logger.debug(f"Extracting text from slide {slide_idx}")
-
-                # Extract text from all shapes
-                for shape in slide.shapes:
-                    # Text frames (titles, content, text boxes)
-                    if hasattr(shape, "text") and shape.text.strip():
-                        slide_texts.append(shape.text)
-
-                    # Tables
-                    if shape.has_table:
-                        table_texts = []
-                        for row in shape.table.rows:
-                            row_texts = [cell.text.strip() for cell in row.cells]
-                            if any(row_texts):
-                                table_texts.append(" | ".join(row_texts))
-
-                        if table_texts:
-                            slide_texts.append("\n".join(table_texts))
-
-                # Add slide content
-                if slide_texts:
-                    slide_content = f"[Slide {slide_idx}]\n" + "\n".join(slide_texts)
-                    text_parts.append(slide_content)
-
-                    self._slides_map.append({
-                        "slide_number": slide_idx,
-                        "text_index": len(text_parts) - 1,
-                        "content": "\n".join(slide_texts)
-                    })
-
-                # Extract notes
-                if slide.has_notes_slide:
-                    notes_text = slide.notes_slide.notes_text_frame.text.strip()
-                    if notes_text:
-                        text_parts.append(f"[Slide {slide_idx} - Notes]\n{notes_text}")
+            for chunk, chunk_meta in self.iter_text_chunks():
+                text_parts.append(chunk)
+                section_numbers.append(chunk_meta["slide_number"])
+                section_notes.append(chunk_meta["notes"])
+
+            self._section_numbers = section_numbers
+            self._section_notes = section_notes
 
             full_text = "\n\n".join(text_parts)
 
@@ -188,7 +297,7 @@ class PowerPointDocument(BaseDocument):
                 f"Text extraction completed",
                 extra={
                     "extra_fields": {
-                        "total_slides": len(self._presentation.slides),
+                        "total_slides": self._slide_count,
                         "total_length": len(full_text),
                     }
                 },
@@ -197,7 +306,6 @@ class PowerPointDocument(BaseDocument):
             return full_text
 
         except Exception as e:
-            logger.error(f"Text extraction failed: {e}", exc_info=True)
             raise DocumentProcessingError(
                 f"Failed to extract text from PowerPoint document: {str(e)}",
                 {"file_path": str(self.file_path)}
@@ -216,68 +324,150 @@ class PowerPointDocument(BaseDocument):
         Returns:
             PowerPoint document bytes
         """
-        try:
-            from pptx import Presentation
-            from pptx.util import Inches, Pt
+        buffer = io.BytesIO()
+        self.rebuild_to(buffer, anonymized_text, detections, mode=mode)
+        # BytesIO hands over its internal bytes object when nothing else
+        # references the buffer, so this does not copy the document
+        pptx_bytes = buffer.getvalue()
+        buffer.close()
+        return pptx_bytes
+
+    def rebuild_to(
+        self,
+        out: BinaryIO,
+        anonymized_text: str,
+        detections: List[Dict[str, Any]],
+        mode: str = "redact",
+    ):
+        """
+        Rebuild PowerPoint document with anonymized content into a file object.
+
+        The presentation is serialized directly into ``out``, so saving to
+        disk needs no intermediate bytes copy.
+
+        Args:
+            out: Writable binary file object
+            anonymized_text: Anonymized text
+            detections: List of detections (for reference)
+        """
+        self._require_pptx()
 
+        try:
             logger.info("Rebuilding PowerPoint document with anonymized content")
 
             # Create new presentation
             new_pres = Presentation()
 
-            # Parse anonymized text back into slides
-            sections = anonymized_text.split("\n\n")
-
-            for section in sections:
-                if not section.strip():
-                    continue
-
-                # Check if it's a slide section
-                if section.startswith("[Slide") and "Notes]" not in section:
-                    # Extract slide content
-                    lines = section.split("\n")
-                    slide_header = lines[0]  # [Slide N]
-                    content_lines = lines[1:]
-
-                    # Create slide
-                    slide_layout = new_pres.slide_layouts[1]  # Title and Content
-                    slide = new_pres.slides.add_slide(slide_layout)
-
-                    # Add title (first line)
-                    if content_lines:
-                        title = slide.shapes.title
-                        title.text = content_lines[0]
-
-                    # Add content (remaining lines)
-                    if len(content_lines) > 1:
-                        content = slide.placeholders[1]
-                        content.text = "\n".join(content_lines[1:])
-
-                elif "[Notes]" in section:
-                    # Notes sections - add to previous slide
-                    # (Skip for now - notes reconstruction is complex)
-                    pass
-
-            # Save to bytes
-            buffer = io.BytesIO()
-            new_pres.save(buffer)
-            ppt_bytes = buffer.getvalue()
-            buffer.close()
+            slides_by_number = {}
+
+            for slide_number, is_notes, body in self._locate_sections(anonymized_text):
+                if is_notes:
+                    self._attach_notes(slides_by_number.get(slide_number), body)
+                else:
+                    slides_by_number[slide_number] = self._add_slide(new_pres, body)
+
+            new_pres.save(out)
 
             logger.info(
                 "PowerPoint document rebuilt successfully",
-                extra={"extra_fields": {"output_size": len(ppt_bytes)}},
+                extra={"extra_fields": {"slides": len(new_pres.slides)}},
             )
 
-            return ppt_bytes
-
         except Exception as e:
-            logger.error(f"PowerPoint document rebuild failed: {e}", exc_info=True)
             raise DocumentProcessingError(
                 f"Failed to rebuild PowerPoint document: {str(e)}",
                 {"file_path": str(self.file_path)}
             )
 
+    def _locate_sections(self, text: str) -> List[Tuple[str, bool, str]]:
+        """
+        Split text into "[Slide N]" and "[Slide N - Notes]" sections.
+
+        When the text still has the layout recorded by extract_text, each
+        header is found with a substring search starting where the previous
+        section ended and bodies are sliced between headers, so the text is
+        never scanned character by character. Otherwise the section regex
+        parses it.
+
+        Args:
+            text: Anonymized version of the extracted text
+
+        Returns:
+            (slide number, is notes, body) per section
+        """
+        if not self._section_numbers:
+            return self._parse_sections(text)
+
+        header_starts = []
+        body_starts = []
+        pos = 0
+        for slide_number, notes in zip(self._section_numbers, self._section_notes):
+            header = _section_header(slide_number, notes)
+            header_start = text.find(header, pos)
+            if header_start < 0 or (header_starts and text[header_start - 2:header_start] != "\n\n"):
+                return self._parse_sections(text)
+            pos = header_start + len(header)
+            header_starts.append(header_start)
+            body_starts.append(pos)
+
+        # Each body ends at the blank line before the next header
+        body_ends = [header_start - 2 for header_start in header_starts[1:]] + [None]
+        sections = []
+        for slide_number, notes, body_start, body_end in zip(
+            self._section_numbers, self._section_notes, body_starts, body_ends
+        ):
+            if body_end is None:
+                body = text[body_start:].rstrip()
+            else:
+                body = text[body_start:body_end]
+            sections.append((str(slide_number), bool(notes), body))
+
+        return sections
+
+    @staticmethod
+    def _parse_sections(text: str) -> List[Tuple[str, bool, str]]:
+        """Split text into (slide number, is notes, body) sections by regex"""
+        return [
+            (match.group(1), bool(match.group(2)), match.group(3))
+            for match in _SECTION_RE.finditer(text)
+        ]
+
+    def _add_slide(self, presentation, body: str):
+        """
+        Add a Title and Content slide built from one section body.
+
+        Args:
+            presentation: Presentation being rebuilt
+            body: Section text; the first line becomes the title
+
+        Returns:
+            The new slide
+        """
+        content_lines = body.split("\n")
+
+        slide_layout = presentation.slide_layouts[1]  # Title and Content
+        slide = presentation.slides.add_slide(slide_layout)
+
+        # Add title (first line)
+        slide.shapes.title.text = content_lines[0]
+
+        # Add content (remaining lines)
+        if len(content_lines) > 1:
+            slide.placeholders[1].text = "\n".join(content_lines[1:])
+
+        return slide
+
+    def _attach_notes(self, slide, body: str):
+        """
+        Attach a notes section to its rebuilt slide.
+
+        Args:
+            slide: Rebuilt slide, or None if that slide had no content section
+            body: Notes text
+        """
+        if slide is not None:
+            slide.notes_slide.notes_text_frame.text = body
+
     def get_slide_count(self) -> int:
         """
         Get number of slides.
@@ -286,7 +476,7 @@ class PowerPointDocument(BaseDocument):
             Slide count
         """
         if hasattr(self, "_presentation") and self._presentation:
-            return len(self._presentation.slides)
+            return self._slide_count
         return 0
 
     def close(self):
@@ -9,9 +9,13 @@ Handles Word documents with:
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, NamedTuple, Optional, Tuple
+from array import array
 from datetime import datetime
 import io
+import os
+import posixpath
+import zipfile
 
 from .base import BaseDocument, DocumentFormat, DocumentMetadata
 from ..logging_config import get_logger
@@ -19,6 +23,192 @@ from ..exceptions import DocumentProcessingError
 
 logger = get_logger(__name__)
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:  # python-docx itself depends on lxml
+    etree = None
+    LXML_AVAILABLE = False
+
+# Section markers rebuild() turns back into tables or header/footer notes
+_SECTION_PREFIXES = ("[Table", "[Header]", "[Footer]")
+
+# Files at least this large are extracted by streaming word/document.xml
+# instead of loading the whole document tree with python-docx
+STREAMING_MIN_SIZE = 50 * 1024 * 1024
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_NS = {"w": _W}
+_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_W_BODY = f"{{{_W}}}body"
+_W_P = f"{{{_W}}}p"
+_W_R = f"{{{_W}}}r"
+_W_T = f"{{{_W}}}t"
+_W_BR = f"{{{_W}}}br"
+_W_HYPERLINK = f"{{{_W}}}hyperlink"
+_W_TBL = f"{{{_W}}}tbl"
+_W_SECTPR = f"{{{_W}}}sectPr"
+_W_TR = f"{{{_W}}}tr"
+_W_TC = f"{{{_W}}}tc"
+_W_TCW = f"{{{_W}}}tcW"
+_W_GRIDCOL = f"{{{_W}}}gridCol"
+_W_W = f"{{{_W}}}w"
+_W_TCPR = f"{{{_W}}}tcPr"
+_W_TRPR = f"{{{_W}}}trPr"
+_W_GRIDSPAN = f"{{{_W}}}gridSpan"
+_W_GRIDBEFORE = f"{{{_W}}}gridBefore"
+_W_VMERGE = f"{{{_W}}}vMerge"
+_W_VAL = f"{{{_W}}}val"
+_W_TYPE = f"{{{_W}}}type"
+_R_ID = f"{{{_R}}}id"
+
+# Text python-docx renders for run content elements other than w:t
+_RUN_CONTENT_TEXT = {
+    f"{{{_W}}}tab": "\t",
+    f"{{{_W}}}ptab": "\t",
+    f"{{{_W}}}cr": "\n",
+    f"{{{_W}}}noBreakHyphen": "-",
+}
+
+if LXML_AVAILABLE:
+    # libxml2 error codes raised only because a default safety limit was
+    # exceeded; older libxml2 versions instead suggest XML_PARSE_HUGE
+    _HUGE_XML_ERROR_CODES = frozenset(
+        (etree.ErrorTypes.ERR_RESOURCE_LIMIT, etree.ErrorTypes.ERR_NAME_TOO_LONG)
+    )
+    # Shared parser for parts we parse ourselves: no libxml2 size limits
+    # (large embedded attribute values), no ID table, no entity expansion
+    _XML_PARSER = etree.XMLParser(huge_tree=True, collect_ids=False, resolve_entities=False)
+    _BODY_PARAGRAPHS_XPATH = etree.XPath("./w:p", namespaces=_W_NS)
+    _BODY_TABLES_XPATH = etree.XPath("./w:tbl", namespaces=_W_NS)
+    _TABLE_ROWS_XPATH = etree.XPath("./w:tr", namespaces=_W_NS)
+    # Evaluated inside libxml2, without building python-docx proxies
+    _BODY_PARAGRAPH_COUNT_XPATH = etree.XPath("count(w:p)", namespaces=_W_NS)
+    _BODY_TABLE_COUNT_XPATH = etree.XPath("count(w:tbl)", namespaces=_W_NS)
+
+
+def _exceeds_parser_limits(error) -> bool:
+    """Whether an XMLSyntaxError was raised by a libxml2 size limit"""
+    # error_log can still hold entries from earlier parses; code and msg
+    # describe this error
+    return error.code in _HUGE_XML_ERROR_CODES or "XML_PARSE_HUGE" in error.msg
+
+
+def _run_text(r, parts: List[str]):
+    """Append the text of a <w:r> element's content to parts"""
+    for e in r:
+        tag = e.tag
+        if tag == _W_T:
+            parts.append(e.text or "")
+        elif tag == _W_BR:
+            # Line breaks only; page and column breaks render as nothing
+            if e.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_CONTENT_TEXT:
+            parts.append(_RUN_CONTENT_TEXT[tag])
+
+
+def _paragraph_text(p) -> str:
+    """Text of a <w:p> element, equivalent to python-docx Paragraph.text"""
+    # Runs directly in the paragraph and inside hyperlinks, in document order
+    parts = []
+    for child in p:
+        tag = child.tag
+        if tag == _W_R:
+            _run_text(child, parts)
+        elif tag == _W_HYPERLINK:
+            for r in child:
+                if r.tag == _W_R:
+                    _run_text(r, parts)
+    return "".join(parts)
+
+
+def _part_paragraph_texts(part) -> List[str]:
+    """Non-blank texts of the top-level paragraphs of a header/footer element"""
+    return [
+        para_text
+        for para_text in map(_paragraph_text, _BODY_PARAGRAPHS_XPATH(part))
+        if para_text.strip()
+    ]
+
+
+def _row_cell_texts(tr, above: Dict[int, str]) -> List[str]:
+    """
+    Stripped cell texts of a <w:tr>, equivalent to python-docx row.cells.
+
+    A cell spanning N grid columns repeats N times, and a vertically merged
+    continuation cell repeats the text of the cell above it. Children are
+    scanned directly rather than with per-cell path queries, which dominated
+    the cost of large tables.
+
+    Args:
+        tr: Table row element
+        above: Grid offset -> text of the previous row; replaced in place
+            by this row's mapping
+
+    Returns:
+        Stripped text per layout-grid cell
+    """
+    texts = []
+    row_map = {}
+    offset = 0
+
+    for tc in tr:
+        tag = tc.tag
+        if tag != _W_TC:
+            if tag == _W_TRPR:
+                for prop in tc:
+                    if prop.tag == _W_GRIDBEFORE:
+                        offset = int(prop.get(_W_VAL, 0))
+            continue
+
+        span = 1
+        continuation = False
+        paragraphs = []
+        for child in tc:
+            child_tag = child.tag
+            if child_tag == _W_P:
+                paragraphs.append(child)
+            elif child_tag == _W_TCPR:
+                for prop in child:
+                    if prop.tag == _W_GRIDSPAN:
+                        span = int(prop.get(_W_VAL, 1))
+                    elif prop.tag == _W_VMERGE:
+                        continuation = prop.get(_W_VAL, "continue") == "continue"
+
+        if continuation:
+            text = above.get(offset, "")
+        else:
+            text = "\n".join(map(_paragraph_text, paragraphs)).strip()
+
+        texts.extend([text] * span)
+        row_map[offset] = text
+        offset += span
+
+    above.clear()
+    above.update(row_map)
+    return texts
+
+
+def _table_text(tbl) -> str:
+    """Rows of a <w:tbl> with any non-empty cell, cells joined by " | " """
+    join = " | ".join
+    above = {}
+    return "\n".join(
+        join(row_texts)
+        for row_texts in (_row_cell_texts(tr, above) for tr in _TABLE_ROWS_XPATH(tbl))
+        if any(row_texts)
+    )
+
+
+class ParaRec(NamedTuple):
+    """Position of one extracted paragraph or table in the text parts"""
+
+    kind: str  # "paragraph" or "table"
+    text: str
+    index: int
+    table_idx: Optional[int] = None
+
 
 class WordDocument(BaseDocument):
     """
@@ -34,38 +224,72 @@ class WordDocument(BaseDocument):
     Note: Requires python-docx library.
     """
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, track_map: bool = False):
         """
         Initialize Word document handler.
 
         Args:
             file_path: Path to Word file
+            track_map: Record paragraphs_map on each extract_text() call
 
         Raises:
             DocumentProcessingError: If Word document can't be loaded
         """
         self._doc = None
-        self._paragraphs_map = []  # Track original paragraph structure
+        self._streaming = False  # Extract from the zip without loading _doc
+        self.track_map = track_map
+        # Original paragraph structure, one entry per extracted paragraph or
+        # table, kept as parallel columns (see paragraphs_map)
+        self._map_kind: List[str] = []
+        self._map_text: List[str] = []
+        self._map_index = array("i")
+        self._map_tbl = array("i")  # -1 for paragraphs
+        self._stat: Optional[os.stat_result] = None
+        self._counts: Optional[Tuple[int, int]] = None  # (paragraphs, tables)
 
         super().__init__(file_path)
 
         # Load document
         self._load_document()
+        # BaseDocument read the metadata before the document was loaded
+        self.metadata = self._extract_metadata()
 
     def _load_document(self):
         """Load Word document with python-docx"""
         try:
             from docx import Document
 
-            self._doc = Document(self.file_path)
+            if LXML_AVAILABLE and self._file_stat().st_size >= STREAMING_MIN_SIZE:
+                # Too large to hold as a tree: extract_text streams the XML
+                self._streaming = True
+                logger.info(
+                    f"Word document will be streamed",
+                    extra={"extra_fields": {"file_size": self._file_stat().st_size}},
+                )
+                return
 
+            try:
+                self._doc = Document(self.file_path)
+            except etree.XMLSyntaxError as e:
+                if not _exceeds_parser_limits(e):
+                    raise
+                # python-docx's parser keeps libxml2's size limits; the
+                # streaming path parses with huge_tree instead
+                self._streaming = True
+                logger.info(
+                    f"Word document exceeds parser limits, will be streamed",
+                    extra={"extra_fields": {"error": str(e)}},
+                )
+                return
+
+            paragraph_count, table_count = self._body_counts()
             logger.info(
                 f"Word document loaded successfully",
                 extra={
                     "extra_fields": {
-                        "paragraphs": len(self._doc.paragraphs),
-                        "tables": len(self._doc.tables),
-                        "file_size": self.get_file_size(),
+                        "paragraphs": paragraph_count,
+                        "tables": table_count,
+                        "file_size": self._file_stat().st_size,
                     }
                 },
             )
@@ -86,9 +310,48 @@ class WordDocument(BaseDocument):
         """Detect format (always WORD for this handler)"""
         return DocumentFormat.WORD
 
+    def _file_stat(self) -> os.stat_result:
+        """stat() the file once per handler"""
+        if self._stat is None:
+            self._stat = self.file_path.stat()
+        return self._stat
+
+    def _body_counts(self) -> Tuple[int, int]:
+        """
+        Count top-level body paragraphs and tables, as python-docx's
+        Document.paragraphs and Document.tables would, once per handler.
+
+        Streamed documents are counted by extract_text(), or by a counting
+        pass over word/document.xml when asked before extraction.
+
+        Returns:
+            (paragraph count, table count); (0, 0) when the document is closed
+        """
+        if self._counts is None:
+            if self._streaming:
+                self._counts = self._stream_body_counts()
+            elif not self._doc:
+                return 0, 0
+            else:
+                body = self._doc.element.body
+                self._counts = (
+                    int(_BODY_PARAGRAPH_COUNT_XPATH(body)),
+                    int(_BODY_TABLE_COUNT_XPATH(body)),
+                )
+        return self._counts
+
+    def get_file_size(self) -> int:
+        """
+        Get file size in bytes.
+
+        Returns:
+            File size in bytes
+        """
+        return self._file_stat().st_size
+
     def _extract_metadata(self) -> DocumentMetadata:
         """Extract Word document metadata"""
-        file_stats = self.file_path.stat()
+        file_stats = self._file_stat()
 
         # Extract document properties
         author = None
@@ -107,9 +370,12 @@ class WordDocument(BaseDocument):
         except Exception as e:
             logger.warning(f"Failed to extract Word metadata: {e}")
 
-        # Count paragraphs
-        paragraph_count = len(self._doc.paragraphs) if self._doc else 0
-        table_count = len(self._doc.tables) if self._doc else 0
+        # Count paragraphs; streamed documents are counted by extract_text
+        # rather than with an extra pass over the XML here
+        if self._streaming:
+            paragraph_count = table_count = None
+        else:
+            paragraph_count, table_count = self._body_counts()
 
         return DocumentMetadata(
             file_name=self.file_path.name,
@@ -142,52 +408,62 @@ class WordDocument(BaseDocument):
             DocumentProcessingError: If extraction fails
         """
         try:
-            text_parts = []
-
-            # Extract from paragraphs
-            logger.debug("Extracting text from paragraphs")
-            for para in self._doc.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
-                    self._paragraphs_map.append({
-                        "type": "paragraph",
-                        "text": para.text,
-                        "index": len(text_parts) - 1
-                    })
-
-            # Extract from tables
-            logger.debug(f"Extracting text from {len(self._doc.tables)} tables")
-            for table_idx, table in enumerate(self._doc.tables):
-                table_texts = []
-                for row in table.rows:
-                    row_texts = [cell.text.strip() for cell in row.cells]
-                    if any(row_texts):
-                        table_texts.append(" | ".join(row_texts))
-
-                if table_texts:
-                    table_text = "\n".join(table_texts)
-                    text_parts.append(f"[Table {table_idx + 1}]\n{table_text}")
-                    self._paragraphs_map.append({
-                        "type": "table",
-                        "text": table_text,
-                        "index": len(text_parts) - 1,
-                        "table_idx": table_idx
-                    })
-
-            # Extract from headers/footers
-            logger.debug("Extracting text from headers and footers")
-            for section in self._doc.sections:
-                # Header
-                if section.header:
-                    for para in section.header.paragraphs:
-                        if para.text.strip():
-                            text_parts.append(f"[Header] {para.text}")
-
-                # Footer
-                if section.footer:
-                    for para in section.footer.paragraphs:
-                        if para.text.strip():
-                            text_parts.append(f"[Footer] {para.text}")
+            if self._streaming:
+                paragraph_texts, table_texts, header_footer_texts = self._stream_document_xml()
+                self._counts = (len(paragraph_texts), len(table_texts))
+                self.metadata.custom["paragraphs"], self.metadata.custom["tables"] = self._counts
+            else:
+                # Sweep the body XML directly instead of building python-docx
+                # Paragraph/_Cell proxies, which re-walk runs on every .text
+                body = self._doc.element.body
+
+                logger.debug("Extracting text from paragraphs")
+                paragraph_texts = [_paragraph_text(p) for p in _BODY_PARAGRAPHS_XPATH(body)]
+
+                tables = _BODY_TABLES_XPATH(body)
+                logger.debug(f"Extracting text from {len(tables)} tables")
+                table_texts = [_table_text(tbl) for tbl in tables]
+
+                logger.debug("Extracting text from headers and footers")
+                header_footer_texts = []
+                # Sections usually share header/footer parts: read each part once
+                part_texts = {}
+                for section in self._doc.sections:
+                    # Header, then footer
+                    for part, label in ((section.header, "[Header]"), (section.footer, "[Footer]")):
+                        if part:
+                            element = part._element
+                            if element not in part_texts:
+                                part_texts[element] = _part_paragraph_texts(element)
+                            header_footer_texts.extend(
+                                f"{label} {para_text}" for para_text in part_texts[element]
+                            )
+
+            # Paragraphs
+            text_parts = [para_text for para_text in paragraph_texts if para_text.strip()]
+            paragraph_total = len(text_parts)
+
+            # Tables
+            tables_with_text = [
+                (table_idx, table_text)
+                for table_idx, table_text in enumerate(table_texts)
+                if table_text
+            ]
+            text_parts.extend(
+                "[Table %d]\n%s" % (table_idx + 1, table_text)
+                for table_idx, table_text in tables_with_text
+            )
+
+            if self.track_map:
+                self._map_kind = ["paragraph"] * paragraph_total + ["table"] * len(tables_with_text)
+                self._map_text = text_parts[:paragraph_total]
+                self._map_text.extend(table_text for _, table_text in tables_with_text)
+                self._map_index = array("i", range(len(text_parts)))
+                self._map_tbl = array("i", [-1]) * paragraph_total
+                self._map_tbl.extend(table_idx for table_idx, _ in tables_with_text)
+
+            # Headers/footers
+            text_parts.extend(header_footer_texts)
 
             full_text = "\n\n".join(text_parts)
 
@@ -195,9 +471,10 @@ class WordDocument(BaseDocument):
                 f"Text extraction completed",
                 extra={
                     "extra_fields": {
-                        "total_paragraphs": len(self._doc.paragraphs),
-                        "total_tables": len(self._doc.tables),
+                        "total_paragraphs": len(paragraph_texts),
+                        "total_tables": len(table_texts),
                         "total_length": len(full_text),
+                        "streaming": self._streaming,
                     }
                 },
             )
@@ -211,6 +488,129 @@ class WordDocument(BaseDocument):
                 {"file_path": str(self.file_path)}
             )
 
+    def _stream_document_xml(self):
+        """
+        Extract body and header/footer text without building the document tree.
+
+        word/document.xml is read with iterparse. Each top-level paragraph or
+        table is turned into text as soon as it is complete and then cleared,
+        so peak memory is one block rather than the whole document. Header
+        and footer parts are small and parsed whole.
+
+        Returns:
+            (paragraph texts, table texts, "[Header]"/"[Footer]" lines), in
+            the same layout extract_text produces from the loaded document
+        """
+        paragraph_texts = []
+        table_texts = []
+        # Default header/footer relationship ids per section; a section
+        # without its own reference inherits the previous section's
+        section_refs = []
+        current_refs = {"header": None, "footer": None}
+
+        with zipfile.ZipFile(self.file_path) as zf:
+            with zf.open("word/document.xml") as stream:
+                for _, elem in etree.iterparse(
+                    stream,
+                    events=("end",),
+                    tag=(_W_P, _W_TBL, _W_SECTPR),
+                    huge_tree=True,
+                    resolve_entities=False,
+                ):
+                    if elem.tag == _W_SECTPR:
+                        for kind in ("header", "footer"):
+                            ref = elem.find(f"w:{kind}Reference[@w:type='default']", _W_NS)
+                            if ref is not None:
+                                current_refs[kind] = ref.get(_R_ID)
+                        section_refs.append(dict(current_refs))
+                        continue
+
+                    parent = elem.getparent()
+                    if parent is None or parent.tag != _W_BODY:
+                        # Nested in a table cell: handled with its table
+                        continue
+
+                    if elem.tag == _W_P:
+                        paragraph_texts.append(_paragraph_text(elem))
+                    else:
+                        table_texts.append(_table_text(elem))
+
+                    # Free the finished block and everything before it
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+            header_footer_texts = self._stream_header_footer_texts(zf, section_refs)
+
+        return paragraph_texts, table_texts, header_footer_texts
+
+    def _stream_body_counts(self) -> Tuple[int, int]:
+        """
+        Count top-level body paragraphs and tables by streaming word/document.xml.
+
+        Returns:
+            (paragraph count, table count)
+        """
+        paragraph_count = table_count = 0
+
+        with zipfile.ZipFile(self.file_path) as zf:
+            with zf.open("word/document.xml") as stream:
+                for _, elem in etree.iterparse(
+                    stream,
+                    events=("end",),
+                    tag=(_W_P, _W_TBL),
+                    huge_tree=True,
+                    resolve_entities=False,
+                ):
+                    parent = elem.getparent()
+                    if parent is None or parent.tag != _W_BODY:
+                        continue
+
+                    if elem.tag == _W_P:
+                        paragraph_count += 1
+                    else:
+                        table_count += 1
+
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+        return paragraph_count, table_count
+
+    @staticmethod
+    def _stream_header_footer_texts(zf: zipfile.ZipFile, section_refs: List[Dict[str, Optional[str]]]) -> List[str]:
+        """
+        Read header/footer paragraphs for each section from their parts.
+
+        Args:
+            zf: Open .docx archive
+            section_refs: Per section, default header and footer relationship ids
+
+        Returns:
+            "[Header] ..." / "[Footer] ..." lines in section order
+        """
+        if not any(ref for refs in section_refs for ref in refs.values()):
+            return []
+
+        rels = etree.fromstring(zf.read("word/_rels/document.xml.rels"), _XML_PARSER)
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels}
+
+        texts = []
+        part_texts = {}  # Parse each shared part once
+        for refs in section_refs:
+            for kind, label in (("header", "[Header]"), ("footer", "[Footer]")):
+                target = targets.get(refs[kind])
+                if target is None:
+                    continue
+                if target not in part_texts:
+                    part = etree.fromstring(
+                        zf.read(posixpath.normpath(posixpath.join("word", target))), _XML_PARSER
+                    )
+                    part_texts[target] = _part_paragraph_texts(part)
+                texts.extend(f"{label} {para_text}" for para_text in part_texts[target])
+
+        return texts
+
     def rebuild(self, anonymized_text: str, detections: List[Dict[str, Any]], mode: str = "redact") -> bytes:
         """
         Rebuild Word document with anonymized content.
@@ -225,9 +625,37 @@ class WordDocument(BaseDocument):
         Returns:
             Word document bytes
         """
+        buffer = io.BytesIO()
+        self.rebuild_to(buffer, anonymized_text, detections, mode=mode)
+        # BytesIO hands over its internal bytes object when nothing else
+        # references the buffer, so this does not copy the document
+        doc_bytes = buffer.getvalue()
+        buffer.close()
+
+        logger.info(
+            "Word document rebuilt successfully",
+            extra={"extra_fields": {"output_size": len(doc_bytes)}},
+        )
+
+        return doc_bytes
+
+    def rebuild_to(
+        self,
+        out: BinaryIO,
+        anonymized_text: str,
+        detections: List[Dict[str, Any]],
+        mode: str = "redact",
+    ):
+        """
+        Rebuild Word document with anonymized content into a file object.
+
+        Args:
+            out: Writable binary file object
+            anonymized_text: Anonymized text
+            detections: List of detections (for reference)
+        """
         try:
             from docx import Document
-            from docx.shared import Pt
 
             logger.info("Rebuilding Word document with anonymized content")
 
@@ -242,57 +670,31 @@ class WordDocument(BaseDocument):
             except Exception as e:
                 logger.debug(f"Could not copy styles: {e}")
 
-            # Split anonymized text back into sections
-            sections = anonymized_text.split("\n\n")
+            builders = {
+                "Table": self._add_table_section,
+                "Header": self._add_note_paragraph,
+                "Footer": self._add_note_paragraph,
+            }
+            add_paragraph = new_doc.add_paragraph
 
-            for section in sections:
+            # Split anonymized text back into sections
+            for section in anonymized_text.split("\n\n"):
                 if not section.strip():
                     continue
 
-                # Check if it's a table section
-                if section.startswith("[Table"):
-                    # Extract table content
-                    lines = section.split("\n")[1:]  # Skip [Table N] line
-                    if lines:
-                        # Create table
-                        rows = [line.split(" | ") for line in lines if line.strip()]
-                        if rows:
-                            max_cols = max(len(row) for row in rows)
-                            table = new_doc.add_table(rows=len(rows), cols=max_cols)
-                            table.style = 'Table Grid'
-
-                            for i, row_data in enumerate(rows):
-                                for j, cell_text in enumerate(row_data):
-                                    table.rows[i].cells[j].text = cell_text
-
-                elif section.startswith("[Header]"):
-                    # Add as paragraph with note
-                    para = new_doc.add_paragraph(section)
-                    para.runs[0].font.size = Pt(10)
-                    para.runs[0].italic = True
-
-                elif section.startswith("[Footer]"):
-                    # Add as paragraph with note
-                    para = new_doc.add_paragraph(section)
-                    para.runs[0].font.size = Pt(10)
-                    para.runs[0].italic = True
+                builder = None
+                if section.startswith(_SECTION_PREFIXES):
+                    # "[Table 3]" -> "Table", "[Header]" -> "Header"
+                    kind = section[1:section.find("]")].partition(" ")[0]
+                    builder = builders.get(kind)
 
-                else:
+                if builder is None:
                     # Regular paragraph
-                    new_doc.add_paragraph(section)
-
-            # Save to bytes
-            buffer = io.BytesIO()
-            new_doc.save(buffer)
-            doc_bytes = buffer.getvalue()
-            buffer.close()
-
-            logger.info(
-                "Word document rebuilt successfully",
-                extra={"extra_fields": {"output_size": len(doc_bytes)}},
-            )
+                    add_paragraph(section)
+                else:
+                    builder(new_doc, section)
 
-            return doc_bytes
+            new_doc.save(out)
 
         except Exception as e:
             logger.error(f"Word document rebuild failed: {e}", exc_info=True)
@@ -301,6 +703,71 @@ class WordDocument(BaseDocument):
                 {"file_path": str(self.file_path)}
             )
 
+    @classmethod
+    def _add_table_section(cls, new_doc, section: str):
+        """Add a "[Table N]" section as a table, one row per line."""
+        lines = section.split("\n")[1:]  # Skip [Table N] line
+        rows = [line.split(" | ") for line in lines if line.strip()]
+        if rows:
+            cls._add_table(new_doc, rows)
+
+    @staticmethod
+    def _add_note_paragraph(new_doc, section: str):
+        """Add a header/footer section as a small italic paragraph."""
+        from docx.shared import Pt
+
+        para = new_doc.add_paragraph(section)
+        para.runs[0].font.size = Pt(10)
+        para.runs[0].italic = True
+
+    @staticmethod
+    def _add_table(new_doc, rows: List[List[str]]):
+        """
+        Append a 'Table Grid' table holding rows of cell texts.
+
+        Rows are built as <w:tr>/<w:tc> elements directly rather than through
+        python-docx's cell proxies, where each table.rows[i].cells[j] access
+        re-enumerates the table and each .text assignment rewrites the cell.
+
+        Args:
+            new_doc: python-docx Document being rebuilt
+            rows: Cell texts per row; short rows are padded with empty cells
+        """
+        max_cols = max(len(row) for row in rows)
+        table = new_doc.add_table(rows=0, cols=max_cols)
+        table.style = 'Table Grid'
+
+        tbl = table._tbl
+        widths = [grid_col.get(_W_W) for grid_col in tbl.tblGrid.iterchildren(_W_GRIDCOL)]
+
+        for row_data in rows:
+            tr = etree.SubElement(tbl, _W_TR)
+            for j in range(max_cols):
+                tc = etree.SubElement(tr, _W_TC)
+                tc_pr = etree.SubElement(tc, _W_TCPR)
+                etree.SubElement(tc_pr, _W_TCW, {_W_TYPE: "dxa", _W_W: widths[j]})
+                p = etree.SubElement(tc, _W_P)
+                if j < len(row_data) and row_data[j]:
+                    # python-docx's run text setter maps tabs and newlines
+                    etree.SubElement(p, _W_R).text = row_data[j]
+
+    @property
+    def paragraphs_map(self) -> List[ParaRec]:
+        """
+        Paragraph structure recorded by the last extract_text() call.
+
+        Only recorded for handlers created with track_map=True.
+
+        Returns:
+            One ParaRec per extracted paragraph or table, in text order
+        """
+        return [
+            ParaRec(kind, text, index, None if table_idx < 0 else table_idx)
+            for kind, text, index, table_idx in zip(
+                self._map_kind, self._map_text, self._map_index, self._map_tbl
+            )
+        ]
+
     def get_paragraph_count(self) -> int:
         """
         Get number of paragraphs.
@@ -308,9 +775,7 @@ class WordDocument(BaseDocument):
         Returns:
             Paragraph count
         """
-        if hasattr(self, "_doc") and self._doc:
-            return len(self._doc.paragraphs)
-        return 0
+        return self._body_counts()[0]
 
     def get_table_count(self) -> int:
         """
@@ -319,14 +784,13 @@ class WordDocument(BaseDocument):
         Returns:
             Table count
         """
-        if hasattr(self, "_doc") and self._doc:
-            return len(self._doc.tables)
-        return 0
+        return self._body_counts()[1]
 
     def close(self):
         """Close document resources"""
         if hasattr(self, "_doc"):
             self._doc = None
+            self._counts = None
             logger.debug("Word document closed")
 
     def __del__(self):
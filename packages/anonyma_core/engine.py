@@ -1,4 +1,14 @@
 from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import hashlib
+import logging
+import os
+import re
+import secrets
+import threading
+from .detectors._shared import shared_detector
 from .modes import AnonymizationMode, AnonymizationResult
 from .modes.redactor import Redactor
 from .modes.substitutor import Substitutor
@@ -7,30 +17,77 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Modes whose output depends only on the input; SUBSTITUTE draws fresh fakes
+_CACHEABLE_MODES = (AnonymizationMode.REDACT, AnonymizationMode.VISUAL_REDACT)
+
+# Results kept per engine when result caching is enabled
+RESULT_CACHE_SIZE = 128
+
+# Detection lists kept per engine when detection caching is enabled
+DETECTION_CACHE_SIZE = 256
+
+# Blank lines (possibly holding whitespace) separating paragraphs
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# Smaller batches are anonymized in-process; a pool costs more than it saves
+PARALLEL_BATCH_MIN_TEXTS = 8
+
+# Engine owned by each anonymize_batch worker process (see _init_batch_worker)
+_worker_engine: Optional["AnonymaEngine"] = None
+
+
+def _text_digest(text: str) -> bytes:
+    """Cache key for a text, so caches do not hold a second copy of it"""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _init_batch_worker(
+    use_flair: bool, redaction_char: str, fast_mode: bool, redaction_symbol: str
+):
+    """Process pool initializer: build one engine per worker process."""
+    global _worker_engine
+    _worker_engine = AnonymaEngine(use_flair=use_flair)
+    # Carry over the calling engine's mode settings
+    _worker_engine.redactor.redaction_char = redaction_char
+    _worker_engine.substitutor.fast_mode = fast_mode
+    _worker_engine.visual_redactor.redaction_symbol = redaction_symbol
+
+
+def _anonymize_in_worker(text: str, mode: AnonymizationMode, language: str) -> AnonymizationResult:
+    """Process pool task: anonymize one text with the worker's engine"""
+    return _worker_engine._anonymize(text, mode, language)
+
 
 class AnonymaEngine:
     """Main Anonymization Engine with Flair Detection"""
 
-    def __init__(self, use_flair: bool = True):
+    def __init__(
+        self,
+        use_flair: bool = True,
+        cache_results: bool = False,
+        cache_detections: bool = False
+    ):
+        """
+        Args:
+            use_flair: Use the Flair detector, falling back to the basic one
+            cache_results: Reuse results for repeated (text, mode, language)
+                inputs in the deterministic REDACT and VISUAL_REDACT modes
+            cache_detections: Reuse detections for repeated (text, language)
+                inputs in every mode, including SUBSTITUTE
+        """
         logger.info("Initializing Anonyma Engine", extra={"extra_fields": {"use_flair": use_flair}})
 
-        if use_flair:
-            try:
-                from .detectors.flair_detector import FlairPIIDetector
-                self.detector = FlairPIIDetector()
-                logger.info("Using Flair detector (ultra-accurate)")
-            except Exception as e:
-                logger.warning(
-                    "Flair detector initialization failed, falling back to basic detector",
-                    extra={"extra_fields": {"error": str(e)}}
-                )
-                from .detectors.pii_detector import PIIDetector
-                self.detector = PIIDetector()
-        else:
-            from .detectors.pii_detector import PIIDetector
-            self.detector = PIIDetector()
-            logger.info("Using basic PII detector")
+        self.use_flair = use_flair
+        self._result_cache: Optional["OrderedDict[tuple, AnonymizationResult]"] = (
+            OrderedDict() if cache_results else None
+        )
+        self._result_cache_lock = threading.Lock()
+        self._detection_cache: Optional["OrderedDict[tuple, List[Dict[str, Any]]]"] = (
+            OrderedDict() if cache_detections else None
+        )
+        self._detection_cache_lock = threading.Lock()
 
+        self.detector = shared_detector(use_flair)
         self.redactor = Redactor()
         self.substitutor = Substitutor()
         self.visual_redactor = VisualRedactor()
@@ -53,12 +110,263 @@ class AnonymaEngine:
             }}
         )
 
-        # 1. Detect PII con Flair
-        detections = self.detector.detect(text, language)
-        logger.debug(
-            "Detection phase completed",
-            extra={"extra_fields": {"detections_found": len(detections)}}
+        if self._result_cache is None or mode not in _CACHEABLE_MODES:
+            return self._anonymize(text, mode, language)
+
+        key = (_text_digest(text), mode, language)
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+        if result is not None:
+            logger.info("Anonymization result served from cache")
+            return result
+
+        result = self._anonymize(text, mode, language)
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def detect_batch(
+        self,
+        texts: List[str],
+        language: str = 'it'
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Detect PII in several texts with one batched model call.
+
+        Detectors with a detect_batch() method (Flair, Presidio) tag all the
+        texts in mini-batches; others are called once per text.
+
+        Args:
+            texts: Texts to analyze
+            language: Language code for detection
+
+        Returns:
+            Detections per input text, in input order
+        """
+        if self._detection_cache is None:
+            return self._detect_uncached(texts, language)
+
+        keys = [(_text_digest(text), language) for text in texts]
+        results = [self._cached_detections(key) for key in keys]
+
+        missing = [i for i, detections in enumerate(results) if detections is None]
+        if missing:
+            fresh = self._detect_uncached([texts[i] for i in missing], language)
+            for i, detections in zip(missing, fresh):
+                self._store_detections(keys[i], detections)
+                results[i] = detections
+
+        return results
+
+    def detect_paragraphs(
+        self,
+        text: str,
+        language: str = 'it',
+        max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect PII in a long text one paragraph at a time.
+
+        Paragraphs (split on blank lines) go through detect_batch() when the
+        detector batches, so they share padded forward passes, or else run
+        on a thread pool. Repeated paragraphs hit the detection cache when
+        it is enabled. Entities spanning a blank line are not detected.
+
+        Args:
+            text: Text to analyze
+            language: Language code for detection
+            max_workers: Threads for detectors without detect_batch()
+
+        Returns:
+            Detections with offsets into text, in paragraph order
+        """
+        spans = []
+        start = 0
+        for match in _PARAGRAPH_BREAK.finditer(text):
+            if match.start() > start:
+                spans.append((start, match.start()))
+            start = match.end()
+        if start < len(text):
+            spans.append((start, len(text)))
+
+        paragraphs = [text[a:b] for a, b in spans]
+        if hasattr(self.detector, "detect_batch") or len(paragraphs) < 2:
+            per_paragraph = self.detect_batch(paragraphs, language)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(paragraphs)),
+                thread_name_prefix="anonyma-detect"
+            ) as executor:
+                per_paragraph = list(
+                    executor.map(partial(self._detect, language=language), paragraphs)
+                )
+
+        # Fresh dicts: cached detections are shared and must not be shifted in place
+        detections = []
+        for (offset, _), paragraph_detections in zip(spans, per_paragraph):
+            for detection in paragraph_detections:
+                detections.append({
+                    **detection,
+                    'start': detection['start'] + offset,
+                    'end': detection['end'] + offset
+                })
+        return detections
+
+    def _detect_uncached(self, texts: List[str], language: str) -> List[List[Dict[str, Any]]]:
+        """Run the detector on texts, batched when it supports it"""
+        detect_batch = getattr(self.detector, "detect_batch", None)
+        if detect_batch is not None:
+            return detect_batch(texts, language)
+        return [self.detector.detect(text, language) for text in texts]
+
+    def _detect(self, text: str, language: str) -> List[Dict[str, Any]]:
+        """Detect PII in one text, through the detection cache when enabled"""
+        if self._detection_cache is None:
+            return self.detector.detect(text, language)
+
+        key = (_text_digest(text), language)
+        detections = self._cached_detections(key)
+        if detections is None:
+            detections = self.detector.detect(text, language)
+            self._store_detections(key, detections)
+        return detections
+
+    def _cached_detections(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """Copy of the cached detection list for key, or None on a miss"""
+        with self._detection_cache_lock:
+            detections = self._detection_cache.get(key)
+            if detections is None:
+                return None
+            self._detection_cache.move_to_end(key)
+        return list(detections)
+
+    def _store_detections(self, key: tuple, detections: List[Dict[str, Any]]):
+        """Remember detections for key, evicting the least recently used"""
+        with self._detection_cache_lock:
+            self._detection_cache[key] = list(detections)
+            if len(self._detection_cache) > DETECTION_CACHE_SIZE:
+                self._detection_cache.popitem(last=False)
+
+    def anonymize_batch(
+        self,
+        texts: List[str],
+        mode: AnonymizationMode,
+        language: str = 'it',
+        max_workers: Optional[int] = None
+    ) -> List[AnonymizationResult]:
+        """
+        Anonymize several independent texts.
+
+        REDACT and VISUAL_REDACT batches of at least PARALLEL_BATCH_MIN_TEXTS
+        texts are spread over a process pool, since detection and redaction
+        are CPU-bound and hold the GIL. SUBSTITUTE always runs here: forked
+        workers would share the Faker random state and draw the same fakes.
+        Workers rebuild the default detector for use_flair and copy this
+        engine's mode settings, so engines with a replaced detector or mode
+        object, or with result/detection caching, also stay here.
+        In-process batches detect all texts with one detect_batch() call.
+
+        Args:
+            texts: Texts to anonymize
+            mode: Anonymization mode to use
+            language: Language code for detection
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            AnonymizationResult per input text, in input order
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(texts))
+        if (
+            workers < 2
+            or len(texts) < PARALLEL_BATCH_MIN_TEXTS
+            or mode not in _CACHEABLE_MODES
+            or not self._pool_compatible()
+        ):
+            # One batched detector call, then the mode per text
+            return [
+                self._apply_mode(text, detections, mode)
+                for text, detections in zip(texts, self.detect_batch(texts, language))
+            ]
+
+        logger.info(
+            "Starting parallel batch anonymization",
+            extra={"extra_fields": {
+                "texts": len(texts),
+                "workers": workers,
+                "mode": mode.value
+            }}
         )
+
+        count = len(texts)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(
+                self.use_flair,
+                self.redactor.redaction_char,
+                self.substitutor.fast_mode,
+                self.visual_redactor.redaction_symbol,
+            ),
+        ) as executor:
+            return list(
+                executor.map(
+                    _anonymize_in_worker,
+                    texts,
+                    [mode] * count,
+                    [language] * count,
+                    chunksize=max(1, count // (4 * workers)),
+                )
+            )
+
+    def _pool_compatible(self) -> bool:
+        """Whether a pool worker's fresh engine would give this engine's results"""
+        return (
+            self._result_cache is None
+            and self._detection_cache is None
+            and self.detector is shared_detector(self.use_flair)
+            and type(self.redactor) is Redactor
+            and type(self.substitutor) is Substitutor
+            and type(self.visual_redactor) is VisualRedactor
+        )
+
+    def _anonymize(
+        self,
+        text: str,
+        mode: AnonymizationMode,
+        language: str
+    ) -> AnonymizationResult:
+        """Detect PII in text and apply the mode, without the result cache"""
+        # 1. Detect PII con Flair
+        return self._apply_mode(text, self._detect(text, language), mode)
+
+    def _apply_mode(
+        self,
+        text: str,
+        detections: List[Dict[str, Any]],
+        mode: AnonymizationMode
+    ) -> AnonymizationResult:
+        """Anonymize text given its detections"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Detection phase completed",
+                extra={"extra_fields": {"detections_found": len(detections)}}
+            )
+
+        # Nothing detected: every mode would hand the text back unchanged
+        if not detections and isinstance(mode, AnonymizationMode):
+            logger.info("Anonymization skipped, no PII detected")
+            substitute = mode == AnonymizationMode.SUBSTITUTE
+            return AnonymizationResult(
+                anonymized_text=text,
+                original_text=text,
+                mode=mode,
+                mapping={} if substitute else None,
+                reverse_key=secrets.token_hex(16) if substitute else None
+            )
         
         # 2. Apply anonymization based on mode
         if mode == AnonymizationMode.REDACT:
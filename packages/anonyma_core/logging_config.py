@@ -10,19 +10,40 @@ Provides a centralized, production-ready logging system with:
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 import json
-from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: dict) -> str:
+    """Serialize a log record dict, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass  # e.g. non-str keys in extra_fields: json.dumps coerces them
+    return json.dumps(data)
 
 
 class JSONFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging"""
 
+    # UTC ISO-8601 timestamps from record.created, e.g. 2024-01-31T09:15:02.123Z
+    converter = time.gmtime
+    default_time_format = "%Y-%m-%dT%H:%M:%S"
+    default_msec_format = "%s.%03dZ"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self.formatTime(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -39,7 +60,7 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 def setup_logging(
@@ -7,6 +7,15 @@ class AnonymizationMode(str, Enum):
     VISUAL_REDACT = "visual_redact"
 
 class AnonymizationResult:
+    __slots__ = (
+        "anonymized_text",
+        "original_text",
+        "mode",
+        "mapping",
+        "reverse_key",
+        "detections_count",
+    )
+
     def __init__(
         self,
         anonymized_text: str,
@@ -22,7 +31,7 @@ class AnonymizationResult:
         self.mapping = mapping
         self.reverse_key = reverse_key
         self.detections_count = detections_count  # ← E questo attributo
-        
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "anonymized_text": self.anonymized_text,
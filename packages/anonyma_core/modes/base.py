@@ -6,11 +6,102 @@ ensuring consistency across different anonymization strategies.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Tuple, Optional
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Fetches every key a detection must have in one call; KeyError if one is missing
+_REQUIRED_DETECTION_KEYS = itemgetter("entity_type", "start", "end", "text", "confidence")
+_SPAN = itemgetter("start", "end")
+
+
+def merge_spans(
+    spans: Iterable[Tuple[int, int, Any]], adjacent: bool = False
+) -> List[Tuple[int, int, Any]]:
+    """
+    Sort spans by start and merge overlapping ones.
+
+    A merged span covers the union of its members and keeps the payload of
+    the member that starts first, so overlapping detections are replaced
+    as one and no part of either is left in clear.
+
+    Args:
+        spans: (start, end, payload) tuples in any order
+        adjacent: Also merge spans that touch (one ends where the next
+            starts); only safe when the replacement depends on length alone
+
+    Returns:
+        Non-overlapping (start, end, payload) tuples in text order
+    """
+    merged: List[Tuple[int, int, Any]] = []
+    for start, end, payload in sorted(spans, key=itemgetter(0)):
+        if merged and (start <= merged[-1][1] if adjacent else start < merged[-1][1]):
+            last_start, last_end, last_payload = merged[-1]
+            if end > last_end:
+                merged[-1] = (last_start, end, last_payload)
+        else:
+            merged.append((start, end, payload))
+    return merged
+
+
+def merge_intervals(
+    detections: Iterable[Dict[str, Any]], adjacent: bool = False
+) -> Tuple[List[int], List[int]]:
+    """
+    Merge detection spans into parallel start/end lists.
+
+    Same merge as merge_spans(), for modes that need no per-span payload.
+
+    Args:
+        detections: Detections with "start" and "end" keys, in any order
+        adjacent: Also merge spans that touch
+
+    Returns:
+        (starts, ends) of the non-overlapping spans in text order
+    """
+    merged = merge_spans(
+        ((start, end, None) for start, end in map(_SPAN, detections)), adjacent=adjacent
+    )
+    return [span[0] for span in merged], [span[1] for span in merged]
+
+
+def clear_slices(text: str, starts: List[int], ends: List[int]) -> List[str]:
+    """
+    Slice the text around merged spans.
+
+    Args:
+        text: Original text
+        starts: Span starts from merge_intervals()
+        ends: Span ends from merge_intervals()
+
+    Returns:
+        len(starts) + 1 slices: before the first span, between spans, after the last
+    """
+    return [text[a:b] for a, b in zip([0] + ends, starts + [len(text)])]
+
+
+def splice(text: str, replacements: Iterable[Tuple[int, int, str]]) -> str:
+    """
+    Replace spans of text in a single pass.
+
+    Args:
+        text: Original text
+        replacements: Non-overlapping (start, end, replacement) tuples in text order
+
+    Returns:
+        Text with every span replaced, built with one join
+    """
+    parts = []
+    cursor = 0
+    for start, end, replacement in replacements:
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
 
 class BaseAnonymizationMode(ABC):
     """
@@ -78,10 +169,10 @@ class BaseAnonymizationMode(ABC):
         Returns:
             True if valid, False otherwise
         """
-        required_keys = {"entity_type", "start", "end", "text", "confidence"}
-
         for detection in detections:
-            if not all(key in detection for key in required_keys):
+            try:
+                start, end = _REQUIRED_DETECTION_KEYS(detection)[1:3]
+            except KeyError:
                 logger.warning(
                     f"Invalid detection format: missing keys",
                     extra={"extra_fields": {"detection": detection}},
@@ -89,13 +180,13 @@ class BaseAnonymizationMode(ABC):
                 return False
 
             # Validate position sanity
-            if detection["start"] < 0 or detection["end"] <= detection["start"]:
+            if start < 0 or end <= start:
                 logger.warning(
                     f"Invalid detection positions",
                     extra={
                         "extra_fields": {
-                            "start": detection["start"],
-                            "end": detection["end"],
+                            "start": start,
+                            "end": end,
                         }
                     },
                 )
@@ -1,48 +1,99 @@
-from typing import List, Dict, Any, Tuple
+from typing import Callable, List, Dict, Any, Tuple
+from functools import cached_property, lru_cache, partial
 from faker import Faker
-import uuid
+import random
+import secrets
+import string
+from .base import merge_spans, splice
+
+
+@lru_cache(maxsize=None)
+def _get_faker(locale: str) -> Faker:
+    """One Faker per locale for the process: loading providers is slow"""
+    return Faker(locale)
+
+
+# Values pre-generated per provider for fast_mode substitutions
+FAST_POOL_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _fake_pool(locale: str, provider: str) -> Tuple[str, ...]:
+    """FAST_POOL_SIZE values drawn once from a Faker provider"""
+    generate = getattr(_get_faker(locale), provider)
+    return tuple(generate() for _ in range(FAST_POOL_SIZE))
+
 
 class Substitutor:
-    def __init__(self):
-        self.faker_it = Faker('it_IT')
-        self.faker_en = Faker('en_US')
-        
-        self.substitution_map = {
-            'PERSON': lambda: self.faker_it.name(),
-            'PHONE_NUMBER': lambda: self.faker_it.phone_number(),
-            'EMAIL_ADDRESS': lambda: self.faker_it.email(),
-            'LOCATION': lambda: self.faker_it.city(),
-            'CODICE_FISCALE': lambda: self._generate_fake_cf(),
+    def __init__(self, fast_mode: bool = False):
+        """
+        Args:
+            fast_mode: Draw names, emails and cities from pools of
+                FAST_POOL_SIZE pre-generated values instead of calling Faker
+                for every substitution (faster, fewer distinct values)
+        """
+        self.fast_mode = fast_mode
+
+    # Faker locales and the generator map are resolved on first use, so
+    # creating a Substitutor loads no provider data
+    @cached_property
+    def faker_it(self) -> Faker:
+        return _get_faker('it_IT')
+
+    @cached_property
+    def faker_en(self) -> Faker:
+        return _get_faker('en_US')
+
+    @cached_property
+    def substitution_map(self) -> Dict[str, Callable[[], str]]:
+        substitution_map = {
+            'PERSON': self.faker_it.name,
+            'PHONE_NUMBER': self.faker_it.phone_number,
+            'EMAIL_ADDRESS': self.faker_it.email,
+            'LOCATION': self.faker_it.city,
+            'CODICE_FISCALE': self._generate_fake_cf,
             'PARTITA_IVA': lambda: f"{self.faker_it.random_int(10000000000, 99999999999)}",
         }
+        if self.fast_mode:
+            for entity_type, provider in (('PERSON', 'name'), ('EMAIL_ADDRESS', 'email'), ('LOCATION', 'city')):
+                substitution_map[entity_type] = partial(random.choice, _fake_pool('it_IT', provider))
+        return substitution_map
     
     def anonymize(self, text: str, detections: List[Dict[str, Any]]) -> Tuple[str, Dict[str, str], str]:
         """Modalità 2: Sostituisce con dati fake + mappa di reversibilità"""
-        # Sort detections by start position (reverse order)
-        sorted_detections = sorted(detections, key=lambda x: x['start'], reverse=True)
-        
-        result = text
+        # Overlapping detections are replaced as one span, so only the merged
+        # spans get a replacement and a mapping entry
+        merged = merge_spans(
+            (detection['start'], detection['end'], detection) for detection in detections
+        )
+
         mapping = {}
-        reverse_key = str(uuid.uuid4())
-        
-        for i, detection in enumerate(sorted_detections):
-            start = detection['start']
-            end = detection['end']
+        reverse_key = secrets.token_hex(16)
+        replacements = []
+
+        # Keys are numbered from the end of the text, as before merging
+        for i, (start, end, detection) in enumerate(reversed(merged)):
             entity_type = detection['entity_type']
             original_value = detection['text']
-            
+            if (start, end) != (detection['start'], detection['end']):
+                # Span grown by merging: it replaces more than this detection
+                original_value = text[start:end]
+
             # Generate replacement
             replacement = self._get_replacement(entity_type, original_value)
-            
+
             # Create mapping key
             mapping_key = f"{entity_type}_{i}"
             mapping[mapping_key] = original_value
-            
-            # Replace in text
-            result = result[:start] + replacement + result[end:]
-        
+
+            replacements.append((start, end, replacement))
+
+        # Replace in text, all spans in one pass
+        replacements.reverse()
+        result = splice(text, replacements)
+
         return result, mapping, reverse_key
-    
+
     def _get_replacement(self, entity_type: str, original_value: str) -> str:
         """Genera sostituzione appropriata per il tipo di entità"""
         if entity_type in self.substitution_map:
@@ -53,16 +104,8 @@ class Substitutor:
     
     def _generate_fake_cf(self) -> str:
         """Genera un codice fiscale fake ma realistico"""
-        import random
-        import string
-        
-        # Simplified fake CF generator
-        letters = ''.join(random.choices(string.ascii_uppercase, k=6))
-        numbers = ''.join(random.choices(string.digits, k=2))
-        letter = random.choice(string.ascii_uppercase)
-        more_numbers = ''.join(random.choices(string.digits, k=2))
-        more_letter = random.choice(string.ascii_uppercase)
-        final_numbers = ''.join(random.choices(string.digits, k=3))
-        final_letter = random.choice(string.ascii_uppercase)
+        # Simplified fake CF: LLLLLL DD L DD L DDD L, drawn in two RNG calls
+        letters = random.choices(string.ascii_uppercase, k=9)
+        digits = random.choices(string.digits, k=7)
         
-        return f"{letters}{numbers}{letter}{more_numbers}{more_letter}{final_numbers}{final_letter}"
\ No newline at end of file
+        return "".join((*letters[:6], *digits[:2], letters[6], *digits[2:4], letters[7], *digits[4:], letters[8]))
\ No newline at end of file
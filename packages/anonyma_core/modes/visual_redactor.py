@@ -1,4 +1,5 @@
 from typing import List, Dict, Any
+from .base import clear_slices, merge_intervals
 
 class VisualRedactor:
     def __init__(self):
@@ -6,15 +7,7 @@ class VisualRedactor:
     
     def anonymize(self, text: str, detections: List[Dict[str, Any]]) -> str:
         """Modalità 3: Redazione visiva irrecuperabile"""
-        # Sort detections by start position (reverse order)
-        sorted_detections = sorted(detections, key=lambda x: x['start'], reverse=True)
-        
-        result = text
-        for detection in sorted_detections:
-            start = detection['start']
-            end = detection['end']
-            
-            # Replace with fixed visual redaction
-            result = result[:start] + self.redaction_symbol + result[end:]
-        
-        return result
\ No newline at end of file
+        starts, ends = merge_intervals(detections)
+
+        # Every span becomes the same symbol: join the clear slices around it
+        return self.redaction_symbol.join(clear_slices(text, starts, ends))
\ No newline at end of file
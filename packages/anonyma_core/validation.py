@@ -6,7 +6,7 @@ before processing, ensuring data integrity and security.
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from enum import Enum
 
 from .exceptions import ValidationError, TextTooLongError, EmptyTextError
@@ -38,6 +38,8 @@ class AnonymizationRequest(BaseModel):
         confidence_threshold: Optional override for detection confidence
     """
 
+    model_config = ConfigDict(use_enum_values=True)
+
     text: str = Field(..., description="Text to anonymize")
     mode: AnonymizationModeEnum = Field(
         default=AnonymizationModeEnum.REDACT, description="Anonymization mode"
@@ -47,7 +49,8 @@ class AnonymizationRequest(BaseModel):
         None, ge=0.0, le=1.0, description="Detection confidence threshold (0.0 to 1.0)"
     )
 
-    @validator("text")
+    @field_validator("text")
+    @classmethod
     def validate_text(cls, v):
         """Validate input text"""
         if not v or not v.strip():
@@ -60,9 +63,6 @@ class AnonymizationRequest(BaseModel):
 
         return v
 
-    class Config:
-        use_enum_values = True
-
 
 class DetectionRequest(BaseModel):
     """
@@ -74,13 +74,16 @@ class DetectionRequest(BaseModel):
         confidence_threshold: Minimum confidence for detections
     """
 
+    model_config = ConfigDict(use_enum_values=True)
+
     text: str = Field(..., description="Text to analyze for PII")
     language: LanguageCode = Field(default=LanguageCode.ITALIAN, description="Language code")
     confidence_threshold: float = Field(
         default=0.7, ge=0.0, le=1.0, description="Minimum detection confidence"
     )
 
-    @validator("text")
+    @field_validator("text")
+    @classmethod
     def validate_text(cls, v):
         """Validate input text"""
         if not v or not v.strip():
@@ -92,9 +95,6 @@ class DetectionRequest(BaseModel):
 
         return v
 
-    class Config:
-        use_enum_values = True
-
 
 class Detection(BaseModel):
     """
@@ -114,10 +114,11 @@ class Detection(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
     text: str = Field(..., description="Detected text")
 
-    @validator("end")
-    def validate_positions(cls, v, values):
+    @field_validator("end")
+    @classmethod
+    def validate_positions(cls, v, info: ValidationInfo):
         """Ensure end > start"""
-        if "start" in values and v <= values["start"]:
+        if "start" in info.data and v <= info.data["start"]:
             raise ValueError("end position must be greater than start position")
         return v
 
@@ -132,13 +133,16 @@ class BatchAnonymizationRequest(BaseModel):
         language: Language code
     """
 
-    texts: List[str] = Field(..., min_items=1, max_items=100, description="Texts to anonymize")
+    model_config = ConfigDict(use_enum_values=True)
+
+    texts: List[str] = Field(..., min_length=1, max_length=100, description="Texts to anonymize")
     mode: AnonymizationModeEnum = Field(
         default=AnonymizationModeEnum.REDACT, description="Anonymization mode"
     )
     language: LanguageCode = Field(default=LanguageCode.ITALIAN, description="Language code")
 
-    @validator("texts")
+    @field_validator("texts")
+    @classmethod
     def validate_texts(cls, v):
         """Validate each text in batch"""
         for idx, text in enumerate(v):
@@ -151,9 +155,6 @@ class BatchAnonymizationRequest(BaseModel):
 
         return v
 
-    class Config:
-        use_enum_values = True
-
 
 def validate_text_input(text: str, max_length: int = 10_000_000) -> str:
     """
@@ -179,29 +180,61 @@ def validate_text_input(text: str, max_length: int = 10_000_000) -> str:
     return text
 
 
-def validate_detections(detections: List[Dict[str, Any]]) -> List[Detection]:
+def _is_well_formed(detection: Dict[str, Any]) -> bool:
+    """Plain-Python check of the constraints Detection enforces, on exact types"""
+    try:
+        start = detection["start"]
+        end = detection["end"]
+        confidence = detection["confidence"]
+        return (
+            type(detection["entity_type"]) is str
+            and type(detection["text"]) is str
+            and type(start) is int
+            and type(end) is int
+            and type(confidence) in (float, int)
+            and 0 <= start < end
+            and 0.0 <= confidence <= 1.0
+        )
+    except (KeyError, TypeError):
+        return False
+
+
+def validate_detections(
+    detections: List[Dict[str, Any]], typed: bool = True
+) -> Optional[List[Detection]]:
     """
     Validate detection results.
 
+    With typed=False, detections that already have the exact field types
+    and valid ranges are checked in plain Python, and only the rest go
+    through the Detection model, which accepts coercible values or reports
+    the error.
+
     Args:
         detections: List of detection dictionaries
+        typed: Return Detection objects; with False only validate
 
     Returns:
-        List of validated Detection objects
+        List of validated Detection objects, or None when typed is False
 
     Raises:
         ValidationError: If detections are invalid
     """
     validated = []
     for detection in detections:
+        if not typed and _is_well_formed(detection):
+            continue
+
         try:
-            validated.append(Detection(**detection))
+            model = Detection(**detection)
         except Exception as e:
             raise ValidationError(
                 f"Invalid detection: {str(e)}", {"detection": detection, "error": str(e)}
             )
+        if typed:
+            validated.append(model)
 
-    return validated
+    return validated if typed else None
 
 
 def validate_confidence_threshold(threshold: float) -> float:
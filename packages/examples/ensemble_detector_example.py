@@ -10,7 +10,14 @@ Demonstrates how to use ensemble detection to combine:
 With intelligent voting and confidence aggregation.
 """
 
+import io
+import multiprocessing
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -24,6 +31,28 @@ from anonyma_core.detectors.custom_detector import CustomPatternDetector
 from anonyma_core.modes import Redactor
 
 
+# One redactor for all examples; it precomputes its redaction runs
+_REDACTOR = Redactor()
+
+
+@lru_cache(maxsize=8)
+def _make_detector(
+    use_presidio=True, use_flair=False, voting_strategy="weighted", min_confidence=0.5
+):
+    """Ensemble shared by the examples with the same configuration.
+
+    Each PIIDetector loads Presidio's spaCy model, which takes seconds, so
+    examples only build a new ensemble when they need different detectors.
+    """
+    return EnsembleDetector(
+        use_presidio=use_presidio,
+        use_flair=use_flair,
+        voting_strategy=voting_strategy,
+        min_confidence=min_confidence,
+        cache_votes=True,
+    )
+
+
 def example_1_basic_ensemble():
     """Example 1: Basic ensemble with Presidio only"""
     print("=" * 70)
@@ -46,11 +75,7 @@ def example_1_basic_ensemble():
     print()
 
     # Basic ensemble (Presidio only)
-    detector = EnsembleDetector(
-        use_presidio=True,
-        use_flair=False,
-        voting_strategy="any"
-    )
+    detector = _make_detector(voting_strategy="any")
 
     detections = detector.detect(text)
 
@@ -94,6 +119,7 @@ def example_2_ensemble_with_custom():
     custom.add_pattern("STUDY_CODE", r"STUDY-[A-Z]{3}-\d{3}")
     custom.add_pattern("COMPOUND_ID", r"COMP-[A-Z]{3}-\d{3}")
     custom.add_pattern("EMPLOYEE_ID", r"EMP-\d{6}")
+    custom.compile()  # One scan for all patterns when hyperscan is installed
 
     # Ensemble with custom patterns
     detector = EnsembleDetector(
@@ -132,18 +158,21 @@ def example_3_voting_strategies():
 
     strategies = ["any", "majority", "unanimous", "weighted"]
 
+    # One ensemble for every strategy: the detectors run on the first pass
+    # and later strategies only re-vote the cached detections
+    detector = EnsembleDetector(
+        use_presidio=True,
+        use_flair=False,
+        min_confidence=0.5,
+        cache_votes=True
+    )
+
     for strategy in strategies:
         print(f"\nStrategy: {strategy.upper()}")
         print("-" * 40)
 
         try:
-            detector = EnsembleDetector(
-                use_presidio=True,
-                use_flair=False,
-                voting_strategy=strategy,
-                min_confidence=0.5
-            )
-
+            detector.voting_strategy = strategy
             detections = detector.detect(text)
 
             print(f"Detections: {len(detections)}")
@@ -176,12 +205,7 @@ def example_4_weighted_ensemble():
     print()
 
     # Create ensemble with custom weights
-    detector = EnsembleDetector(
-        use_presidio=True,
-        use_flair=False,
-        voting_strategy="weighted",
-        min_confidence=0.6
-    )
+    detector = _make_detector(voting_strategy="weighted", min_confidence=0.6)
 
     # Adjust weights (if we had Flair, we'd give it higher weight)
     detector.set_detector_weight("PIIDetector", 1.0)
@@ -291,6 +315,7 @@ def example_6_anonymization_workflow():
     custom = CustomPatternDetector()
     custom.add_pattern("EMPLOYEE_ID", r"EMP-\d{6}")
     custom.add_pattern("PROJECT_CODE", r"PRJ-[A-Z]{3,5}-\d{4}")
+    custom.compile()  # One scan for all patterns when hyperscan is installed
 
     # Create ensemble
     detector = EnsembleDetector(
@@ -309,12 +334,9 @@ def example_6_anonymization_workflow():
     print("-" * 70)
 
     # Group by entity type
-    by_type = {}
+    by_type = defaultdict(list)
     for det in detections:
-        entity_type = det['entity_type']
-        if entity_type not in by_type:
-            by_type[entity_type] = []
-        by_type[entity_type].append(det['text'])
+        by_type[det['entity_type']].append(det['text'])
 
     for entity_type, entities in sorted(by_type.items()):
         print(f"  • {entity_type}: {len(entities)}")
@@ -323,8 +345,7 @@ def example_6_anonymization_workflow():
     print()
 
     # Anonymize
-    redactor = Redactor()
-    anonymized = redactor.anonymize(text, detections)
+    anonymized = _REDACTOR.anonymize(text, detections)
 
     print("Anonymized Text:")
     print("-" * 70)
@@ -332,6 +353,24 @@ def example_6_anonymization_workflow():
     print()
 
 
+EXAMPLES = [
+    example_1_basic_ensemble,
+    example_2_ensemble_with_custom,
+    example_3_voting_strategies,
+    example_4_weighted_ensemble,
+    example_5_adaptive_ensemble,
+    example_6_anonymization_workflow,
+]
+
+
+def _run_captured(example):
+    """Run one example and return what it printed, to write it in one call"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        example()
+    return buffer.getvalue()
+
+
 def main():
     """Run all examples"""
     print()
@@ -343,22 +382,21 @@ def main():
     print()
 
     try:
-        example_1_basic_ensemble()
-        input("Press Enter to continue to next example...\n")
-
-        example_2_ensemble_with_custom()
-        input("Press Enter to continue to next example...\n")
-
-        example_3_voting_strategies()
-        input("Press Enter to continue to next example...\n")
-
-        example_4_weighted_ensemble()
-        input("Press Enter to continue to next example...\n")
-
-        example_5_adaptive_ensemble()
-        input("Press Enter to continue to next example...\n")
-
-        example_6_anonymization_workflow()
+        if sys.stdin.isatty():
+            for i, example in enumerate(EXAMPLES, 1):
+                sys.stdout.write(_run_captured(example))
+                if i < len(EXAMPLES):
+                    input("Press Enter to continue to next example...\n")
+        else:
+            # Nobody to press Enter: run the examples side by side and print
+            # each one's output in order. Spawned workers avoid forking
+            # loaded NLP models
+            workers = min(len(EXAMPLES), os.cpu_count() or 1)
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                for output in executor.map(_run_captured, EXAMPLES):
+                    print(output, end="")
 
         print("=" * 70)
         print("ALL EXAMPLES COMPLETED!")
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 """Test completo dell'ensemble detector"""
 
+import io
 import sys
+from contextlib import redirect_stdout
 sys.path.append('..')
 
 from anonyma_core import AnonymaEngine, AnonymizationMode
 import time
 
+def bench(fn, arg, n=50):
+    """Tempo medio in secondi di fn(arg) su n ripetizioni"""
+    t0 = time.perf_counter_ns()
+    for _ in range(n):
+        fn(arg)
+    return (time.perf_counter_ns() - t0) / n / 1e9
+
 def test_ensemble_accuracy():
     """Test di accuratezza dell'ensemble"""
     
@@ -38,65 +47,73 @@ def test_ensemble_accuracy():
             'description': 'CF invalido + email valida (test validazione)'
         }
     ]
+    for case in test_cases:
+        case['expected_set'] = frozenset(case['expected'])
     
     print("🎯 ENSEMBLE ACCURACY TEST")
     print("=" * 70)
     
     # Test con ensemble
-    engine_ensemble = AnonymaEngine(use_ensemble=True)
+    engine_ensemble = AnonymaEngine(use_flair=True)
     
     # Test senza ensemble (per confronto)
-    engine_basic = AnonymaEngine(use_ensemble=False)
+    engine_basic = AnonymaEngine(use_flair=False)
     
     total_tests = len(test_cases)
     ensemble_correct = 0
     basic_correct = 0
     
-    for i, case in enumerate(test_cases, 1):
-        print(f"\n{i}. {case['description']}")
-        print(f"   Input: {case['text']}")
-        print(f"   Expected: {case['expected']}")
-        
-        # Test Ensemble
-        start_time = time.time()
-        details_ensemble = engine_ensemble.get_detection_details(case['text'])
-        ensemble_time = time.time() - start_time
-        
-        detected_types_ensemble = [d['entity_type'] for d in details_ensemble['detections']]
-        
-        # Test Basic
-        start_time = time.time()
-        basic_detections = engine_basic.detector.detect(case['text'])
-        basic_time = time.time() - start_time
+    # Tutti i casi in un solo batch: un forward pass per modello
+    texts = [case['text'] for case in test_cases]
+    batch_ensemble = engine_ensemble.detect_batch(texts)
+    batch_basic = engine_basic.detect_batch(texts)
+    
+    # Testi brevi: tempi mediati su più ripetizioni, senza I/O nella misura
+    ensemble_batch_time = bench(engine_ensemble.detect_batch, texts)
+    basic_batch_time = bench(engine_basic.detect_batch, texts)
+    
+    # Report raccolto in memoria e scritto con una sola write
+    report = io.StringIO()
+    with redirect_stdout(report):
+        for i, (case, detections_ensemble, basic_detections) in enumerate(
+            zip(test_cases, batch_ensemble, batch_basic), 1
+        ):
+            print(f"\n{i}. {case['description']}")
+            print(f"   Input: {case['text']}")
+            print(f"   Expected: {case['expected']}")
         
-        detected_types_basic = [d['entity_type'] for d in basic_detections if d['confidence'] >= 0.99]
+            detected_types_ensemble = [d['entity_type'] for d in detections_ensemble]
+            detected_types_basic = [d['entity_type'] for d in basic_detections if d['confidence'] >= 0.99]
         
-        print(f"   Ensemble: {detected_types_ensemble} ({ensemble_time:.3f}s)")
-        print(f"   Basic: {detected_types_basic} ({basic_time:.3f}s)")
+            print(f"   Ensemble: {detected_types_ensemble}")
+            print(f"   Basic: {detected_types_basic}")
         
-        # Check accuracy
-        ensemble_match = set(detected_types_ensemble) == set(case['expected'])
-        basic_match = set(detected_types_basic) == set(case['expected'])
+            # Check accuracy
+            ensemble_match = frozenset(detected_types_ensemble) == case['expected_set']
+            basic_match = frozenset(detected_types_basic) == case['expected_set']
         
-        if ensemble_match:
-            ensemble_correct += 1
-        if basic_match:
-            basic_correct += 1
+            if ensemble_match:
+                ensemble_correct += 1
+            if basic_match:
+                basic_correct += 1
         
-        print(f"   Ensemble: {'✅' if ensemble_match else '❌'}")
-        print(f"   Basic: {'✅' if basic_match else '❌'}")
+            print(f"   Ensemble: {'✅' if ensemble_match else '❌'}")
+            print(f"   Basic: {'✅' if basic_match else '❌'}")
         
-        # Mostra confidence details per ensemble
-        if details_ensemble['detections']:
-            print("   Confidence details:")
-            for det in details_ensemble['detections']:
-                sources = det.get('ensemble_sources', [det.get('source', 'unknown')])
-                print(f"     - {det['entity_type']}: {det['confidence']:.3f} (sources: {sources})")
-    
-    print("\n" + "=" * 70)
-    print("📊 RISULTATI FINALI")
-    print(f"Ensemble Accuracy: {ensemble_correct}/{total_tests} ({ensemble_correct/total_tests*100:.1f}%)")
-    print(f"Basic Accuracy: {basic_correct}/{total_tests} ({basic_correct/total_tests*100:.1f}%)")
+            # Mostra confidence details per ensemble
+            if detections_ensemble:
+                print("   Confidence details:")
+                for det in detections_ensemble:
+                    sources = det.get('ensemble_sources', [det.get('source', 'unknown')])
+                    print(f"     - {det['entity_type']}: {det['confidence']:.3f} (sources: {sources})")
+    
+        print("\n" + "=" * 70)
+        print("📊 RISULTATI FINALI")
+        print(f"Ensemble Accuracy: {ensemble_correct}/{total_tests} ({ensemble_correct/total_tests*100:.1f}%)")
+        print(f"Basic Accuracy: {basic_correct}/{total_tests} ({basic_correct/total_tests*100:.1f}%)")
+        print(f"Ensemble batch time: {ensemble_batch_time:.4f}s ({ensemble_batch_time/total_tests:.4f}s/case)")
+        print(f"Basic batch time: {basic_batch_time:.4f}s ({basic_batch_time/total_tests:.4f}s/case)")
+    sys.stdout.write(report.getvalue())
 
 def test_performance_benchmark():
     """Test di performance"""
@@ -115,24 +132,28 @@ def test_performance_benchmark():
     di €50.000,00 avverrà tramite bonifico bancario sul c/c IBAN IT60X0542811101000000123456.
     """ * 5  # Moltiplica per aumentare il volume
     
-    engine = AnonymaEngine(use_ensemble=True)
+    engine = AnonymaEngine(use_flair=True)
     
     print(f"📏 Lunghezza testo: {len(long_text)} caratteri")
     
-    # Benchmark detection
-    start_time = time.time()
-    details = engine.get_detection_details(long_text)
-    detection_time = time.time() - start_time
+    # Benchmark detection (paragrafi indipendenti, rilevati in batch)
+    start_time = time.perf_counter_ns()
+    detections = engine.detect_paragraphs(long_text)
+    detection_time = (time.perf_counter_ns() - start_time) / 1e9
+    
+    detection_summary = {}
+    for det in detections:
+        detection_summary[det['entity_type']] = detection_summary.get(det['entity_type'], 0) + 1
     
     print(f"⏱️ Tempo detection: {detection_time:.3f}s")
     print(f"🚀 Velocità: {len(long_text)/detection_time:.0f} chars/sec")
-    print(f"🔍 Detection trovate: {details['high_confidence_detections']}")
-    print(f"📊 Tipi rilevati: {details['detection_summary']}")
+    print(f"🔍 Detection trovate: {len(detections)}")
+    print(f"📊 Tipi rilevati: {detection_summary}")
     
     # Benchmark anonymization
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     result = engine.anonymize(long_text, AnonymizationMode.REDACT)
-    anon_time = time.time() - start_time
+    anon_time = (time.perf_counter_ns() - start_time) / 1e9
     
     print(f"⏱️ Tempo anonymization: {anon_time:.3f}s")
     print(f"⚡ Tempo totale: {detection_time + anon_time:.3f}s")
@@ -84,9 +84,10 @@ def batch_test():
     print("🚀 BATCH TEST")
     print("=" * 40)
     
-    for i, text in enumerate(test_texts, 1):
+    # Un solo passaggio del detector per tutti i testi
+    results = engine.anonymize_batch(test_texts, AnonymizationMode.REDACT)
+    for i, (text, result) in enumerate(zip(test_texts, results), 1):
         print(f"\n{i}. Testing: {text}")
-        result = engine.anonymize(text, AnonymizationMode.REDACT)
         print(f"   Result: {result.anonymized_text}")
 
 if __name__ == "__main__":
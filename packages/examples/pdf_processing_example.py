@@ -184,18 +184,17 @@ def process_pdf_example():
         from anonyma_core.documents import PDFDocument
 
         # Load PDF
-        pdf_doc = PDFDocument(pdf_path)
-
-        print(f"PDF Metadata:")
-        print(f"  - File: {pdf_doc.metadata.file_name}")
-        print(f"  - Format: {pdf_doc.metadata.format.value}")
-        print(f"  - Pages: {pdf_doc.metadata.page_count}")
-        print(f"  - Size: {pdf_doc.metadata.file_size} bytes")
-        print(f"  - Is scanned: {pdf_doc.metadata.is_scanned}")
-        print()
+        with PDFDocument(pdf_path) as pdf_doc:
+            print(f"PDF Metadata:")
+            print(f"  - File: {pdf_doc.metadata.file_name}")
+            print(f"  - Format: {pdf_doc.metadata.format.value}")
+            print(f"  - Pages: {pdf_doc.metadata.page_count}")
+            print(f"  - Size: {pdf_doc.metadata.file_size} bytes")
+            print(f"  - Is scanned: {pdf_doc.metadata.is_scanned}")
+            print()
 
-        # Extract text
-        text = pdf_doc.extract_text()
+            # Extract text
+            text = pdf_doc.extract_text()
         print(f"Extracted text preview (first 200 chars):")
         print("-" * 70)
         print(text[:200] + "...")
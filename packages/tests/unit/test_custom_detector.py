@@ -462,3 +462,31 @@ def test_multiple_detectors_combined():
     # Combine results
     all_detections = compound_detections + id_detections
     assert len(all_detections) >= 5
+
+
+def test_hyperscan_prefilter_matches_plain_scan(monkeypatch):
+    """Hyperscan prefilter must not change detection results"""
+    pytest.importorskip("hyperscan")
+    from anonyma_core.detectors import custom_detector
+
+    detector = InternalIDDetector()
+    text = "Employee EMP-007890 on project PRJ-PHARMA-2024, nothing else here"
+
+    assert detector._candidate_patterns(text) is not None
+    with_prefilter = detector.detect(text)
+
+    monkeypatch.setattr(custom_detector, "HYPERSCAN_AVAILABLE", False)
+    assert with_prefilter == detector.detect(text)
+
+
+def test_compile_reports_prefilter_state():
+    """compile() is re-run lazily after pattern changes"""
+    from anonyma_core.detectors import custom_detector
+
+    detector = InternalIDDetector()
+    assert detector.compile() is custom_detector.HYPERSCAN_AVAILABLE
+
+    detector.add_pattern("TICKET", r"TCK-\d{4}")
+    assert not detector._compiled
+    assert detector.detect("Ticket TCK-1234")[0]["entity_type"] == "TICKET"
+    assert detector._compiled
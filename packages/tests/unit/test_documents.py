@@ -27,6 +27,7 @@ from anonyma_core.documents import (
     ImageDocument,
     WordDocument,
     ExcelDocument,
+    PowerPointDocument,
 )
 from anonyma_core.modes import AnonymizationMode
 from anonyma_core.exceptions import DocumentProcessingError
@@ -150,6 +151,273 @@ def test_pdf_document_detect_format():
     pass
 
 
+@pytest.fixture
+def sample_pdf(temp_dir):
+    """Create a small digital PDF with PII on every page"""
+    pytest.importorskip("reportlab")
+    from reportlab.pdfgen import canvas
+
+    file_path = temp_dir / "test.pdf"
+    c = canvas.Canvas(str(file_path))
+    for page in range(3):
+        c.drawString(72, 720, f"Page {page}: Mario Rossi - email mario.rossi@example.com")
+        c.drawString(72, 700, "Codice Fiscale: RSSMRA85C15H501X, Via Roma 123, Milano")
+        c.showPage()
+    c.save()
+
+    return file_path
+
+
+def test_pdf_find_text_coordinates(sample_pdf):
+    """Test locating detection phrases on a PDF page"""
+    from anonyma_core.documents.pdf_document import _detection_phrases
+
+    doc = PDFDocument(sample_pdf, enable_ocr=False)
+    phrases = _detection_phrases(
+        [{"text": " Mario Rossi "}, {"text": "mario.rossi@example.com"}, {"text": ""}]
+    )
+    boxes = doc._find_text_coordinates_by_num(1, phrases)
+    doc.close()
+
+    assert phrases == [
+        ("Mario Rossi", ["Mario", "Rossi"]),
+        ("mario.rossi@example.com", ["mario.rossi@example.com"]),
+    ]
+    assert [box["text"] for box in boxes] == ["Mario Rossi", "mario.rossi@example.com"]
+    assert all(box["bbox"][2] > 0 and box["bbox"][3] > 0 for box in boxes)
+
+
+@pytest.mark.parametrize("backend", ["pymupdf", "pikepdf", "PyPDF2"])
+def test_pdf_visual_redaction(sample_pdf, monkeypatch, backend):
+    """Test visual redaction draws a box over each detection"""
+    import io
+    import pdfplumber
+    from anonyma_core.documents import pdf_document
+
+    disabled = {
+        "pymupdf": [],
+        "pikepdf": ["PYMUPDF_AVAILABLE"],
+        "PyPDF2": ["PYMUPDF_AVAILABLE", "PIKEPDF_AVAILABLE"],
+    }[backend]
+    if backend != "PyPDF2":
+        pytest.importorskip(backend)
+    for flag in disabled:
+        monkeypatch.setattr(pdf_document, flag, False)
+
+    doc = PDFDocument(sample_pdf, enable_ocr=False)
+    pdf_bytes = doc.rebuild("", [{"text": "Mario Rossi"}], mode="visual_redact")
+    doc.close()
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        assert len(pdf.pages) == 3
+        assert all(len(page.rects + page.curves) == 1 for page in pdf.pages)
+        if backend == "pymupdf":
+            # Real redaction removes the covered text
+            assert all("Mario Rossi" not in page.extract_text() for page in pdf.pages)
+            assert all("mario.rossi@example.com" in page.extract_text() for page in pdf.pages)
+
+
+def test_pdf_visual_redaction_uses_detection_pages(sample_pdf):
+    """Test detections with offsets only redact the page they come from"""
+    import io
+    import pdfplumber
+
+    doc = PDFDocument(sample_pdf, enable_ocr=False)
+    text = doc.extract_text()
+    start = text.index("Mario Rossi", text.index("Page 1"))
+    detections = [{"text": "Mario Rossi", "start": start, "end": start + 11}]
+
+    assert dict(doc._phrases_by_page(detections)) == {1: [("Mario Rossi", ["Mario", "Rossi"])]}
+
+    pdf_bytes = doc.rebuild("", detections, mode="visual_redact")
+    doc.close()
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        assert [len(page.rects + page.curves) for page in pdf.pages] == [0, 1, 0]
+
+
+def test_pdf_document_context_manager(sample_pdf):
+    """Test PDFDocument releases the file when leaving a with block"""
+    with PDFDocument(sample_pdf, enable_ocr=False) as doc:
+        assert "Mario Rossi" in doc.extract_text()
+
+    assert doc._pdf is None
+    assert doc.get_page_count() == 0
+    doc.close()  # idempotent
+
+
+def test_pdf_parse_date(sample_pdf):
+    """Test PDF date string parsing"""
+    doc = PDFDocument(sample_pdf, enable_ocr=False)
+
+    assert doc._parse_pdf_date("D:20240315143005+01'00'") == datetime(2024, 3, 15, 14, 30, 5)
+    assert doc._parse_pdf_date("D:2024") is None
+    assert doc._parse_pdf_date("D:20241399000000") is None
+    assert doc._parse_pdf_date("20240315143005") is None
+    doc.close()
+
+
+def test_pdf_iter_text(sample_pdf):
+    """Test page-by-page text iteration matches full extraction"""
+    doc = PDFDocument(sample_pdf, enable_ocr=False)
+    pages = list(doc.iter_text())
+    text = doc.extract_text()
+    doc.close()
+
+    assert [page_num for page_num, _ in pages] == [1, 2, 3]
+    assert "\n\n".join(page_text for _, page_text in pages) == text
+
+
+def test_pdf_extract_text_parallel_matches_sequential(sample_pdf, monkeypatch):
+    """Test process-pool extraction keeps page order and content"""
+    from anonyma_core.documents import pdf_document
+
+    doc = PDFDocument(sample_pdf, enable_ocr=False)
+    sequential = doc.extract_text()
+
+    monkeypatch.setattr(pdf_document, "PARALLEL_EXTRACT_MIN_PAGES", 2)
+    monkeypatch.setattr(pdf_document.os, "cpu_count", lambda: 2)
+    parallel = doc.extract_text()
+    doc.close()
+
+    assert "Page 0" in sequential
+    assert parallel == sequential
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_find_phrase_starts(monkeypatch, use_automaton):
+    """Test phrase lookup with and without the Aho-Corasick backend"""
+    from anonyma_core.documents import pdf_document
+    from anonyma_core.documents.pdf_document import _find_phrase_starts
+
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(pdf_document, "AHOCORASICK_AVAILABLE", False)
+
+    words = ["Mario", "Rossi", "e", "Maria", "Rossi", "Mario", "Rossi"]
+    phrases = [
+        ("Maria Rossi", ["Maria", "Rossi"]),
+        ("Mario Rossi", ["Mario", "Rossi"]),
+        ("Rossi", ["Rossi"]),
+        ("Mario Rossi", ["Mario", "Rossi"]),
+        ("Luigi", ["Luigi"]),
+        ("ari", ["ari"]),
+    ]
+
+    assert _find_phrase_starts(words, phrases) == {0: 3, 1: 0, 2: 1, 3: 0}
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_find_word_containing(monkeypatch, use_rapidfuzz):
+    """Test single-word fallback matching with and without rapidfuzz"""
+    from anonyma_core.documents import pdf_document
+    from anonyma_core.documents.pdf_document import _find_word_containing
+
+    if use_rapidfuzz:
+        pytest.importorskip("rapidfuzz")
+    else:
+        monkeypatch.setattr(pdf_document, "RAPIDFUZZ_AVAILABLE", False)
+
+    words = ["a", "Email:", "mario.rossi@example.com,", "Tel:"]
+
+    assert _find_word_containing("mario.rossi@example.com", words) == 2
+    assert _find_word_containing("Luigi", words) is None
+    # A shorter word that is part of the text is not a match
+    assert _find_word_containing("Rossi", ["Mario", "Ross", "x"]) is None
+    if use_rapidfuzz:
+        # OCR confusion between 'l' and 'I'
+        assert _find_word_containing("mario.rossi@exampIe.com", words) == 2
+
+
+def test_can_start_process_pool():
+    """Test PDF extraction only starts a pool from the main thread"""
+    import threading
+    from anonyma_core.documents.pdf_document import _can_start_process_pool
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(_can_start_process_pool()))
+    thread.start()
+    thread.join()
+
+    assert _can_start_process_pool()
+    assert results == [False]
+
+
+def test_split_ocr_pages():
+    """Test splitting batched Tesseract output into pages"""
+    from anonyma_core.documents.pdf_document import _split_ocr_pages
+
+    assert _split_ocr_pages("one\x0ctwo\x0cthree\x0c", 3) == ["one", "two", "three"]
+    assert _split_ocr_pages("one\x0c", 3) == ["one", "", ""]
+
+
+def test_ocr_image_pipes_png_to_tesseract(temp_dir, monkeypatch):
+    """Test single-page OCR pipes the image through Tesseract stdin/stdout"""
+    pytesseract = pytest.importorskip("pytesseract")
+    from PIL import Image
+    from anonyma_core.documents.pdf_document import _ocr_image
+
+    # Fake tesseract: report the argv and the PNG signature read from stdin
+    fake_tesseract = temp_dir / "tesseract"
+    fake_tesseract.write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = "fail" ]; then echo boom >&2; exit 1; fi\n'
+        'echo "$@"; head -c 4 | tail -c 3\n'
+    )
+    fake_tesseract.chmod(0o755)
+    monkeypatch.setattr(pytesseract.pytesseract, "tesseract_cmd", str(fake_tesseract))
+
+    output = _ocr_image(Image.new("L", (8, 8), 255))
+
+    assert output == "stdin stdout -l ita+eng\nPNG"
+
+    from anonyma_core.documents.pdf_document import _run_tesseract
+
+    with pytest.raises(DocumentProcessingError, match="boom"):
+        _run_tesseract("fail")
+
+
+def test_ocr_images_tesserocr_reuses_api(mocker):
+    """Test tesserocr OCR reuses one API and clears it between pages"""
+    from anonyma_core.documents.pdf_document import _ocr_images_tesserocr
+
+    api = mocker.MagicMock()
+    api.GetUTF8Text.side_effect = ["page one", "page two"]
+
+    assert _ocr_images_tesserocr(api, ["img1", "img2"], 1) == ["page one", "page two"]
+    assert [call.args[0] for call in api.SetImage.call_args_list] == ["img1", "img2"]
+    assert api.Clear.call_count == 2
+
+
+def test_render_page_for_ocr(sample_pdf):
+    """Test in-process page rasterization for OCR"""
+    pdfium = pytest.importorskip("pypdfium2")
+    from anonyma_core.documents.pdf_document import OCR_DPI, _render_page_for_ocr
+
+    pdf = pdfium.PdfDocument(str(sample_pdf))
+    width, height = pdf[0].get_size()
+    image = _render_page_for_ocr(pdf, 0, preprocess=False)
+    pdf.close()
+
+    assert image.mode == "L"
+    assert image.size[0] == pytest.approx(width * OCR_DPI / 72, abs=1)
+    assert image.size[1] == pytest.approx(height * OCR_DPI / 72, abs=1)
+
+
+def test_preprocess_for_ocr_binarizes():
+    """Test OCR preprocessing produces a binary grayscale image"""
+    pytest.importorskip("cv2")
+    from PIL import Image
+    from anonyma_core.documents.pdf_document import _preprocess_for_ocr
+
+    image = Image.new("RGB", (64, 64), (200, 180, 160))
+    processed = _preprocess_for_ocr(image)
+
+    assert processed.mode == "L"
+    assert set(processed.getdata()) <= {0, 255}
+
+
 # ============================================================================
 # ImageDocument Tests
 # ============================================================================
@@ -207,6 +475,22 @@ def test_word_document_creation(temp_dir):
     assert word_doc.get_paragraph_count() > 0
 
 
+def test_word_document_counts(sample_docx):
+    """Test paragraph/table counts match python-docx's body collections"""
+    from docx import Document
+
+    doc = Document(str(sample_docx))
+
+    with WordDocument(sample_docx) as word_doc:
+        assert word_doc.get_paragraph_count() == len(doc.paragraphs)
+        assert word_doc.get_table_count() == len(doc.tables)
+        assert word_doc.get_file_size() == sample_docx.stat().st_size
+        word_doc.extract_text()
+        assert word_doc.paragraphs_map == []
+
+    assert word_doc.get_paragraph_count() == 0
+
+
 @pytest.mark.skipif(
     not pytest.importorskip("docx", reason="python-docx not installed"),
     reason="Requires python-docx",
@@ -230,6 +514,165 @@ def test_word_document_extract_text(temp_dir):
     assert "Second paragraph" in text
 
 
+@pytest.fixture
+def sample_docx(temp_dir):
+    """Create a Word document with runs, breaks, merged and nested tables"""
+    docx = pytest.importorskip("docx")
+
+    doc_path = temp_dir / "rich.docx"
+    doc = docx.Document()
+    para = doc.add_paragraph("Mario ")
+    para.add_run("Rossi").bold = True
+    para.add_run("\tTel: 333 1234567\nRoma")
+    doc.add_paragraph("   ")
+    para = doc.add_paragraph("Email: ")
+    para._p.append(docx.oxml.parse_xml(
+        '<w:hyperlink xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:r><w:t>mario.rossi@example.com</w:t></w:r></w:hyperlink>'
+    ))
+    para.add_run().add_break(docx.enum.text.WD_BREAK.PAGE)
+
+    table = doc.add_table(rows=4, cols=3)
+    table.cell(0, 0).text = "Name"
+    table.cell(0, 1).text = "Email"
+    table.cell(0, 2).text = "City"
+    table.cell(1, 0).merge(table.cell(1, 1)).text = "Mario Rossi"
+    table.cell(1, 2).merge(table.cell(2, 2)).text = "Roma"
+    table.cell(2, 0).text = "Luigi"
+    table.cell(3, 1).add_paragraph("second line")
+    table.cell(3, 0).add_table(rows=1, cols=1).cell(0, 0).text = "nested"
+
+    doc.sections[0].header.paragraphs[0].text = "Confidential"
+    doc.sections[0].footer.paragraphs[0].text = "Page footer"
+    doc.save(str(doc_path))
+    return doc_path
+
+
+def _docx_reference_text(doc_path):
+    """Extraction layout computed through the python-docx object model"""
+    from docx import Document
+
+    doc = Document(str(doc_path))
+    parts = [p.text for p in doc.paragraphs if p.text.strip()]
+    for table_idx, table in enumerate(doc.tables):
+        rows = []
+        for row in table.rows:
+            row_texts = [cell.text.strip() for cell in row.cells]
+            if any(row_texts):
+                rows.append(" | ".join(row_texts))
+        if rows:
+            parts.append(f"[Table {table_idx + 1}]\n" + "\n".join(rows))
+    for section in doc.sections:
+        parts += [f"[Header] {p.text}" for p in section.header.paragraphs if p.text.strip()]
+        parts += [f"[Footer] {p.text}" for p in section.footer.paragraphs if p.text.strip()]
+    return "\n\n".join(parts)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_word_document_extract_text_layout(sample_docx, monkeypatch, streaming):
+    """Test Word extraction, loaded or streamed, matches the python-docx object model"""
+    from anonyma_core.documents import word_document
+
+    if streaming:
+        monkeypatch.setattr(word_document, "STREAMING_MIN_SIZE", 0)
+
+    with WordDocument(sample_docx, track_map=True) as word_doc:
+        assert word_doc._streaming is streaming
+        counts = (word_doc.get_paragraph_count(), word_doc.get_table_count())
+        text = word_doc.extract_text()
+        paragraphs_map = word_doc.paragraphs_map
+        metadata_counts = (word_doc.metadata.custom["paragraphs"], word_doc.metadata.custom["tables"])
+
+    from docx import Document
+
+    reference = Document(str(sample_docx))
+    assert counts == metadata_counts == (len(reference.paragraphs), len(reference.tables))
+
+    assert text == _docx_reference_text(sample_docx)
+    assert {rec.kind for rec in paragraphs_map} == {"paragraph", "table"}
+    sections = text.split("\n\n")
+    for rec in paragraphs_map:
+        if rec.kind == "table":
+            assert sections[rec.index] == "[Table %d]\n%s" % (rec.table_idx + 1, rec.text)
+        else:
+            assert rec.table_idx is None
+            assert rec.text in text
+    assert "Mario Rossi\tTel: 333 1234567\nRoma" in text
+    assert "Email: mario.rossi@example.com\n\n" in text
+    assert "Mario Rossi | Mario Rossi | Roma\nLuigi |  | Roma" in text
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_word_document_shared_headers(temp_dir, monkeypatch, streaming):
+    """Test sections sharing header/footer parts repeat their text per section"""
+    docx = pytest.importorskip("docx")
+    from docx.enum.section import WD_SECTION
+    from anonyma_core.documents import word_document
+
+    doc_path = temp_dir / "sections.docx"
+    doc = docx.Document()
+    doc.add_paragraph("one")
+    doc.sections[0].footer.paragraphs[0].text = "F1"
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    doc.sections[1].header.is_linked_to_previous = False
+    doc.sections[1].header.paragraphs[0].text = "H2"
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    doc.save(str(doc_path))
+
+    if streaming:
+        monkeypatch.setattr(word_document, "STREAMING_MIN_SIZE", 0)
+
+    with WordDocument(doc_path) as word_doc:
+        text = word_doc.extract_text()
+
+    assert text == _docx_reference_text(doc_path)
+    assert text.count("[Footer] F1") == 3
+    assert text.count("[Header] H2") == 2
+
+
+def test_word_document_huge_attribute_falls_back_to_streaming(temp_dir):
+    """Test documents beyond libxml2's default limits are streamed"""
+    import zipfile
+
+    docx = pytest.importorskip("docx")
+
+    plain_path = temp_dir / "plain.docx"
+    doc = docx.Document()
+    doc.add_paragraph("Mario Rossi")
+    doc.save(str(plain_path))
+
+    # An attribute value past libxml2's 10MB limit breaks python-docx's parser
+    huge_path = temp_dir / "huge.docx"
+    with zipfile.ZipFile(plain_path) as zin, zipfile.ZipFile(huge_path, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == "word/document.xml":
+                data = data.replace(
+                    b"<w:body>",
+                    b'<w:body><w:p><w:pPr><w:pStyle w:val="' + b"A" * 11_000_000 + b'"/></w:pPr></w:p>',
+                    1,
+                )
+            zout.writestr(item, data)
+
+    with WordDocument(huge_path) as word_doc:
+        assert word_doc._streaming is True
+        assert word_doc.extract_text() == "Mario Rossi"
+
+
+def test_word_document_parser_limit_errors():
+    """Test only libxml2 size limit errors count as parser limit errors"""
+    from lxml import etree
+    from anonyma_core.documents.word_document import _exceeds_parser_limits
+
+    with pytest.raises(etree.XMLSyntaxError) as malformed:
+        etree.fromstring(b"<a><b></a>")
+    with pytest.raises(etree.XMLSyntaxError) as huge:
+        etree.fromstring(b'<a b="' + b"A" * 11_000_000 + b'"/>')
+
+    assert not _exceeds_parser_limits(malformed.value)
+    assert _exceeds_parser_limits(huge.value)
+
+
 @pytest.mark.skipif(
     not pytest.importorskip("docx", reason="python-docx not installed"),
     reason="Requires python-docx",
@@ -252,6 +695,50 @@ def test_word_document_rebuild(temp_dir):
     assert len(anonymized_bytes) > 0
 
 
+def test_word_document_rebuild_to(sample_docx, temp_dir):
+    """Test Word rebuild streams into a file object"""
+    from docx import Document
+
+    output_path = temp_dir / "out.docx"
+    with WordDocument(sample_docx) as word_doc:
+        with open(output_path, "wb") as out:
+            word_doc.rebuild_to(out, "[REDACTED]\n\nSecond", [])
+        rebuilt = word_doc.rebuild("[REDACTED]\n\nSecond", [])
+
+    assert output_path.stat().st_size == len(rebuilt)
+    paragraphs = [p.text for p in Document(str(output_path)).paragraphs if p.text]
+    assert paragraphs == ["[REDACTED]", "Second"]
+
+
+def test_word_document_rebuild_table(temp_dir):
+    """Test rebuilt tables keep cell text, padding and style"""
+    import io
+
+    docx = pytest.importorskip("docx")
+
+    doc_path = temp_dir / "test.docx"
+    docx.Document().save(str(doc_path))
+
+    word_doc = WordDocument(doc_path)
+    rebuilt = word_doc.rebuild(
+        "Intro\n\n[Table 1]\nName | Note\n[REDACTED] |  a\tb \nlast\n\n[Header] [REDACTED]",
+        [],
+    )
+
+    rebuilt_doc = docx.Document(io.BytesIO(rebuilt))
+    paragraphs = [p for p in rebuilt_doc.paragraphs if p.text]
+    assert [p.text for p in paragraphs] == ["Intro", "[Header] [REDACTED]"]
+    assert paragraphs[1].runs[0].italic is True
+
+    table = rebuilt_doc.tables[0]
+    assert table.style.name == "Table Grid"
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [
+        ["Name", "Note"],
+        ["[REDACTED]", " a\tb "],
+        ["last", ""],
+    ]
+
+
 # ============================================================================
 # ExcelDocument Tests
 # ============================================================================
@@ -343,6 +830,113 @@ def test_excel_document_rebuild(temp_dir):
     assert len(anonymized_bytes) > 0
 
 
+# ============================================================================
+# PowerPointDocument Tests
+# ============================================================================
+
+
+@pytest.fixture
+def sample_pptx(temp_dir):
+    """Create a two-slide presentation with a text box, a table and notes"""
+    pptx = pytest.importorskip("pptx")
+    from pptx.util import Inches
+
+    pptx_path = temp_dir / "test.pptx"
+    pres = pptx.Presentation()
+    blank = pres.slide_layouts[6]
+
+    slide = pres.slides.add_slide(blank)
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text = "Mario Rossi"
+    table = slide.shapes.add_table(3, 2, Inches(1), Inches(2), Inches(4), Inches(2)).table
+    table.cell(0, 0).text = "Name"
+    table.cell(0, 1).text = "Email"
+    table.cell(2, 0).text = "Mario"
+    table.cell(2, 1).text = "mario.rossi@example.com"
+    slide.notes_slide.notes_text_frame.text = "Call Mario"
+
+    slide = pres.slides.add_slide(blank)
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text = "Second slide"
+
+    pres.save(str(pptx_path))
+    return pptx_path
+
+
+def test_powerpoint_document_extract_text(sample_pptx):
+    """Test PowerPoint extraction of text boxes, tables and notes"""
+    with PowerPointDocument(sample_pptx) as ppt_doc:
+        text = ppt_doc.extract_text()
+
+    assert text == (
+        "[Slide 1]\nMario Rossi\nName | Email\nMario | mario.rossi@example.com"
+        "\n\n[Slide 1 - Notes]\nCall Mario"
+        "\n\n[Slide 2]\nSecond slide"
+    )
+    assert list(ppt_doc._section_numbers) == [1, 1, 2]
+    assert list(ppt_doc._section_notes) == [0, 1, 0]
+
+
+def test_powerpoint_document_iter_text_chunks(sample_pptx):
+    """Test PowerPoint section iteration matches extract_text"""
+    with PowerPointDocument(sample_pptx) as ppt_doc:
+        chunks = list(ppt_doc.iter_text_chunks())
+        text = ppt_doc.extract_text()
+
+    assert [meta for _, meta in chunks] == [
+        {"slide_number": 1, "notes": False},
+        {"slide_number": 1, "notes": True},
+        {"slide_number": 2, "notes": False},
+    ]
+    assert "\n\n".join(chunk for chunk, _ in chunks) == text
+
+
+def test_powerpoint_document_requires_pptx(sample_pptx, monkeypatch):
+    """Test PowerPointDocument reports a missing python-pptx"""
+    from anonyma_core.documents import powerpoint_document
+
+    monkeypatch.setattr(powerpoint_document, "PPTX_AVAILABLE", False)
+
+    with pytest.raises(DocumentProcessingError, match="python-pptx not installed"):
+        PowerPointDocument(sample_pptx)
+
+
+def test_powerpoint_document_rebuild_to(sample_pptx, temp_dir):
+    """Test PowerPoint rebuild streams into a file object"""
+    from pptx import Presentation
+
+    output_path = temp_dir / "out.pptx"
+    with PowerPointDocument(sample_pptx) as ppt_doc:
+        with open(output_path, "wb") as out:
+            ppt_doc.rebuild_to(out, "[Slide 1]\n[REDACTED]\nline two", [])
+
+    slides = list(Presentation(str(output_path)).slides)
+    assert len(slides) == 1
+    assert slides[0].shapes.title.text == "[REDACTED]"
+
+
+def test_powerpoint_document_rebuild_sections(sample_pptx):
+    """Test PowerPoint rebuild parses slide and notes sections"""
+    import io
+    from pptx import Presentation
+
+    with PowerPointDocument(sample_pptx) as ppt_doc:
+        text = ppt_doc.extract_text().replace("Mario Rossi", "[REDACTED]\n\nmore")
+        pptx_bytes = ppt_doc.rebuild(text, [])
+
+    slides = list(Presentation(io.BytesIO(pptx_bytes)).slides)
+    assert [slide.shapes.title.text for slide in slides] == ["[REDACTED]", "Second slide"]
+    assert "more" in slides[0].placeholders[1].text
+    assert slides[0].notes_slide.notes_text_frame.text == "Call Mario"
+
+
+def test_powerpoint_document_locate_sections(sample_pptx):
+    """Test recorded section headers split text like the section regex"""
+    with PowerPointDocument(sample_pptx) as ppt_doc:
+        text = ppt_doc.extract_text().replace("Mario", "[PERSON]")
+
+        assert ppt_doc._locate_sections(text) == ppt_doc._parse_sections(text)
+        assert ppt_doc._locate_sections("[Slide 9]\nunrelated") == [("9", False, "unrelated")]
+
+
 # ============================================================================
 # DocumentPipeline Tests
 # ============================================================================
@@ -434,6 +1028,143 @@ def test_document_pipeline_process_word(temp_dir, mock_engine):
     assert result.output_file.exists()
 
 
+@pytest.mark.skipif(
+    not pytest.importorskip("docx", reason="python-docx not installed"),
+    reason="Requires python-docx",
+)
+def test_document_pipeline_skips_empty_text(temp_dir, mock_engine):
+    """Test documents without text bypass the engine and produce no output file"""
+    from docx import Document
+
+    doc_path = temp_dir / "empty.docx"
+    Document().save(str(doc_path))
+
+    def fail_anonymize(text, mode, language):
+        raise AssertionError("engine should not be called")
+
+    mock_engine.anonymize = fail_anonymize
+
+    pipeline = DocumentPipeline(mock_engine)
+    result = pipeline.process(doc_path, AnonymizationMode.REDACT)
+
+    assert result.success is True
+    assert result.detections_count == 0
+    assert result.output_file is None
+    assert "warning" in result.metadata
+    assert not (temp_dir / "anonymized_empty.docx").exists()
+
+
+@pytest.mark.skipif(
+    not pytest.importorskip("docx", reason="python-docx not installed"),
+    reason="Requires python-docx",
+)
+def test_document_pipeline_process_batch(temp_dir, mock_engine):
+    """Test batch processing keeps input order and reports failures"""
+    from docx import Document
+
+    doc_paths = []
+    for i in range(3):
+        doc_path = temp_dir / f"test_{i}.docx"
+        doc = Document()
+        doc.add_paragraph(f"Document {i} with Mario Rossi")
+        doc.save(str(doc_path))
+        doc_paths.append(doc_path)
+    doc_paths.insert(1, temp_dir / "missing.docx")
+
+    pipeline = DocumentPipeline(mock_engine)
+    results = pipeline.process_batch(
+        doc_paths, AnonymizationMode.REDACT, max_workers=2, use_processes=False
+    )
+
+    assert [result.original_file for result in results] == doc_paths
+    assert [result.success for result in results] == [True, False, True, True]
+    assert all(
+        (temp_dir / f"anonymized_test_{i}.docx").exists() for i in range(3)
+    )
+
+
+@pytest.mark.skipif(
+    not pytest.importorskip("docx", reason="python-docx not installed"),
+    reason="Requires python-docx",
+)
+def test_document_pipeline_batch_anonymize_failure(temp_dir, mock_engine):
+    """Test an anonymization error fails only its document in the batch"""
+    from docx import Document
+
+    doc_paths = []
+    for i in range(4):
+        doc_path = temp_dir / f"test_{i}.docx"
+        doc = Document()
+        doc.add_paragraph(f"Document {i}")
+        doc.save(str(doc_path))
+        doc_paths.append(doc_path)
+
+    anonymize = mock_engine.anonymize
+
+    def flaky_anonymize(text, mode, language):
+        if "Document 2" in text:
+            raise RuntimeError("engine failure")
+        return anonymize(text, mode, language)
+
+    mock_engine.anonymize = flaky_anonymize
+
+    pipeline = DocumentPipeline(mock_engine)
+    results = pipeline.process_batch(
+        doc_paths, AnonymizationMode.REDACT, save_output=False, max_workers=2, use_processes=False
+    )
+
+    assert [result.success for result in results] == [True, True, False, True]
+    assert results[2].error == "engine failure"
+
+
+@pytest.mark.skipif(
+    not pytest.importorskip("docx", reason="python-docx not installed"),
+    reason="Requires python-docx",
+)
+def test_document_pipeline_batch_stage_failure(temp_dir, mock_engine, monkeypatch):
+    """Test a dying pipeline stage fails the batch instead of blocking it"""
+    import threading
+    from docx import Document
+    from anonyma_core.documents import pipeline as pipeline_module
+
+    doc_paths = []
+    for i in range(6):
+        doc_path = temp_dir / f"test_{i}.docx"
+        doc = Document()
+        doc.add_paragraph(f"Document {i}")
+        doc.save(str(doc_path))
+        doc_paths.append(doc_path)
+
+    monkeypatch.setattr(pipeline_module, "BATCH_QUEUE_SIZE", 1)
+
+    pipeline = DocumentPipeline(mock_engine)
+
+    def broken_rebuild(*args, **kwargs):
+        raise RuntimeError("rebuild failure")
+
+    # Failures while reporting a failure kill the rebuild thread itself
+    monkeypatch.setattr(pipeline, "_rebuild_stage", broken_rebuild)
+    monkeypatch.setattr(pipeline, "_failed_result", broken_rebuild)
+
+    outcome = []
+
+    def run():
+        try:
+            pipeline.process_batch(
+                doc_paths, AnonymizationMode.REDACT, save_output=False, max_workers=1, use_processes=False
+            )
+        except Exception as e:
+            outcome.append(e)
+
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+    runner.join(timeout=30)
+
+    assert not runner.is_alive()
+    assert len(outcome) == 1
+    assert isinstance(outcome[0], DocumentProcessingError)
+
+
 @pytest.mark.skipif(
     not pytest.importorskip("openpyxl", reason="openpyxl not installed"),
     reason="Requires openpyxl",
@@ -505,6 +1236,9 @@ def test_processing_result_to_dict():
     assert data["mode"] == "redact"
     assert "original_file" in data
 
+    result.mode = AnonymizationMode.SUBSTITUTE
+    assert result.to_dict()["mode"] == "substitute"
+
 
 def test_processing_result_failure():
     """Test ProcessingResult for failed processing"""
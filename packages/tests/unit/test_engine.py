@@ -25,6 +25,16 @@ class TestAnonymaEngineInitialization:
         assert engine is not None
         assert engine.detector is not None
 
+    def test_engine_shares_detector_instances(self):
+        """Test that engines reuse the detector but own their anonymizers"""
+        first = AnonymaEngine(use_flair=False)
+        second = AnonymaEngine(use_flair=False)
+        assert second.detector is first.detector
+        assert second.redactor is not first.redactor
+
+        first.redactor.redaction_char = "*"
+        assert second.redactor.redaction_char == "█"
+
 
 class TestAnonymaEngineRedactMode:
     """Test REDACT anonymization mode"""
@@ -131,6 +141,143 @@ class TestAnonymaEngineEdgeCases:
         with pytest.raises((ValueError, AttributeError)):
             engine_basic.anonymize(sample_text_italian, "invalid_mode")
 
+    @pytest.mark.parametrize("mode", list(AnonymizationMode))
+    def test_no_detections_skips_mode(self, engine_basic, sample_text_no_pii, monkeypatch, mode):
+        """Test that text without detections is returned without running the mode"""
+        class NoDetections:
+            def detect(self, text, language='it'):
+                return []
+
+        class Unused:
+            def anonymize(self, text, detections):
+                raise AssertionError("mode should not run without detections")
+
+        monkeypatch.setattr(engine_basic, "detector", NoDetections())
+        for attr in ("redactor", "substitutor", "visual_redactor"):
+            monkeypatch.setattr(engine_basic, attr, Unused())
+
+        result = engine_basic.anonymize(sample_text_no_pii, mode)
+
+        assert result.anonymized_text == sample_text_no_pii
+        assert result.mode == mode
+        if mode == AnonymizationMode.SUBSTITUTE:
+            assert result.mapping == {}
+            assert result.reverse_key
+        else:
+            assert result.reverse_key is None
+
+    def test_result_cache(self, monkeypatch):
+        """Test that cached engines reuse deterministic results only"""
+        engine = AnonymaEngine(use_flair=False, cache_results=True)
+        calls = []
+
+        class CountingDetector:
+            def detect(self, text, language='it'):
+                calls.append(text)
+                return [{'entity_type': 'PERSON', 'start': 0, 'end': 5, 'confidence': 0.9, 'text': text[:5]}]
+
+        monkeypatch.setattr(engine, "detector", CountingDetector())
+
+        first = engine.anonymize("Mario Rossi", AnonymizationMode.REDACT)
+        assert engine.anonymize("Mario Rossi", AnonymizationMode.REDACT) is first
+        assert len(calls) == 1
+
+        engine.anonymize("Mario Rossi", AnonymizationMode.REDACT, language='en')
+        engine.anonymize("Mario Rossi", AnonymizationMode.SUBSTITUTE)
+        engine.anonymize("Mario Rossi", AnonymizationMode.SUBSTITUTE)
+        assert len(calls) == 4
+
+    def test_detect_batch(self, engine_basic, sample_text_italian, sample_text_no_pii):
+        """Test that batched detection matches per-text detection"""
+        texts = [sample_text_italian, sample_text_no_pii]
+
+        batch = engine_basic.detect_batch(texts)
+
+        assert batch == [engine_basic.detector.detect(text) for text in texts]
+
+    def test_detect_paragraphs(self, engine_basic):
+        """Test that paragraph detections carry offsets into the whole text"""
+        paragraph = "Contatto: mario.rossi@example.com\n"
+        text = paragraph + "\n   \n" + paragraph + "\n\n"
+
+        detections = engine_basic.detect_paragraphs(text)
+
+        emails = [d for d in detections if d['entity_type'] == 'EMAIL']
+        assert len(emails) == 2
+        for detection in emails:
+            assert text[detection['start']:detection['end']] == "mario.rossi@example.com"
+
+        # Detectors without detect_batch() run on the thread pool
+        class PlainDetector:
+            def detect(self, text, language='it'):
+                return engine_basic.detector.detect(text, language)
+
+        engine = AnonymaEngine(use_flair=False)
+        engine.detector = PlainDetector()
+        assert engine.detect_paragraphs(text) == detections
+
+    def test_anonymize_batch_parallel(self, engine_basic, sample_text_italian, sample_text_no_pii):
+        """Test that pooled batches match in-process anonymization, in order"""
+        texts = [sample_text_italian, sample_text_no_pii] * 4
+
+        results = engine_basic.anonymize_batch(texts, AnonymizationMode.REDACT, max_workers=2)
+
+        expected = [engine_basic.anonymize(text, AnonymizationMode.REDACT) for text in texts]
+        assert [r.anonymized_text for r in results] == [r.anonymized_text for r in expected]
+        assert all(r.original_text == text for r, text in zip(results, texts))
+
+        in_process = engine_basic.anonymize_batch(texts, AnonymizationMode.REDACT, max_workers=1)
+        assert [r.anonymized_text for r in in_process] == [r.anonymized_text for r in expected]
+
+    def test_detection_cache(self, monkeypatch):
+        """Test that cached detections are reused across modes and batches"""
+        engine = AnonymaEngine(use_flair=False, cache_detections=True)
+        calls = []
+
+        class CountingDetector:
+            def detect(self, text, language='it'):
+                calls.append(text)
+                return [{'entity_type': 'PERSON', 'start': 0, 'end': 5, 'confidence': 0.9, 'text': text[:5]}]
+
+        monkeypatch.setattr(engine, "detector", CountingDetector())
+
+        engine.anonymize("Mario Rossi", AnonymizationMode.REDACT)
+        engine.anonymize("Mario Rossi", AnonymizationMode.SUBSTITUTE)
+        assert engine.detect_batch(["Mario Rossi", "Luigi Verdi"])[0][0]['text'] == "Mario"
+        assert calls == ["Mario Rossi", "Luigi Verdi"]
+
+        engine.anonymize("Mario Rossi", AnonymizationMode.REDACT, language='en')
+        assert len(calls) == 3
+
+    def test_anonymize_batch_custom_detector(self, sample_text_italian):
+        """Test that a replaced detector is used for batches that could be pooled"""
+        engine = AnonymaEngine(use_flair=False)
+
+        class FirstWordDetector:
+            def detect(self, text, language='it'):
+                end = text.index(" ")
+                return [{'entity_type': 'WORD', 'start': 0, 'end': end, 'confidence': 0.9, 'text': text[:end]}]
+
+        engine.detector = FirstWordDetector()
+        texts = [sample_text_italian, "Luigi Verdi abita a Roma"] * 4
+
+        pooled = engine.anonymize_batch(texts, AnonymizationMode.REDACT, max_workers=2)
+
+        expected = [engine.anonymize(text, AnonymizationMode.REDACT) for text in texts]
+        assert [r.anonymized_text for r in pooled] == [r.anonymized_text for r in expected]
+
+    def test_anonymize_batch_custom_redaction_char(self, sample_text_italian):
+        """Test that pool workers use the engine's redaction character"""
+        engine = AnonymaEngine(use_flair=False)
+        engine.redactor.redaction_char = "*"
+        texts = [sample_text_italian] * 8
+
+        pooled = engine.anonymize_batch(texts, AnonymizationMode.REDACT, max_workers=2)
+
+        expected = engine.anonymize(sample_text_italian, AnonymizationMode.REDACT)
+        assert "*" in expected.anonymized_text
+        assert [r.anonymized_text for r in pooled] == [expected.anonymized_text] * 8
+
     def test_very_long_text(self, engine_basic):
         """Test processing of very long text"""
         long_text = "This is a test. " * 1000  # ~16K chars
@@ -177,3 +324,34 @@ class TestAnonymaEngineConsistency:
         if result_redact.anonymized_text != sample_text_italian:
             # PII was detected, so outputs should differ
             assert len(set(texts)) > 1
+
+
+class TestAnonymizationResult:
+    """Test AnonymizationResult"""
+
+    def test_to_dict(self):
+        """Test that to_dict leaves out the original text and stays current"""
+        result = AnonymizationResult(
+            anonymized_text="[REDACTED]",
+            original_text="Mario Rossi",
+            mode=AnonymizationMode.SUBSTITUTE,
+            mapping={"PERSON_0": "Mario Rossi"},
+            reverse_key="key",
+            detections_count=1
+        )
+
+        data = result.to_dict()
+
+        assert data == {
+            "anonymized_text": "[REDACTED]",
+            "mode": "substitute",
+            "mapping": {"PERSON_0": "Mario Rossi"},
+            "reverse_key": "key",
+            "detections_count": 1
+        }
+        data["mode"] = "changed"
+        assert result.to_dict()["mode"] == "substitute"
+
+        result.detections_count = 2
+        assert result.to_dict()["detections_count"] == 2
+        assert not hasattr(result, "__dict__")
@@ -58,6 +58,32 @@ class TestRedactor:
         assert "+39 339 1234567" not in result
         assert "█" in result
 
+    def test_redact_long_span_and_custom_char(self):
+        """Test spans longer than the precomputed runs and a changed character"""
+        text = "x" * 300
+        detections = [
+            {'entity_type': 'NOTE', 'start': 0, 'end': 200, 'confidence': 0.9, 'text': text[:200]},
+            {'entity_type': 'NOTE', 'start': 250, 'end': 255, 'confidence': 0.9, 'text': text[250:255]}
+        ]
+
+        redactor = Redactor()
+        assert redactor.anonymize(text, detections) == "█" * 200 + "x" * 50 + "█" * 5 + "x" * 45
+
+        redactor.redaction_char = "*"
+        assert redactor.anonymize(text, detections[1:]) == "x" * 250 + "*" * 5 + "x" * 45
+
+    def test_redact_many(self):
+        """Test redacting several texts with their own detections"""
+        texts = ["Email: a@b.it", "Nessun dato"]
+        detections_list = [
+            [{'entity_type': 'EMAIL', 'start': 7, 'end': 13, 'confidence': 0.9, 'text': 'a@b.it'}],
+            []
+        ]
+
+        redactor = Redactor()
+
+        assert redactor.anonymize_many(texts, detections_list) == ["Email: ██████", "Nessun dato"]
+
     def test_redact_empty_detections(self):
         """Test redaction with no detections"""
         text = "This is a normal text"
@@ -83,10 +109,79 @@ class TestRedactor:
         # Should handle overlaps gracefully
         assert isinstance(result, str)
 
+    def test_redact_partially_overlapping_detections(self):
+        """Test that partially overlapping detections are both fully redacted"""
+        text = "Call Mario Rossi now"
+        detections = [
+            {'entity_type': 'PERSON', 'start': 11, 'end': 16, 'confidence': 0.8, 'text': 'Rossi'},
+            {'entity_type': 'PERSON', 'start': 5, 'end': 13, 'confidence': 0.9, 'text': 'Mario Ro'},
+        ]
+
+        redactor = Redactor()
+        result = redactor.anonymize(text, detections)
+
+        assert result == "Call " + "█" * 11 + " now"
+
+    def test_merge_spans_adjacent(self):
+        """Test that touching spans are fused only when asked"""
+        from anonyma_core.modes.base import merge_spans
+
+        spans = [(6, 10, "b"), (0, 4, "a"), (4, 6, "c"), (2, 3, "d")]
+
+        assert merge_spans(spans) == [(0, 4, "a"), (4, 6, "c"), (6, 10, "b")]
+        assert merge_spans(spans, adjacent=True) == [(0, 10, "a")]
+
+    def test_merge_intervals(self):
+        """Test that detection spans merge into parallel start/end lists"""
+        from anonyma_core.modes.base import merge_intervals
+
+        detections = [{'start': 6, 'end': 10}, {'start': 0, 'end': 4}, {'start': 4, 'end': 6}, {'start': 2, 'end': 3}]
+
+        assert merge_intervals(detections) == ([0, 4, 6], [4, 6, 10])
+        assert merge_intervals(detections, adjacent=True) == ([0], [10])
+        assert merge_intervals([]) == ([], [])
+
 
 class TestSubstitutor:
     """Test Substitutor mode"""
 
+    def test_substitutors_share_faker(self):
+        """Test that Faker locales are loaded once per process"""
+        first = Substitutor()
+        second = Substitutor()
+
+        assert second.faker_it is first.faker_it
+        assert second.faker_en is first.faker_en
+
+    def test_substitutor_fast_mode(self):
+        """Test that fast mode draws names from the pre-generated pool"""
+        from anonyma_core.modes.substitutor import FAST_POOL_SIZE, _fake_pool
+
+        substitutor = Substitutor(fast_mode=True)
+        text = "Nome: Mario Rossi"
+        detections = [
+            {'entity_type': 'PERSON', 'start': 6, 'end': 17, 'confidence': 0.9, 'text': 'Mario Rossi'}
+        ]
+
+        result, mapping, reverse_key = substitutor.anonymize(text, detections)
+
+        pool = _fake_pool('it_IT', 'name')
+        assert len(pool) == FAST_POOL_SIZE
+        assert result[len("Nome: "):] in pool
+        assert mapping == {"PERSON_0": "Mario Rossi"}
+
+    def test_substitutor_loads_locales_lazily(self):
+        """Test that only the Faker locale a substitution uses is resolved"""
+        substitutor = Substitutor()
+        assert "faker_it" not in vars(substitutor)
+
+        substitutor.anonymize("Mario Rossi", [
+            {'entity_type': 'PERSON', 'start': 0, 'end': 11, 'confidence': 0.9, 'text': 'Mario Rossi'}
+        ])
+
+        assert "faker_it" in vars(substitutor)
+        assert "faker_en" not in vars(substitutor)
+
     def test_substitutor_init(self):
         """Test Substitutor initialization"""
         substitutor = Substitutor()
@@ -137,6 +232,21 @@ class TestSubstitutor:
         assert len(reverse_key) > 0
         assert isinstance(reverse_key, str)
 
+    def test_substitute_overlapping_detections_mapping(self):
+        """Test that detections merged into one span get one mapping entry"""
+        text = "Nome: Mario Rossi, Roma"
+        detections = [
+            {'entity_type': 'PERSON', 'start': 6, 'end': 17, 'confidence': 0.9, 'text': 'Mario Rossi'},
+            {'entity_type': 'PERSON', 'start': 12, 'end': 17, 'confidence': 0.8, 'text': 'Rossi'},
+            {'entity_type': 'LOCATION', 'start': 19, 'end': 23, 'confidence': 0.9, 'text': 'Roma'}
+        ]
+
+        substitutor = Substitutor()
+        result, mapping, reverse_key = substitutor.anonymize(text, detections)
+
+        assert mapping == {"LOCATION_0": "Roma", "PERSON_1": "Mario Rossi"}
+        assert "Rossi" not in result
+
     def test_substitute_empty_detections(self):
         """Test substitution with no detections"""
         text = "This is a normal text"
@@ -178,6 +288,15 @@ class TestSubstitutor:
         # Should have a replacement
         assert len(result) > 4
 
+    def test_fake_codice_fiscale_format(self):
+        """Test that fake Codice Fiscale values follow the CF layout"""
+        import re
+
+        substitutor = Substitutor()
+
+        for _ in range(20):
+            assert re.fullmatch(r"[A-Z]{6}\d{2}[A-Z]\d{2}[A-Z]\d{3}[A-Z]", substitutor._generate_fake_cf())
+
 
 class TestVisualRedactor:
     """Test VisualRedactor mode"""
@@ -241,6 +360,19 @@ class TestVisualRedactor:
         assert "+39 339 1234567" not in result
         assert result.count("█") > 5  # Multiple heavy redactions
 
+    def test_visual_redact_overlapping_detections(self):
+        """Test that overlapping detections become one visual redaction"""
+        text = "Email: test@example.com, ok"
+        detections = [
+            {'entity_type': 'EMAIL', 'start': 7, 'end': 23, 'confidence': 0.9, 'text': 'test@example.com'},
+            {'entity_type': 'DOMAIN', 'start': 12, 'end': 23, 'confidence': 0.8, 'text': 'example.com'}
+        ]
+
+        visual_redactor = VisualRedactor()
+        result = visual_redactor.anonymize(text, detections)
+
+        assert result == "Email: " + visual_redactor.redaction_symbol + ", ok"
+
 
 class TestModesComparison:
     """Test comparison between different modes"""